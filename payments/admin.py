@@ -1,5 +1,6 @@
 import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
 from django.conf import settings
@@ -12,7 +13,7 @@ from django.contrib.auth.models import User, Group
 from django.contrib.messages.api import add_message
 from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
-from django.db import transaction
+from django.db import transaction, connection
 from django.db.models.query import QuerySet
 from django.http import HttpResponseNotAllowed
 from django.shortcuts import render, redirect
@@ -40,6 +41,7 @@ from payments.models import Coin, Deposit, AddressAccountMap, CoinPair, Conversi
     +===================================================+
 """
 from payments.coin_handlers import reload_handlers, has_manager, get_manager
+from payments.coin_handlers.base import known_coin_types
 
 log = logging.getLogger(__name__)
 
@@ -286,9 +288,15 @@ class CoinHealthView(TemplateView):
     Loads the coin handler manager for each coin, and uses the health() function to grab status info for the coin.
 
     Uses caching API to avoid constant RPC queries, and displays results as a standard admin view.
+
+    Coin health checks are ran concurrently in a thread pool (up to :py:attr:`.health_workers` at once), so the page
+    load time is roughly that of the slowest coin, rather than the sum of every coin's RPC round trips.
     """
     template_name = 'admin/coin_health.html'
 
+    health_workers = 10
+    """Maximum amount of coin health checks to run at the same time"""
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.coin_fails = []
@@ -297,27 +305,44 @@ class CoinHealthView(TemplateView):
         """View function to be called from template, for getting list of coin handler errors"""
         return self.coin_fails
 
+    @staticmethod
+    def coin_health(symbol: str) -> tuple:
+        """
+        Load health data for a coin from cache. If it's not found, query the manager and cache it for up to
+        30 seconds to avoid constant RPC hits.
+
+        Ran inside of a worker thread by :py:meth:`.handler_dic`, so the thread's DB connection is closed afterwards.
+        """
+        try:
+            return cache.get_or_set(symbol + '_health', lambda: get_manager(symbol).health(), 30)
+        finally:
+            connection.close()
+
     def handler_dic(self):
         """View function to be called from template. Loads and queries coin handlers for health, with caching."""
         hdic = {}  # A dictionary of {handler_name: {headings:list, results:list[tuple/list]}
         reload_handlers()
+        coins = []
         for coin in Coin.objects.all():
-            try:
-                if not has_manager(coin.symbol):
-                    self.coin_fails.append('Cannot check {} (no manager registered in coin handlers)'.format(coin))
-                    continue
-                # Try to load coin health data from cache.
-                # If it's not found, query the manager and cache it for up to 30 seconds to avoid constant RPC hits.
-                c_health = coin.symbol + '_health'
-                mname, mhead, mres = cache.get_or_set(c_health, get_manager(coin.symbol).health(), 30)
-                # Create the dict keys for the manager name if needed, then add the health results
-                d = hdic[mname] = dict(headings=list(mhead), results=[]) if mname not in hdic else hdic[mname]
-                d['results'].append(list(mres))
-            except:
-                log.exception('Something went wrong loading health data for coin %s', coin)
-                self.coin_fails.append(
-                    'Failed checking {} (something went wrong loading health data, check server logs)'.format(coin)
-                )
+            if not has_manager(coin.symbol):
+                self.coin_fails.append('Cannot check {} (no manager registered in coin handlers)'.format(coin))
+                continue
+            coins.append(coin)
+
+        with ThreadPoolExecutor(max_workers=self.health_workers) as pool:
+            # Submit every health check up-front, then collect the results in the original coin order.
+            futures = [(coin, pool.submit(self.coin_health, coin.symbol)) for coin in coins]
+            for coin, fut in futures:
+                try:
+                    mname, mhead, mres = fut.result()
+                    # Create the dict keys for the manager name if needed, then add the health results
+                    d = hdic[mname] = dict(headings=list(mhead), results=[]) if mname not in hdic else hdic[mname]
+                    d['results'].append(list(mres))
+                except:
+                    log.exception('Something went wrong loading health data for coin %s', coin)
+                    self.coin_fails.append(
+                        'Failed checking {} (something went wrong loading health data, check server logs)'.format(coin)
+                    )
         return hdic
 
     def get(self, request, *args, **kwargs):
@@ -386,13 +411,13 @@ class AddCoinPairView(TemplateView):
         if empty(one['symbol']):
             messages.add_message(request, messages.ERROR, 'Unique symbol not specified for Coin One.')
             return redirect('admin:easy_add_pair')
-        if empty(one['coin_type']) or one['coin_type'] not in dict(settings.COIN_TYPES):
+        if empty(one['coin_type']) or one['coin_type'] not in known_coin_types():
             messages.add_message(request, messages.ERROR, 'Invalid coin type for Coin Two.')
             return redirect('admin:easy_add_pair')
         if empty(two['symbol']):
             messages.add_message(request, messages.ERROR, 'Unique symbol not specified for Coin Two.')
             return redirect('admin:easy_add_pair')
-        if empty(two['coin_type']) or two['coin_type'] not in dict(settings.COIN_TYPES):
+        if empty(two['coin_type']) or two['coin_type'] not in known_coin_types():
             messages.add_message(request, messages.ERROR, 'Invalid coin type for Coin Two.')
             return redirect('admin:easy_add_pair')
 
@@ -4,7 +4,8 @@ from typing import Dict, Any
 
 from privex.helpers import empty
 
-from payments.coin_handlers.EOS.EOSManager import EOSManager
+from payments.coin_handlers.EOS.EOSManager import EOSManager, ZERO
+from payments.coin_handlers.EOS.EOSMixin import quantity_amount
 from payments.models import Deposit
 
 log = logging.getLogger(__name__)
@@ -62,7 +63,7 @@ class AppicsManager(EOSManager):
         amount = self.validate_amount(amount=amount)
 
         # Grab the coin's symbol and find it's contract account
-        sym, contract = self.symbol, self.get_contract(self.symbol)
+        sym, contract = self.symbol, self._contract
         log.debug(f'Contact for {sym} is {contract}')
 
         # Craft the transaction arguments for the transfer operation, then broadcast it and get the result
@@ -73,13 +74,13 @@ class AppicsManager(EOSManager):
 
         # Some of the important data, e.g. how much was actually sent, is buried in the processed>action_traces
         tx_output = tfr['processed']['action_traces'][0]['act']['data']
-        tx_amt_final = Decimal(tx_output['quantity'].split()[0])
+        tx_amt_final = quantity_amount(tx_output['quantity'])
 
         return {
             'txid': tfr['transaction_id'],
             'coin': self.orig_symbol,
             'amount': tx_amt_final,
-            'fee': Decimal(0),
+            'fee': ZERO,
             'from': from_address,
             'send_type': 'send'
         }
@@ -88,3 +89,7 @@ class AppicsManager(EOSManager):
         return self.send(
             amount=amount, address=address, memo=memo, trigger_data=trigger_data
         )
+
+    def send_or_issue(self, amount, address, memo=None, trigger_data=None) -> dict:
+        # APX "sends" are mints, which don't depend on our balance, so there's never a need to issue first
+        return self.send(amount=amount, address=address, memo=memo, trigger_data=trigger_data)
@@ -42,9 +42,8 @@ import logging
 
 from payments.coin_handlers.Appics.AppicsLoader import AppicsLoader
 from payments.coin_handlers.Appics.AppicsManager import AppicsManager
-from django.conf import settings
 
-from payments.models import Coin
+from payments.coin_handlers.base import LazyProvides, register_coin_type
 
 log = logging.getLogger(__name__)
 
@@ -65,13 +64,12 @@ def reload():
     global loaded
     loaded = True
 
-    log.debug(f'Checking if {coin_type} is in COIN_TYPES')
-    if coin_type not in dict(settings.COIN_TYPES):
-        log.debug(f'{coin_type} not in COIN_TYPES, adding it.')
-        settings.COIN_TYPES += ((coin_type, 'Appics (APX)',),)
+    # Add the Appics coin type to the admin drop down (if it isn't already)
+    register_coin_type(coin_type, 'Appics (APX)')
 
-    # Grab a simple list of coin symbols with the type 'bitcoind' to populate the provides lists.
-    provides = Coin.objects.filter(coin_type=coin_type).values_list('symbol', flat=True)
+    # Symbols are only loaded when first read, see :class:`.LazyProvides`. Appics has always provided for disabled
+    # coins too, so unlike the other handlers it doesn't filter by ``enabled``.
+    provides = LazyProvides(coin_type, enabled_only=False)
     AppicsLoader.provides = provides
     AppicsManager.provides = provides
 
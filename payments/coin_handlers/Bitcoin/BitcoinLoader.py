@@ -15,23 +15,32 @@
         +===================================================+
 """
 import logging
+import time
+import ijson
 import pytz
 from datetime import datetime
 from decimal import Decimal, getcontext, ROUND_DOWN
-from typing import Generator, Iterable, List, Dict
+from typing import Generator, Iterable, List, Dict, Callable, Optional
 from requests.exceptions import ConnectionError
 from django.utils import timezone
 from privex.jsonrpc import BitcoinRPC
-from urllib3.exceptions import NewConnectionError
-from payments.coin_handlers.Bitcoin.BitcoinMixin import BitcoinMixin
+from urllib3.exceptions import NewConnectionError, HTTPError as URLLibHTTPError
+from payments.coin_handlers.Bitcoin.BitcoinMixin import BitcoinMixin, StreamBitcoinRPC
 from payments.coin_handlers.base.BatchLoader import BatchLoader
 from payments.coin_handlers.base.decorators import retry_on_err
 from payments.coin_handlers.base.exceptions import DeadAPIError
+from payments.models import Coin
 from steemengine.helpers import empty
 
 
 log = logging.getLogger(__name__)
 
+STREAM_ERRORS = (URLLibHTTPError, OSError, ijson.JSONError)
+"""
+Exceptions which may be raised while reading a streamed ``listtransactions`` response body, after the request itself
+succeeded - e.g. the connection being reset, a read timeout, or the body being cut off mid-JSON.
+"""
+
 
 class BitcoinLoader(BatchLoader, BitcoinMixin):
     """
@@ -61,7 +70,7 @@ class BitcoinLoader(BatchLoader, BitcoinMixin):
     provides: List[str] = []
     """Dynamically populated by Bitcoin.__init__"""
 
-    rpcs: Dict[str, BitcoinRPC] = {}
+    rpcs: Dict[str, StreamBitcoinRPC] = {}
     """
     For each coin connection specified in `settings.COIND_RPC`, we map it's symbol to an instantiated instance
     of BitcoinRPC - stored as a static property, ensuring we don't have to constantly re-create them.
@@ -71,6 +80,8 @@ class BitcoinLoader(BatchLoader, BitcoinMixin):
         super(BitcoinLoader, self).__init__(symbols=symbols)
         self.tx_count = 1000
         self.loaded = False
+        # Amount of raw TXs read from the daemon for the current batch, counted while streaming
+        self._batch_loaded = 0
         # Get all RPC objects
         self.rpcs = self._get_rpcs()
 
@@ -79,10 +90,67 @@ class BitcoinLoader(BatchLoader, BitcoinMixin):
         """To ensure we always get fresh settings from the DB after a reload, self.settings gets _prep_settings()"""
         return self._prep_settings()
 
+    def _list_txs(self, coin: Coin, batch=100) -> Generator[dict, None, None]:
+        """
+        Overrides :py:meth:`.BatchLoader._list_txs` so that each batch is streamed straight from the daemon's
+        response into :meth:`.clean_txs`, instead of first being buffered into a list.
+
+        :param models.Coin   coin:    The coin to list TXs for - as an individual coin object from the database
+        :param         int  batch:    The amount of transactions to load per iteration
+        """
+        finished = False
+        offset = txs_loaded = 0
+        while not finished:
+            self._batch_loaded = 0
+            transactions = self._stream_batch(symbol=coin.symbol_id, limit=batch, offset=offset)
+            yield from self.clean_txs(symbol=coin.symbol_id, transactions=transactions)
+            txs_loaded += self._batch_loaded
+            # If there are less TXs than the batch size, we've hit the end of the results (or the TX limit)
+            if self._batch_loaded < batch or txs_loaded >= self.tx_count:
+                finished = True
+            offset += batch
+
+    def _stream_batch(self, symbol: str, limit: int, offset: int,
+                      max_retries=3, delay=3) -> Generator[dict, None, None]:
+        """
+        Yields the raw TXs of one batch from :meth:`.load_batch`, counting them into ``self._batch_loaded``.
+
+        :meth:`.load_batch` only retries sending the request - the response body is read lazily while we iterate
+        over it. If reading the body fails part way through (see :py:attr:`.STREAM_ERRORS`), only the TXs we haven't
+        read yet are requested again, up to ``max_retries`` times, so TXs which were already yielded aren't repeated.
+
+        ``listtransactions`` returns the newest TXs after ``skip`` in oldest-first order, so after reading ``n`` TXs,
+        the remainder of the batch is simply ``count=limit - n, skip=offset``.
+        """
+        attempt = 0
+        while True:
+            self.load_batch(symbol=symbol, limit=limit - self._batch_loaded, offset=offset)
+            try:
+                for tx in self.transactions:
+                    self._batch_loaded += 1
+                    yield tx
+                return
+            except STREAM_ERRORS as e:
+                if self._batch_loaded >= limit:   # every TX was read, only the end of the body was broken
+                    return
+                attempt += 1
+                if attempt > max_retries:
+                    log.error('Giving up reading %s transactions after %d attempts', symbol, attempt)
+                    raise
+                log.warning('Error reading %s transactions (read %d of %d, offset %d), retrying the rest in %ds: %s %s',
+                            symbol, self._batch_loaded, limit, offset, delay, type(e), str(e))
+                time.sleep(delay)
+            finally:
+                del self.transactions
+
     @retry_on_err(fail_on=[DeadAPIError])
     def load_batch(self, symbol, limit=100, offset=0, account=None):
         """
-        Loads a batch of transactions for `symbol` in their original format into `self.transactions`
+        Prepares a batch of transactions for `symbol` in their original format as `self.transactions`
+
+        ``self.transactions`` will be a generator, which stream-parses each TX from the daemon's response as it's
+        iterated over. Only sending the request is retried here - errors while reading the body are raised during
+        iteration instead, and are retried by :meth:`._stream_batch`.
 
         :param str symbol: The coin symbol to load TXs for
         :param int limit:  The amount of transactions to load
@@ -93,7 +161,7 @@ class BitcoinLoader(BatchLoader, BitcoinMixin):
         log.debug('Loading batch of %d transactions for %s', int(limit), symbol)
         rpc = self.rpcs[symbol]
         try:
-            self.transactions = rpc.listtransactions(count=int(limit), skip=int(offset))
+            self.transactions = rpc.stream_listtransactions(count=int(limit), skip=int(offset))
         except (ConnectionRefusedError, ConnectionError, NewConnectionError) as e:
             raise DeadAPIError("{} daemon is not responding! Original exception: {} {}".format(symbol, type(e), str(e)))
 
@@ -122,47 +190,66 @@ class BitcoinLoader(BatchLoader, BitcoinMixin):
 
         log.debug('Filtering transactions for %s', symbol)
 
+        cleaner = self._make_cleaner(symbol, account)
         for tx in transactions:
-            t = self._clean_tx(tx, symbol, account)
+            t = cleaner(tx)
             if t is None:
                 continue
             yield t
 
     def _clean_tx(self, tx, symbol, address):
         """Filters an individual transaction. See :meth:`.clean_txs` for info"""
+        return self._make_cleaner(symbol, address)(tx)
+
+    def _make_cleaner(self, symbol: str, address: str = None) -> Callable[[dict], Optional[dict]]:
+        """
+        Returns a function which filters/cleans an individual transaction for ``symbol``, returning ``None`` if the
+        TX should be skipped. See :meth:`.clean_txs` for info.
+
+        The coin settings, symbol and address filter are constant for an entire batch, so they're looked up once here
+        and bound as closure variables, rather than re-reading ``self.settings`` for every single transaction.
 
+        :param symbol:   Symbol of coin being cleaned
+        :param address:  If not empty, the returned function only accepts TXs sent to this address.
+        :return callable cleaner: ``cleaner(tx: dict) -> Optional[dict]``
+        """
         need_confs = self.settings[symbol]['confirms_needed']
         use_trusted = self.settings[symbol]['use_trusted']
-
-        txid = tx.get('txid', None)
-        category = tx.get('category', 'UNKNOWN')
-        trust = tx.get('trusted', False)
-        amt = tx['amount']
-        # To avoid issues with floats, we convert the amount to a string with 8DP
-        if type(amt) == float:
-            amt = '{0:.8f}'.format(amt)
-
-        log.debug('Filtering/cleaning transaction, Cat: %s, Amt: %s, TXID: %s', category, amt, txid)
-
-        if category != 'receive': return None                                       # Ignore non-receive transactions
-        if 'generated' in tx and tx['generated'] in [True, 'true', 1]: return None  # Ignore mining transactions
-        # Filter by receiving address if needed
-        if not empty(address) and tx['address'] != address: return None
-        # If a TX has less confirmations than needed, check if we can trust unconfirmed TXs.
-        # If not, we can't accept this TX.
-        if int(tx['confirmations']) < need_confs:
-            if not use_trusted or trust not in [True, 'true', 1]:
-                log.debug('Got %s transaction %s, but only has %d confs, needs %d', symbol, txid,
-                          tx['confirmations'], need_confs)
-                return None
-        d = datetime.utcfromtimestamp(tx['time'])
-        d = timezone.make_aware(d, pytz.UTC)
-
-        return dict(
-            txid=txid,
-            coin=self.coins[symbol].symbol,
-            vout=int(tx['vout']),
-            tx_timestamp=d,
-            address=tx['address'],
-            amount=Decimal(amt)
-        )
+        coin_symbol = self.coins[symbol].symbol
+        address = None if empty(address) else address
+
+        def cleaner(tx: dict) -> Optional[dict]:
+            txid = tx.get('txid', None)
+            category = tx.get('category', 'UNKNOWN')
+            trust = tx.get('trusted', False)
+            amt = tx['amount']
+            # To avoid issues with floats, we convert the amount to a string with 8DP
+            if type(amt) == float:
+                amt = '{0:.8f}'.format(amt)
+
+            log.debug('Filtering/cleaning transaction, Cat: %s, Amt: %s, TXID: %s', category, amt, txid)
+
+            if category != 'receive': return None                                       # Ignore non-receive TXs
+            if 'generated' in tx and tx['generated'] in [True, 'true', 1]: return None  # Ignore mining TXs
+            # Filter by receiving address if needed
+            if address is not None and tx['address'] != address: return None
+            # If a TX has less confirmations than needed, check if we can trust unconfirmed TXs.
+            # If not, we can't accept this TX.
+            if int(tx['confirmations']) < need_confs:
+                if not use_trusted or trust not in [True, 'true', 1]:
+                    log.debug('Got %s transaction %s, but only has %d confs, needs %d', symbol, txid,
+                              tx['confirmations'], need_confs)
+                    return None
+            d = datetime.utcfromtimestamp(tx['time'])
+            d = timezone.make_aware(d, pytz.UTC)
+
+            return dict(
+                txid=txid,
+                coin=coin_symbol,
+                vout=int(tx['vout']),
+                tx_timestamp=d,
+                address=tx['address'],
+                amount=Decimal(amt)
+            )
+
+        return cleaner
@@ -16,12 +16,16 @@
 
 """
 import logging
-from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import List, Dict, Tuple, Optional
 
 from decimal import Decimal, getcontext, ROUND_DOWN
-from privex.jsonrpc import BitcoinRPC
+from django.core.cache import cache
+from privex.jsonrpc import RPCException
+from requests.exceptions import RequestException
 
-from payments.coin_handlers.Bitcoin.BitcoinMixin import BitcoinMixin
+from payments.coin_handlers.Bitcoin.BitcoinMixin import BitcoinMixin, StreamBitcoinRPC
 from payments.coin_handlers.base import exceptions
 from payments.coin_handlers.base import BaseManager
 
@@ -29,6 +33,13 @@ getcontext().rounding = ROUND_DOWN
 
 log = logging.getLogger(__name__)
 
+RPC_ERRORS = (RPCException, RequestException, KeyError, TypeError, ValueError)
+"""
+Exceptions which may be raised while talking to a coin daemon, or reading it's response. ``RequestException`` covers
+both connection failures and the non-200 responses that bitcoind returns for RPC errors, while ``ValueError``
+also covers ``json.JSONDecodeError`` from a malformed response body.
+"""
+
 
 class BitcoinManager(BaseManager, BitcoinMixin):
     """
@@ -59,12 +70,27 @@ class BitcoinManager(BaseManager, BitcoinMixin):
     provides: List[str] = []
     """Dynamically populated by Bitcoin.__init__"""
 
-    rpcs: Dict[str, BitcoinRPC] = {}
+    rpcs: Dict[str, StreamBitcoinRPC] = {}
     """
     For each coin connection specified in `settings.COIND_RPC`, we map it's symbol to an instantiated instance
     of BitcoinRPC - stored as a static property, ensuring we don't have to constantly re-create them.
     """
 
+    balance_cache_time = 30
+    """Amount of seconds to cache :py:meth:`.balance` results for"""
+    valid_cache_time = 3600
+    """Amount of seconds to cache the daemon's :py:meth:`.address_valid` answer for an address"""
+    health_cache_time = 10
+    """Amount of seconds to cache :py:meth:`.health` results for"""
+
+    rpc_workers = 8
+    """
+    Maximum amount of RPC requests that :py:meth:`.rpc_batch` will run in parallel. Set to 1 to send them one after
+    the other. Should not exceed :py:attr:`.BitcoinMixin.session_pool_size`
+    """
+    _executor = None  # type: Optional[ThreadPoolExecutor]
+    _executor_lock = Lock()
+
     def health(self) -> Tuple[str, tuple, tuple]:
         """
         Return health data for the passed symbol.
@@ -72,8 +98,16 @@ class BitcoinManager(BaseManager, BitcoinMixin):
         Health data will include: Symbol, Status, Current Block, Node Version, Wallet Balance,
         and number of p2p connections (all as strings)
 
+        Results are cached for :py:attr:`.health_cache_time` seconds. When a shared cache backend such as Redis is
+        configured (see ``CACHE_BACKEND`` in :py:mod:`steemengine.settings.core`), the cache is shared between
+        all application workers.
+
         :return tuple health_data: (manager_name:str, headings:list/tuple, health_data:list/tuple,)
         """
+        return cache.get_or_set(f'btc:health:{self.symbol}', self._health, self.health_cache_time)
+
+    def _health(self) -> Tuple[str, tuple, tuple]:
+        """Queries the coin daemon for uncached health data. See :py:meth:`.health`"""
         headers = ('Symbol', 'Status', 'Current Block', 'Version',
                    'Wallet Balance', 'P2P Connections',)
         class_name = type(self).__name__
@@ -81,16 +115,15 @@ class BitcoinManager(BaseManager, BitcoinMixin):
         current_block = version = balance = connections = ''
         # If the coin is based on a newer protocol, e.g. bitcoin core + litecoin, use the new methods
         try:
-            b = self.rpc.getblockchaininfo()
+            b, n, bal = self.rpc_batch([('getblockchaininfo', []), ('getnetworkinfo', []), ('getbalance', [])])
             current_block = '{:,}'.format(b['blocks'])
             if 'headers' in b:
                 current_block += ' (Headers: {:,})'.format(b['headers'])
-            n = self.rpc.getnetworkinfo()
             version = '{} ({})'.format(n['version'], n['subversion'])
             connections = str(n['connections'])
-            balance = '{0:,.8f}'.format(self.rpc.getbalance())
+            balance = '{0:,.8f}'.format(bal)
             status = 'Online'
-        except:
+        except RPC_ERRORS:
             # If we get an error, try using the old method
             try:
                 b = self.rpc.getinfo()
@@ -99,7 +132,7 @@ class BitcoinManager(BaseManager, BitcoinMixin):
                 balance = '{0:,.8f}'.format(b['balance'])
                 connections = str(b['connections'])
                 status = 'Online'
-            except:
+            except RPC_ERRORS:
                 log.exception('Exception during %s health check for symbol %s', class_name, self.symbol)
                 # If this also errors, it's definitely offline
                 status = 'Offline'
@@ -117,7 +150,7 @@ class BitcoinManager(BaseManager, BitcoinMixin):
         # Get all RPCs
         self.rpcs = self._get_rpcs()
         # Manager's only deal with one coin, so unwrap the generated dicts
-        self.rpc = self.rpcs[self.coin.symbol_id]   # type: BitcoinRPC
+        self.rpc = self.rpcs[self.coin.symbol_id]   # type: StreamBitcoinRPC
 
     def health_test(self) -> bool:
         """
@@ -130,7 +163,7 @@ class BitcoinManager(BaseManager, BitcoinMixin):
             if 'Online' in health_data[1]:
                 return True
             return False
-        except:
+        except RPC_ERRORS:
             return False
 
     @property
@@ -147,26 +180,92 @@ class BitcoinManager(BaseManager, BitcoinMixin):
         """
         Get the total amount received by an address, or the balance of the wallet if address not specified.
 
+        Balances are cached for :py:attr:`.balance_cache_time` seconds, and the cache for this symbol is
+        invalidated after each successful :py:meth:`.send`
+
         :param address:    Crypto address to get balance for, if None, returns whole wallet balance
         :param memo:       NOT USED BY THIS MANAGER
         :param memo_case:  NOT USED BY THIS MANAGER
         :return: Decimal(balance)
         """
+        confs = self.setting['confirms_needed']
+        key = f'btc:bal:{self.symbol}:{self._balance_generation}:{address}:{confs}'
 
-        return self.rpc.getreceivedbyaddress(address=address, confirmations=self.setting['confirms_needed'])
+        return cache.get_or_set(
+            key, lambda: self.rpc.getreceivedbyaddress(address=address, confirmations=confs), self.balance_cache_time
+        )
+
+    @property
+    def _balance_generation(self) -> int:
+        """
+        Cached balances are keyed by a per-symbol "generation" number. Bumping the generation (see
+        :py:meth:`._clear_balance_cache`) invalidates every cached balance for the symbol, regardless of cache backend.
+        """
+        return cache.get_or_set(f'btc:balgen:{self.symbol}', 0, None)
+
+    def _clear_balance_cache(self):
+        """Invalidate all cached :py:meth:`.balance` results for this symbol"""
+        key = f'btc:balgen:{self.symbol}'
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
 
     def address_valid(self, address) -> bool:
-        """If `address` is determined to be valid by the coind RPC, will return True. Otherwise False."""
+        """
+        If `address` is determined to be valid by the coind RPC, will return True. Otherwise False.
+
+        The daemon's answer is cached for :py:attr:`.valid_cache_time` seconds. RPC errors are not cached.
+        """
 
         try:
-            v = self.rpc.validateaddress(address)
-            if v['isvalid'] in [True, 'true', 1]:
-                return True
-            return False
-        except:
+            key = f'btc:valid:{self.symbol}:{address}'
+            return cache.get_or_set(key, lambda: self._address_valid(address), self.valid_cache_time)
+        except RPC_ERRORS:
             log.exception('Something went wrong while running %s.address_valid. Returning NOT VALID.', type(self))
             return False
 
+    def _address_valid(self, address) -> bool:
+        """Ask the coin daemon whether `address` is valid (uncached). May raise RPC / connection exceptions."""
+        v = self.rpc.validateaddress(address)
+        return v['isvalid'] in [True, 'true', 1]
+
+    def rpc_batch(self, calls: List[Tuple[str, list]]) -> list:
+        """
+        Run multiple RPC calls against this coin's daemon using JSONRPC batch requests, splitting ``calls`` into
+        chunks of the ``batch_size`` coin setting (default 500) to keep each request body reasonably small.
+
+        When there's more than one chunk, up to :py:attr:`.rpc_workers` of them are sent in parallel, as the daemon
+        handles each request on a separate RPC thread.
+
+            >>> m = BitcoinManager('LTC')
+            >>> txs = m.rpc_batch([('gettransaction', [txid]) for txid in txids])
+
+        :param list calls:     A list of ``(method, params)`` tuples
+        :raises RPCException:  Raised if any of the calls returned an error
+        :return list results:  The result of each call, in the same order as ``calls``
+        """
+        size = self.setting['batch_size']
+        chunks = [calls[i:i + size] for i in range(0, len(calls), size)]
+        # Only bother with the thread pool if there's more than one request to make
+        if len(chunks) > 1 and self.rpc_workers > 1:
+            chunk_results = self._get_executor().map(self.rpc.batch_call, chunks)
+        else:
+            chunk_results = map(self.rpc.batch_call, chunks)
+
+        results = []
+        for r in chunk_results:
+            results += r
+        return results
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Returns the thread pool shared by all BitcoinManager's, creating it on first use"""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.rpc_workers, thread_name_prefix='bitcoind-rpc')
+            return cls._executor
+
     def get_deposit(self) -> tuple:
         """
         Returns a deposit address for this symbol
@@ -205,6 +304,9 @@ class BitcoinManager(BaseManager, BitcoinMixin):
 
         """
 
+        rpc, sym = self.rpc, self.symbol
+        string_amt = self.setting['string_amt']
+
         # To avoid issues with floats, we convert the amount to a string with 8DP
         if type(amount) == float:
             amount = '{0:.8f}'.format(amount)
@@ -212,49 +314,53 @@ class BitcoinManager(BaseManager, BitcoinMixin):
 
         # First let's make sure the destination address is valid
         try:
-            v = self.rpc.validateaddress(address)
-            if v['isvalid'] not in [True, 'true', 1]:
-                raise Exception()
-        except:
-            raise exceptions.AccountNotFound('Invalid {} address {}'.format(self.symbol, address))
+            valid = rpc.validateaddress(address)['isvalid'] in [True, 'true', 1]
+        except RPC_ERRORS:
+            valid = False
+        if not valid:
+            raise exceptions.AccountNotFound('Invalid {} address {}'.format(sym, address))
         # Now let's try to send the coins
         try:
-            txid = self.rpc.sendtoaddress(address, '{0:.8f}'.format(amount), "", "", True,
-                                          force_float=not self.setting['string_amt'])
-            # Fallback values if getting TX data below fails.
-            fee = Decimal(0)
-            actual_amount = '{0:.8f}'.format(amount)
-            sender = None
-            # To find out the fee, the amount after fee, and the sending addresses, we need to look up the TXID
-            # This is wrapped in another try/catch to ensure badly formed TXs don't trigger the outer try/catch
-            # and cause the caller to think the coins weren't sent.
-            try:
-                txdata = self.rpc.gettransaction(txid)
-                fee = txdata['fee']
-                if type(fee) == float:
-                    fee = '{0:.8f}'.format(fee)
-                fee = Decimal(fee)
-                if fee < 0:
-                    fee = -fee
-                txam = txdata['amount']
-                if type(txam) == float:
-                    txam = '{0:.8f}'.format(txam)
-                txam = Decimal(txam)
-                actual_amount = txam if txam > 0 else -txam
-                sender = ','.join([a['address'] for a in txdata['details'] if a['category'] == 'send'])
-
-            except:
-                log.exception('Something went wrong loading data for %s TXID %s', self.symbol, txid)
-                log.error('The fee, amount, and "from" details may be inaccurate')
-
-            return {
-                'txid': txid,
-                'coin': self.symbol,
-                'amount': Decimal(actual_amount),
-                'fee': Decimal(fee),
-                'from': sender,
-                'send_type': 'send'
-            }
+            txid = rpc.sendtoaddress(address, '{0:.8f}'.format(amount), "", "", True, force_float=not string_amt)
         except Exception as e:
-            log.exception("Something went wrong sending %f %s to %s", amount, self.symbol, address)
+            log.exception("Something went wrong sending %f %s to %s", amount, sym, address)
             raise e
+
+        # From this point the coins have been sent, so nothing below may raise - otherwise the caller would think the
+        # send failed, and could retry it (sending the coins twice).
+
+        # The wallet balance has changed, so any cached balances for this coin are now stale.
+        try:
+            self._clear_balance_cache()
+        except Exception:
+            log.exception('Failed to clear the cached %s balances after sending TXID %s', sym, txid)
+
+        # Fallback values if getting TX data below fails.
+        fee = Decimal(0)
+        actual_amount = amount
+        sender = None
+        # To find out the fee, the amount after fee, and the sending addresses, we need to look up the TXID
+        try:
+            txdata = rpc.gettransaction(txid)
+            tx_fee = txdata['fee']
+            if type(tx_fee) == float:
+                tx_fee = '{0:.8f}'.format(tx_fee)
+            tx_fee = Decimal(tx_fee)
+            txam = txdata['amount']
+            if type(txam) == float:
+                txam = '{0:.8f}'.format(txam)
+            txam = Decimal(txam)
+            tx_sender = ','.join([a['address'] for a in txdata['details'] if a['category'] == 'send'])
+            fee, actual_amount, sender = abs(tx_fee), abs(txam), tx_sender
+        except Exception:
+            log.exception('Something went wrong loading data for %s TXID %s', sym, txid)
+            log.error('The fee, amount, and "from" details may be inaccurate')
+
+        return {
+            'txid': txid,
+            'coin': sym,
+            'amount': actual_amount,
+            'fee': fee,
+            'from': sender,
+            'send_type': 'send'
+        }
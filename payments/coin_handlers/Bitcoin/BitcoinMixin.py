@@ -15,11 +15,17 @@
     +===================================================+
 
 """
+import json
 import logging
-from typing import List, Dict
+from decimal import Decimal
+from typing import List, Dict, Iterator, Tuple
 
+import ijson
 from django.conf import settings
-from privex.jsonrpc import BitcoinRPC
+from privex.jsonrpc import BitcoinRPC, RPCException
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from payments.models import Coin
 from steemengine.helpers import empty
@@ -27,6 +33,75 @@ from steemengine.helpers import empty
 log = logging.getLogger(__name__)
 
 
+class StreamBitcoinRPC(BitcoinRPC):
+    """
+    A small extension of :class:`privex.jsonrpc.BitcoinRPC` which can stream-parse large JSONRPC responses.
+
+    The standard :py:meth:`.call` method buffers and parses the entire response body before returning it, which for
+    methods such as ``listtransactions`` with a large ``count`` means holding thousands of TXs in memory at once.
+
+    :py:meth:`.stream_call` instead parses the ``result`` array incrementally using :py:mod:`ijson`, returning a
+    generator which yields each item as soon as it has been read from the socket.
+
+        >>> rpc = StreamBitcoinRPC(username='bitcoinrpc', password='somesecurepassword')
+        >>> for tx in rpc.stream_listtransactions(count=1000):
+        ...     print(tx['txid'])
+
+    Numbers within streamed items are parsed as :class:`decimal.Decimal` (or ``int``) rather than ``float``.
+    """
+
+    def stream_call(self, method: str, *params, prefix: str = 'result.item') -> Iterator[dict]:
+        """
+        Call a JSONRPC method, and lazily yield the items found at ``prefix`` within the response body.
+
+        The HTTP request is sent immediately, so connection errors and non-200 responses (which bitcoind uses for
+        RPC errors) are raised by this method, rather than during iteration of the returned generator.
+
+        :param str method:   JSON RPC method to call
+        :param params:       Positional parameters to be passed as a list in the JSON request body
+        :param str prefix:   The :py:mod:`ijson` prefix of the items to yield (default: items of the ``result`` array)
+        :raises requests.exceptions.HTTPError: Raised if the JsonRPC call resulted in a non-200 response.
+        :return Iterator[dict] items: A generator yielding each item of the result as it's parsed
+        """
+        payload = dict(method=method, params=list(params), jsonrpc='2.0', id=self.next_id)
+        log.debug('Sending streamed JsonRPC request to %s with payload: %s', self.url, payload)
+        r = self.req.post(self.url, data=json.dumps(payload), headers=self.headers, timeout=self.timeout, stream=True)
+        r.raise_for_status()
+        r.raw.decode_content = True
+        return ijson.items(r.raw, prefix)
+
+    def batch_call(self, calls: List[Tuple[str, list]]) -> list:
+        """
+        Send multiple JSONRPC calls to the daemon in a single HTTP request (a JSONRPC "batch"), and return their
+        results in the same order as ``calls``.
+
+            >>> rpc.batch_call([('getblockchaininfo', []), ('getbalance', [])])
+            [{'chain': 'main', 'blocks': 570000, ...}, Decimal('1.2345')]
+
+        :param list calls:     A list of ``(method, params)`` tuples, e.g. ``[('gettransaction', ['abcd...'])]``
+        :raises RPCException:  Raised if any of the calls returned an error
+        :raises requests.exceptions.HTTPError: Raised if the batch request resulted in a non-200 response.
+        :return list results:  The ``result`` of each call, in the same order as ``calls``
+        """
+        if len(calls) == 0:
+            return []
+        payload = [dict(method=m, params=list(p), jsonrpc='2.0', id=i) for i, (m, p) in enumerate(calls)]
+        log.debug('Sending batch of %d JsonRPC calls to %s', len(payload), self.url)
+        r = self.req.post(self.url, data=json.dumps(payload), headers=self.headers, timeout=self.timeout)
+        r.raise_for_status()
+        # The daemon isn't required to reply in order, so we sort the responses back into the order of ``calls``
+        replies = sorted(r.json(parse_float=Decimal), key=lambda reply: reply['id'])
+        for reply in replies:
+            if reply.get('error') is not None:
+                m = calls[reply['id']][0]
+                raise RPCException('Error from batched call to {}: {}'.format(m, reply['error']))
+        return [reply['result'] for reply in replies]
+
+    def stream_listtransactions(self, account="*", count: int = 10, skip: int = 0, watch_only=False) -> Iterator[dict]:
+        """Same as :py:meth:`.listtransactions` but returns a generator which stream-parses the TXs"""
+        return self.stream_call('listtransactions', account, count, skip, watch_only)
+
+
 class BitcoinMixin:
     """
     BitcoinMixin - shared code used by both :class:`Bitcoin.BitcoinLoader` and :class:`Bitcoin.BitcoinManager`
@@ -50,10 +125,23 @@ class BitcoinMixin:
 
     _settings = {}  # type: Dict[str, dict]
 
+    _sessions = {}  # type: Dict[Tuple[str, int, str], Session]
+    """
+    Maps ``(host, port, user)`` to a keep-alive :class:`requests.Session`, shared by every RPC object for that daemon,
+    so that TCP connections are re-used between calls and between Loader/Manager instances.
+
+    This is intentionally **not** cleared when the handler is reloaded. Since sessions are keyed by their connection
+    details, editing one coin's settings doesn't force every other coin to reconnect. Use :py:meth:`.close_sessions`
+    to explicitly close and drop all of them.
+    """
+
+    session_pool_size = 16
+    """Maximum amount of connections kept open per daemon. Should be at least the amount of threads using the RPC"""
+
     # If a setting isn't specified, use these.
     _bc_defaults = dict(
         host='127.0.0.1', port=8332, user=None, password=None,
-        confirms_needed=0, use_trusted=True, string_amt=True
+        confirms_needed=0, use_trusted=True, string_amt=True, batch_size=500
     )
 
     @property
@@ -129,6 +217,7 @@ class BitcoinMixin:
             # Cast settings keys to avoid casting errors
             z['confirms_needed'] = int(z['confirms_needed'])
             z['port'] = int(z['port'])
+            z['batch_size'] = int(z['batch_size'])
             z['use_trusted'] = z['use_trusted'] in [True, 'true', 'True', 'TRUE', 1, 'yes']
             z['string_amt'] = z['string_amt'] in [True, 'true', 'True', 'TRUE', 1, 'yes']
         return d_settings
@@ -140,15 +229,45 @@ class BitcoinMixin:
         rs += dict(username=s['user'], hostname=s['host'])
         return rs
 
-    def _get_rpcs(self) -> Dict[str, BitcoinRPC]:
+    @classmethod
+    def close_sessions(cls):
+        """Close every pooled daemon session in :py:attr:`._sessions` and remove them, forcing new connections"""
+        sessions, BitcoinMixin._sessions = BitcoinMixin._sessions, {}
+        for s in sessions.values():
+            s.close()
+
+    def _session_for(self, conn: dict) -> Session:
+        """
+        Returns the shared keep-alive :class:`requests.Session` for the daemon described by the settings dict ``conn``,
+        creating it if it doesn't exist yet.
+
+        Connection failures are retried up to 3 times with a short backoff. As urllib3 doesn't retry POST requests
+        which have already been sent, this can't cause an RPC call such as ``sendtoaddress`` to be sent twice.
+        """
+        key = (conn['host'], conn['port'], conn.get('user'))
+        sessions = BitcoinMixin._sessions
+        if key not in sessions:
+            s = Session()
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=self.session_pool_size,
+                max_retries=Retry(total=3, backoff_factor=0.2)
+            )
+            s.mount('http://', adapter)
+            s.mount('https://', adapter)
+            sessions[key] = s
+        return sessions[key]
+
+    def _get_rpcs(self) -> Dict[str, StreamBitcoinRPC]:
         """Returns a dict mapping coin symbols to their RPC objects"""
         rpcs = {}
 
         for sym, conn in self._prep_settings().items():
-            rpcs[sym] = BitcoinRPC(
+            rpcs[sym] = StreamBitcoinRPC(
                 hostname=conn['host'],
                 port=conn['port'],
                 username=conn.get('user'),
                 password=conn.get('password')
             )
+            # Replace the library's class-wide session with a pooled session dedicated to this daemon
+            rpcs[sym].req = self._session_for(conn)
         return rpcs
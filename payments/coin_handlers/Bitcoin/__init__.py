@@ -30,6 +30,7 @@ It will automatically handle any :class:`payments.models.Coin` which has it's ty
       accepted at 0 confs regardless of ``confirms_needed``
     - ``string_amt`` Default: True; If true, when sending coins, a ``Decimal`` will be used (as a string). This can
       cause problems with older coins such as Dogecoin, so for older coins that need floats, set this to False.
+    - ``batch_size`` Default: 500; Maximum amount of RPC calls to send in a single JSONRPC batch request
 
 **Django Settings**:
 
@@ -50,7 +51,8 @@ It will automatically handle any :class:`payments.models.Coin` which has it's ty
               'port':     8332,
               'confirms_needed': 0,
               'string_amt': True,
-              'use_trusted': True
+              'use_trusted': True,
+              'batch_size': 500
           }
         }
 
@@ -76,10 +78,9 @@ import logging
 
 from payments.coin_handlers.Bitcoin.BitcoinLoader import BitcoinLoader
 from payments.coin_handlers.Bitcoin.BitcoinManager import BitcoinManager
-from django.conf import settings
 
 from payments.coin_handlers.Bitcoin.BitcoinMixin import BitcoinMixin
-from payments.models import Coin
+from payments.coin_handlers.base import LazyProvides, register_coin_type
 
 log = logging.getLogger(__name__)
 
@@ -99,18 +100,16 @@ def reload():
     global loaded
     loaded = True
 
-    # Add the bitcoind coin type to the admin drop down
-    log.debug('Checking if bitcoind is in COIN_TYPES')
-    if 'bitcoind' not in dict(settings.COIN_TYPES):
-        log.debug('bitcoind not in COIN_TYPES, adding it.')
-        settings.COIN_TYPES += (('bitcoind', 'Bitcoind RPC compatible crypto',),)
+    # Add the bitcoind coin type to the admin drop down (if it isn't already)
+    register_coin_type('bitcoind', 'Bitcoind RPC compatible crypto')
 
-    # Grab a simple list of coin symbols with the type 'bitcoind' to populate the provides lists.
-    provides = Coin.objects.filter(enabled=True, coin_type='bitcoind').values_list('symbol', flat=True)
+    provides = LazyProvides('bitcoind')
     BitcoinLoader.provides = provides
     BitcoinManager.provides = provides
     # Since the handler is re-loading, we wipe the settings cache to ensure stale connection details aren't used.
     BitcoinMixin._settings = {}
+    # The pooled sessions are kept, as they're keyed by (host, port, user) - a coin whose connection details were
+    # changed simply gets a new session, while every other coin keeps re-using it's open connections.
 
 
 # Only run the initialisation code once.
@@ -19,7 +19,7 @@
 import pytz
 import logging
 from decimal import Decimal
-from typing import Generator, Iterable, List
+from typing import Generator, Iterable, List, Dict
 from datetime import datetime
 
 from django.core.cache import cache
@@ -67,6 +67,9 @@ class BitsharesLoader(BaseLoader, BitsharesMixin):
     This saves us from hard coding specific coin symbols. See __init__.py for populating code.
     """
 
+    bitshares_readonly = True
+    """The loader never signs or broadcasts, so it uses the read-only BitShares instance"""
+
     def __init__(self, symbols):
         super().__init__(symbols=symbols)
         self.tx_count = 1000
@@ -82,41 +85,41 @@ class BitsharesLoader(BaseLoader, BitsharesMixin):
         :param list<dict> transactions:  A list<dict> of transactions to filter
         :return: A generator yielding ``dict`` s conforming to :class:`payments.models.Deposit`
         """
+        # Only keep transfers sent to us, then look up all of their assets and senders up front
+        transactions = [
+            tx for tx in transactions
+            if self._op_data(tx).get('to') == account['id'] and self._op_data(tx).get('from') != account['id']
+        ]
+        # The batched lookups fall back to empty results on errors, so one bad TX / RPC call can't abort the scan.
+        # Any asset or sender which couldn't be loaded in bulk is looked up individually below.
+        assets = self._load_assets(self._op_data(tx).get('amount', {}).get('asset_id') for tx in transactions)
+        account_names = self._load_account_names(self._op_data(tx).get('from') for tx in transactions)
+        try:
+            block_times = self.get_block_timestamps(tx.get('block_num') for tx in transactions)
+        except Exception:
+            log.exception('Error loading block timestamps for Bitshares transactions. Using per-block lookups.')
+            block_times = {}
+
         for tx in transactions:
             try:
                 data = tx['op'][1]   # unwrap the transaction structure to get at the data within
-                
-                if data['to'] != account['id'] or data['from'] == account['id']:
-                    continue
 
-                # cache asset data for 5 mins, so we aren't spamming the RPC node for data
                 amount_info = data['amount']
-                asset_id = amount_info['asset_id']
-                asset_key = 'btsasset:%s' % (asset_id,)
-                asset = cache.get(asset_key, default=None)
+                asset = assets.get(amount_info['asset_id'])
                 if asset is None:
-                    asset_obj = self.get_asset_obj(asset_id)
-                    if asset_obj is not None:
-                        asset = { 'symbol' : asset_obj.symbol, 'precision' : asset_obj.precision }
-                        cache.set(asset_key, asset, 300)
-                    else:
-                        continue
-                if asset['symbol'] != symbol:
+                    asset = self._load_assets([amount_info['asset_id']], batch=False).get(amount_info['asset_id'])
+                if asset is None or asset['symbol'] != symbol:
                     continue
 
                 raw_amount = Decimal(int(amount_info['amount']))
                 transfer_quantity = raw_amount / (10 ** asset['precision'])
 
-                # cache account data for 5 mins, so we aren't spamming the RPC node for data
-                account_key = 'btsacc:%s' % (data['from'],)
-                from_account_name = cache.get(account_key, default=data['from'])
+                from_account_name = account_names.get(data['from'])
+                if from_account_name is None:
+                    from_account_name = self._load_account_names([data['from']], batch=False).get(data['from'])
+                    from_account_name = data['from'] if from_account_name is None else from_account_name
                 if from_account_name == data['from']:
-                    from_account = self.get_account_obj(data['from'])
-                    if from_account is not None:
-                        from_account_name = from_account.name
-                        cache.set(account_key, from_account_name, 300)
-                    else:
-                        log.exception('From account not found for transaction %s', tx)
+                    log.error('From account not found for transaction %s', tx)
 
                 # decrypt the transaction memo
                 memo_msg = ''
@@ -131,9 +134,11 @@ class BitsharesLoader(BaseLoader, BitsharesMixin):
                         memo_msg = '--cannot decode memo--'
                         log.exception('Error decoding memo %s, got exception %s', memo['message'], e)
 
-                # fetch timestamp from the block containing this transaction
-                # (a hugely inefficient lookup but unfortunately no other way to do this)
-                tx_datetime = datetime.fromtimestamp(self.get_block_timestamp(tx['block_num']))
+                # timestamp of the block containing this transaction (the history doesn't include it)
+                block_time = block_times.get(tx['block_num'])
+                if block_time is None:
+                    block_time = self.get_block_timestamp(tx['block_num'])
+                tx_datetime = datetime.fromtimestamp(block_time)
                 tx_datetime = timezone.make_aware(tx_datetime, pytz.UTC)
 
                 clean_tx = dict(
@@ -146,6 +151,83 @@ class BitsharesLoader(BaseLoader, BitsharesMixin):
                 log.exception('Error parsing transaction data. Skipping this TX. tx = %s, exception = %s', tx, e)
                 continue
 
+    @staticmethod
+    def _op_data(tx: dict) -> dict:
+        """Returns the operation data (``tx['op'][1]``) of a history entry, or an empty dict if it's malformed"""
+        op = tx.get('op') if isinstance(tx, dict) else None
+        return op[1] if isinstance(op, (list, tuple)) and len(op) > 1 and isinstance(op[1], dict) else {}
+
+    def _load_assets(self, asset_ids: Iterable[str], batch=True) -> Dict[str, dict]:
+        """
+        Get the symbol and precision for each asset ID in ``asset_ids``. Assets are cached for 5 mins, so we aren't
+        spamming the RPC node for data, and any that aren't cached are looked up with a single batched API call.
+
+        Errors are logged rather than raised - if the batched call fails, nothing new is returned, and the caller
+        can look up the assets it needs individually by passing ``batch=False``.
+
+        :param asset_ids: An iterable of Bitshares asset IDs, e.g. ``['1.3.0', '1.3.121']``
+        :param bool batch: If ``False``, look up each asset with it's own API call, skipping any which error
+        :return dict: ``{asset_id: dict(symbol:str, precision:int)}`` - assets that don't exist are left out.
+        """
+        keys = {'btsasset:%s' % (a,): a for a in asset_ids if a is not None}
+        cached = cache.get_many(keys.keys())
+        assets = {keys[k]: v for k, v in cached.items()}
+
+        found = self._load_objs(
+            [a for k, a in keys.items() if k not in cached], self.get_asset_objs, self.get_asset_obj, batch, 'asset'
+        )
+        new_assets = {a: {'symbol': obj['symbol'], 'precision': obj['precision']} for a, obj in found.items()}
+        cache.set_many({'btsasset:%s' % (a,): v for a, v in new_assets.items()}, 300)
+        return {**assets, **new_assets}
+
+    def _load_account_names(self, account_ids: Iterable[str], batch=True) -> Dict[str, str]:
+        """
+        Get the account name for each account ID in ``account_ids``. Names are cached for 5 mins, so we aren't
+        spamming the RPC node for data, and any that aren't cached are looked up with a single batched API call.
+
+        Errors are handled the same way as :py:meth:`._load_assets`.
+
+        :param account_ids: An iterable of Bitshares account IDs, e.g. ``['1.2.12345']``
+        :param bool batch: If ``False``, look up each account with it's own API call, skipping any which error
+        :return dict: ``{account_id: name}`` - accounts that don't exist are left out.
+        """
+        keys = {'btsacc:%s' % (a,): a for a in account_ids if a is not None}
+        cached = cache.get_many(keys.keys())
+        names = {keys[k]: v for k, v in cached.items()}
+
+        found = self._load_objs(
+            [a for k, a in keys.items() if k not in cached], self.get_account_objs, self.get_account_obj, batch,
+            'account'
+        )
+        new_names = {a: obj['name'] for a, obj in found.items()}
+        cache.set_many({'btsacc:%s' % (a,): v for a, v in new_names.items()}, 300)
+        return {**names, **new_names}
+
+    @staticmethod
+    def _load_objs(ids: List[str], get_many, get_one, batch: bool, kind: str) -> dict:
+        """
+        Used by :py:meth:`._load_assets` / :py:meth:`._load_account_names` - looks up ``ids`` with ``get_many`` (or
+        ``get_one`` per ID when ``batch`` is False), logging errors and leaving out anything which couldn't be loaded.
+        """
+        if len(ids) == 0:
+            return {}
+        if batch:
+            try:
+                return get_many(ids)
+            except Exception:
+                log.exception('Error while batch loading Bitshares %s objects %s', kind, ids)
+                return {}
+        found = {}
+        for i in ids:
+            try:
+                obj = get_one(i)
+            except Exception:
+                log.exception('Error while loading Bitshares %s object %s', kind, i)
+                continue
+            if obj is not None:
+                found[i] = obj
+        return found
+
     def list_txs(self, batch=0) -> Generator[dict, None, None]:
         """
         Get transactions for all coins in `self.coins` where the 'to' field matches coin.our_account
@@ -16,9 +16,14 @@
 
 """
 import logging
+import threading
+import time
+from datetime import datetime
 from decimal import Decimal
 from django.conf import settings
-from typing import List
+from django.core.cache import cache
+from typing import List, Iterable, Dict, Tuple
+from weakref import WeakValueDictionary
 
 from payments.models import CryptoKeyPair
 from steemengine.helpers import decrypt_str
@@ -29,7 +34,9 @@ from bitshares.asset import Asset
 from bitshares.blockchain import Blockchain
 from bitshares.amount import Amount
 
+from grapheneapi.exceptions import RPCError, NumRetriesReached
 from graphenecommon.exceptions import AccountDoesNotExistsException
+from graphenecommon.exceptions import BlockDoesNotExistsException
 from graphenecommon.exceptions import AssetDoesNotExistsException
 from graphenecommon.exceptions import InvalidWifError
 from graphenecommon.exceptions import KeyAlreadyInStoreException
@@ -66,25 +73,81 @@ class BitsharesMixin:
 
     """
 
-    _bitshares = None   # type: BitShares
-    """Shared instance of :py:class:`bitshares.BitShares` used across both the loader/manager."""
+    _bitshares_rw = None   # type: BitShares
+    """Shared instance of :py:class:`bitshares.BitShares` used for signing/broadcasting by the manager."""
+
+    _bitshares_ro = None   # type: BitShares
+    """Shared read-only instance of :py:class:`bitshares.BitShares` (no TX bundling/broadcasting) used by the loader."""
+
+    bitshares_readonly = False
+    """If True, :py:attr:`.bitshares` returns the read-only instance :py:attr:`._bitshares_ro`"""
 
     _blockchain = None  # type: Blockchain
     """Shared instance of :py:class:`bitshares.blockchain.Blockchain` used across both the loader/manager."""
 
+    block_cache_time = 86400
+    """Amount of seconds to cache block timestamps for in :py:meth:`.get_block_timestamp`"""
+
+    _scales = {}  # type: Dict[int, Decimal]
+    """Maps an asset precision to the Decimal it's raw amounts are multiplied by, e.g. ``{3: Decimal('0.001')}``"""
+
+    _account_cache = WeakValueDictionary()  # type: WeakValueDictionary[str, Account]
+    """
+    Maps account names/IDs to Account objects that are still in use elsewhere, so repeated lookups of the same account
+    (e.g. within a single transaction scan) don't construct a new object (and make an API call) every time.
+    """
+
+    _asset_cache = WeakValueDictionary()  # type: WeakValueDictionary[str, Asset]
+    """Same as :py:attr:`._account_cache` but for Asset objects, mapped by symbol/ID"""
+
+    _key_cache = {}  # type: Dict[Tuple[str, str], str]
+    """Maps ``(account_name, key_type)`` to a decrypted private key. See :py:meth:`._get_private_keys`"""
+
+    _key_lock = threading.Lock()
+
+    _bs_lock = threading.Lock()
+    """Guards creation of the shared BitShares and Blockchain instances so only one of each is ever created"""
+
     @property
     def bitshares(self) -> BitShares:
-        """Returns an instance of BitShares and caches it in the attribute _bitshares after creation"""
-        if not self._bitshares:
-            self._bitshares = BitShares(settings.BITSHARES_RPC_NODE, bundle=True, keys=[])
-        return self._bitshares
+        """
+        Returns the process-wide instance of BitShares, creating it on first access.
+
+        The instance is stored on :class:`.BitsharesMixin` itself (not the loader/manager instance), so the node
+        connection is only set up once per process, no matter how many loaders/managers are created. When
+        ``settings.BITSHARES_RPC_NODE`` is a websocket node, this means every API call re-uses one open socket.
+
+        Classes which only read from the chain (i.e. the loader) set :py:attr:`.bitshares_readonly`, and get a
+        separate instance without transaction bundling, which can never broadcast.
+        """
+        cls = BitsharesMixin
+        attr = '_bitshares_ro' if self.bitshares_readonly else '_bitshares_rw'
+        bitshares = getattr(cls, attr)
+        if bitshares is None:
+            with cls._bs_lock:
+                bitshares = getattr(cls, attr)
+                if bitshares is None:
+                    node = settings.BITSHARES_RPC_NODE
+                    if not node.startswith(('ws://', 'wss://')):
+                        log.warning('BITSHARES_RPC_NODE "%s" is not a websocket node. Each Bitshares API call will '
+                                    'need it\'s own HTTP request, consider using a ws:// or wss:// node.', node)
+                    if self.bitshares_readonly:
+                        bitshares = BitShares(node, nobroadcast=True, keys=[])
+                    else:
+                        bitshares = BitShares(node, bundle=True, keys=[])
+                    setattr(cls, attr, bitshares)
+        return bitshares
     
     @property
     def blockchain(self) -> Blockchain:
-        """Returns an instance of Blockchain and caches it in the attribute _blockchain after creation"""
-        if not self._blockchain:
-            self._blockchain = Blockchain(blockchain_instance=self.bitshares)
-        return self._blockchain
+        """Returns the process-wide instance of Blockchain, creating it on first access. See :py:attr:`.bitshares`"""
+        cls = BitsharesMixin
+        if cls._blockchain is None:
+            bitshares = self.bitshares
+            with cls._bs_lock:
+                if cls._blockchain is None:
+                    cls._blockchain = Blockchain(blockchain_instance=bitshares)
+        return cls._blockchain
 
     def get_account_obj(self, account_name) -> Account:
         """
@@ -93,8 +156,12 @@ class BitsharesMixin:
         :param account_name: Bitshares account to get data for
         :return Account or None
         """
+        account_obj = self._account_cache.get(account_name)
+        if account_obj is not None:
+            return account_obj
         try:
             account_obj = Account(account_name, blockchain_instance=self.bitshares)
+            self._account_cache[account_name] = account_obj
             return account_obj
         except AccountDoesNotExistsException:
             return None
@@ -106,29 +173,124 @@ class BitsharesMixin:
         :param symbol: Bitshares token to get data for (can be symbol name or id)
         :return Asset or None
         """
+        asset_obj = self._asset_cache.get(symbol)
+        if asset_obj is not None:
+            return asset_obj
         try:
             asset_obj = Asset(symbol, blockchain_instance=self.bitshares)
+            self._asset_cache[symbol] = asset_obj
             return asset_obj
         except AssetDoesNotExistsException:
             return None
 
+    def get_account_objs(self, accounts: Iterable[str]) -> Dict[str, Account]:
+        """
+        Batch version of :py:meth:`.get_account_obj` - looks up multiple accounts with a single ``get_accounts``
+        API call, instead of one call per account.
+
+        :param accounts: An iterable of Bitshares account names and/or IDs (e.g. ``['privex', '1.2.12345']``)
+        :return dict: A dict mapping each requested name/ID to it's :py:class:`bitshares.account.Account`.
+                      Accounts which don't exist are left out.
+        """
+        accounts = list(dict.fromkeys(accounts))   # remove duplicates while keeping the order
+        if len(accounts) == 0:
+            return {}
+        rows = self.bitshares.rpc.get_accounts(accounts)
+        return {
+            name: Account(row, blockchain_instance=self.bitshares)
+            for name, row in zip(accounts, rows) if row is not None
+        }
+
+    def get_asset_objs(self, symbols: Iterable[str]) -> Dict[str, Asset]:
+        """
+        Batch version of :py:meth:`.get_asset_obj` - looks up multiple assets with a single ``lookup_asset_symbols``
+        API call, instead of one call per asset.
+
+        :param symbols: An iterable of Bitshares token symbols and/or asset IDs (e.g. ``['BTS', '1.3.121']``)
+        :return dict: A dict mapping each requested symbol/ID to it's :py:class:`bitshares.asset.Asset`.
+                      Assets which don't exist are left out.
+        """
+        symbols = list(dict.fromkeys(symbols))   # remove duplicates while keeping the order
+        if len(symbols) == 0:
+            return {}
+        rows = self.bitshares.rpc.lookup_asset_symbols(symbols)
+        return {
+            symbol: Asset(row, blockchain_instance=self.bitshares)
+            for symbol, row in zip(symbols, rows) if row is not None
+        }
+
     def get_block_timestamp(self, block_number) -> int:
         """
         Given a block number, returns the timestamp of that block. If block number is invalid or an error happens, returns 0.
 
+        Successful lookups are cached for :py:attr:`.block_cache_time` seconds, since many transactions can share the
+        same block.
+
         :param block_number: block number to get data for
         :return int
         """
+        # Don't bother asking the node about block numbers which can't possibly exist
+        if type(block_number) is not int or block_number <= 0:
+            return 0
+        key = 'btsblock:%s' % (block_number,)
+        timestamp = cache.get(key, default=None)
+        if timestamp is not None:
+            return timestamp
         try:
-            return self.blockchain.block_timestamp(block_number)
-        except:
+            timestamp = self.blockchain.block_timestamp(block_number)
+        except (BlockDoesNotExistsException, RPCError, NumRetriesReached, ConnectionError,
+                AttributeError, KeyError, TypeError, ValueError):
+            log.warning('Failed to get timestamp for Bitshares block %s', block_number, exc_info=True)
             return 0
+        # a block's timestamp never changes, so only errors (which aren't cached) can cause a repeat lookup
+        cache.set(key, timestamp, self.block_cache_time)
+        return timestamp
+
+    def get_block_timestamps(self, block_numbers: Iterable[int]) -> Dict[int, int]:
+        """
+        Batch version of :py:meth:`.get_block_timestamp` - returns a dict mapping each block number to it's timestamp.
+
+        Blocks which aren't already cached are looked up with a single ``get_block_header_batch`` API call, rather
+        than fetching each full block one by one. If the batch call fails (e.g. the node doesn't support it), we fall
+        back to :py:meth:`.get_block_timestamp` for each block. Invalid / unknown blocks map to 0.
+
+        :param block_numbers: An iterable of block numbers to get timestamps for
+        :return dict: ``{block_number: timestamp}``
+        """
+        block_numbers = [b for b in dict.fromkeys(block_numbers) if type(b) is int and b > 0]
+        keys = {'btsblock:%s' % (b,): b for b in block_numbers}
+        cached = cache.get_many(keys.keys())
+        timestamps = {keys[k]: v for k, v in cached.items()}
+        missing = [b for k, b in keys.items() if k not in cached]
+        if len(missing) == 0:
+            return timestamps
+
+        try:
+            headers = self.bitshares.rpc.get_block_header_batch(missing)
+            # The node returns a map of block_num -> header, which is serialised as a list of [num, header] pairs
+            headers = dict(headers) if not isinstance(headers, dict) else headers
+            new_stamps = {}
+            for num, header in headers.items():
+                if header is None:
+                    continue
+                # Converted the same way as Blockchain.block_timestamp, so both methods return identical timestamps
+                block_time = datetime.strptime(header['timestamp'], '%Y-%m-%dT%H:%M:%S')
+                new_stamps[int(num)] = int(time.mktime(block_time.timetuple()))
+        except (RPCError, NumRetriesReached, ConnectionError, AttributeError, KeyError, TypeError, ValueError):
+            log.warning('get_block_header_batch failed, falling back to loading blocks individually', exc_info=True)
+            return {b: self.get_block_timestamp(b) for b in block_numbers}
+
+        cache.set_many({'btsblock:%s' % (b,): ts for b, ts in new_stamps.items()}, self.block_cache_time)
+        timestamps = {**timestamps, **new_stamps}
+        return {b: timestamps.get(b, 0) for b in block_numbers}
 
     def get_decimal_from_amount(self, amount_obj: Amount) -> Decimal:
         """Helper function to convert a Bitshares Amount object into a Decimal"""
-        raw_amount = Decimal(int(amount_obj))
-        balance = raw_amount / (10 ** amount_obj.asset['precision'])
-        return balance
+        precision = amount_obj.asset['precision']
+        scale = self._scales.get(precision)
+        if scale is None:
+            scale = self._scales[precision] = Decimal(1).scaleb(-precision)
+        return Decimal(int(amount_obj)) * scale
 
     def get_private_key(self, account_name, key_type) -> str:
         """
@@ -146,16 +308,61 @@ class BitsharesMixin:
 
         :return str key:           the plaintext key
         """
-        key_types = [key_type]
+        return self._get_private_keys(account_name, [key_type])[key_type]
 
-        kp = CryptoKeyPair.objects.filter(network='bitshares', account=account_name, key_type__in=key_types)
-        if len(kp) < 1:
-            raise AuthorityMissing(f'No private key found for Bitshares account {account_name} matching type: {key_type}')
+    def _get_private_keys(self, account_name, key_types: List[str]) -> Dict[str, str]:
+        """
+        Get the decrypted private key of each type in ``key_types`` for the Bitshares account ``account_name``.
 
-        # Grab the first key pair we've found, and decrypt the private key into plain text
-        priv_key = decrypt_str(kp[0].private_key)
+        Decrypted keys are kept in memory (see :py:attr:`._key_cache`), so each key is only loaded from the database
+        and decrypted once, rather than for every transfer / memo. Any keys not yet cached are loaded with a single
+        query, keeping the first key found for each type.
 
-        return priv_key
+        :raises AuthorityMissing:  No key could be found for one of the requested key types
+        :return dict keys:         A dict mapping each key type to it's plaintext key
+        """
+        keys = {}
+        with self._key_lock:
+            for key_type in key_types:
+                if (account_name, key_type) in self._key_cache:
+                    keys[key_type] = self._key_cache[(account_name, key_type)]
+        missing = [k for k in key_types if k not in keys]
+        if len(missing) == 0:
+            return keys
+
+        kps = CryptoKeyPair.objects.filter(network='bitshares', account=account_name, key_type__in=missing)
+        enc_keys = {}
+        for k_type, enc_key in kps.order_by('pk').values_list('key_type', 'private_key'):
+            enc_keys.setdefault(k_type, enc_key)
+
+        for key_type in missing:
+            if key_type not in enc_keys:
+                raise AuthorityMissing(
+                    f'No private key found for Bitshares account {account_name} matching type: {key_type}'
+                )
+            keys[key_type] = decrypt_str(enc_keys[key_type])
+
+        with self._key_lock:
+            for key_type in missing:
+                self._key_cache[(account_name, key_type)] = keys[key_type]
+        return keys
+
+    @classmethod
+    def clear_object_cache(cls):
+        """Empty the Account / Asset object caches :py:attr:`._account_cache` and :py:attr:`._asset_cache`"""
+        BitsharesMixin._account_cache.clear()
+        BitsharesMixin._asset_cache.clear()
+
+    @classmethod
+    def clear_key_cache(cls):
+        """
+        Empty the decrypted private key cache :py:attr:`._key_cache`, e.g. after keys were added/changed/removed.
+
+        Python strings are immutable, so the plaintext keys can't be wiped in-place - this simply drops every
+        reference the cache holds, so the keys don't outlive their database rows.
+        """
+        with BitsharesMixin._key_lock:
+            BitsharesMixin._key_cache.clear()
 
     def set_wallet_keys(self, account_name, key_types: List[str]):
         """
@@ -172,8 +379,10 @@ class BitsharesMixin:
         :raises EncryptKeyMissing: CTC admin did not set ENCRYPT_KEY in their `.env`, or it is invalid
         :raises EncryptionError:   Something went wrong while decrypting the private key (maybe ENCRYPT_KEY is invalid)
         """
+        private_keys = self._get_private_keys(account_name, key_types)
+
         for key_type in key_types:
-            private_key = self.get_private_key(account_name, key_type)
+            private_key = private_keys[key_type]
             try:
                 self.bitshares.wallet.addPrivateKey(private_key)
             except KeyAlreadyInStoreException:
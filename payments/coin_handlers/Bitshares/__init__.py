@@ -25,9 +25,12 @@ It will automatically handle any :class:`payments.models.Coin` which has its typ
 import logging
 from payments.coin_handlers.Bitshares.BitsharesLoader import BitsharesLoader
 from payments.coin_handlers.Bitshares.BitsharesManager import BitsharesManager
-from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
-from payments.models import Coin
+from payments.coin_handlers.Bitshares.BitsharesMixin import BitsharesMixin
+from payments.coin_handlers.base import LazyProvides, register_coin_type
+from payments.models import CryptoKeyPair
 
 log = logging.getLogger(__name__)
 
@@ -46,15 +49,23 @@ def reload():
     global loaded
     loaded = True
 
-    log.debug('Checking if bitshares is in COIN_TYPES')
-    if 'bitshares' not in dict(settings.COIN_TYPES):
-        log.debug('bitshares not in COIN_TYPES, adding it.')
-        settings.COIN_TYPES += (('bitshares', 'Bitshares Token',),)
+    # Add the Bitshares coin type to the admin drop down (if it isn't already)
+    register_coin_type('bitshares', 'Bitshares Token')
 
-    # Grab a simple list of coin symbols with the type 'bitshares' to populate the provides lists.
-    provides = Coin.objects.filter(enabled=True, coin_type='bitshares').values_list('symbol', flat=True)
+    provides = LazyProvides('bitshares')
     BitsharesLoader.provides = provides
     BitsharesManager.provides = provides
+    # Drop any cached private keys, in case the handler is re-loading due to a key change.
+    BitsharesMixin.clear_key_cache()
+    BitsharesMixin.clear_object_cache()
+
+
+@receiver(post_save, sender=CryptoKeyPair)
+@receiver(post_delete, sender=CryptoKeyPair)
+def _keypair_changed(sender, instance: CryptoKeyPair, **kwargs):
+    """Ensure a changed or deleted Bitshares key isn't still served from the decrypted key cache"""
+    if instance.network == 'bitshares':
+        BitsharesMixin.clear_key_cache()
 
 
 # Only run the initialisation code once.
@@ -1,28 +1,86 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import partial
+from operator import itemgetter
 from decimal import Decimal
-from typing import Generator, List, Iterable
+from threading import Lock
+from typing import Generator, List, Iterable, Tuple, Dict, Optional, Any, Callable
 
+import ijson
 import pytz
-import requests
 import json
 from dateutil.parser import parse
+from django.conf import settings
 from django.core.cache import cache
-from django.utils import timezone
 
-from payments.coin_handlers.EOS.EOSMixin import EOSMixin
+from payments.coin_handlers.EOS.EOSMixin import EOSMixin, get_http_session, json_loads
 from payments.coin_handlers.base import retry_on_err, AccountNotFound, BaseLoader
+from payments.models import Coin
 from steemengine.helpers import empty
 
 log = logging.getLogger(__name__)
 
+JSON_HEADERS = {'Accept': 'application/json'}
+"""Headers sent with history API requests. The shared session already asks for gzip compressed responses."""
+
+get_trace_fields = itemgetter('trx_id', 'receipt', 'act')
+"""Extracts ``(txid, receipt, act)`` from a v1 history ``action_trace`` in one C-level call"""
+get_act_fields = itemgetter('account', 'name', 'data')
+"""Extracts ``(contract_acc, tx_type, tx_data)`` from an action's ``act``"""
+
+
+def parse_block_time(value: str) -> datetime:
+    """
+    Parse an EOS API timestamp such as ``2019-06-01T12:30:00.500`` into a timezone aware (UTC) datetime.
+
+    EOS timestamps are a fixed ISO-8601 format, so :py:meth:`datetime.fromisoformat` is used, which is much faster
+    than :py:func:`dateutil.parser.parse`. Anything ``fromisoformat`` can't handle falls back to dateutil.
+
+    :param str value: An ISO-8601 timestamp, assumed to be UTC if it doesn't specify a timezone
+    :return datetime ts: A timezone aware datetime
+    """
+    if value.endswith('Z'):
+        value = value[:-1]
+    try:
+        ts = datetime.fromisoformat(value)
+    except ValueError:
+        ts = parse(value)
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=pytz.UTC)
+
 
 class EOSLoader(BaseLoader, EOSMixin):
 
+    _executor = None  # type: Optional[ThreadPoolExecutor]
+    _page_executor = None  # type: Optional[ThreadPoolExecutor]
+    _executor_lock = Lock()
+
+    pvx_page_size = 250
+    """Amount of actions requested per page from the Privex history API"""
+
+    actions_cache_time = 60
+    """Amount of seconds to cache an account's actions for, both in-process and in the Django cache"""
+
+    history_cache_version = 1
+    """Included in the key of the longer lived v1 history cache used by :py:meth:`._load_actions`"""
+
+    _local_actions = {}  # type: Dict[str, Tuple[float, List[dict]]]
+    """
+    In-process cache in front of the Django cache, mapping action cache keys to ``(expires_at, actions)``. A hit
+    avoids unpickling (and with Redis/Memcached, a network round trip for) the large list of actions.
+    """
+    _local_actions_lock = Lock()
+
     def __init__(self, symbols):
         super(EOSLoader, self).__init__(symbols=symbols)
         self.tx_count = 1000
         self.loaded = False
         self.current_rpc = None
+        # Contract accounts resolved by :py:meth:`.get_contract`, mapped by upper case symbol
+        self._contracts = {}  # type: Dict[str, str]
+        # ``(load_method, history_url, rpc_url)`` of each coin resolved by :py:meth:`.load`, mapped by symbol
+        self._sources = {}  # type: Dict[str, Tuple[str, str, str]]
 
     def load(self, tx_count=1000):
         """
@@ -40,25 +98,28 @@ class EOSLoader(BaseLoader, EOSMixin):
         loadsettings = dict(self.settings)
         # Loop over each Coin we're responsible for, make sure every EOS token has both an `our_account` and
         # a contract set (either in Coin.setting_json or EOSMixin.default_contracts). Disable any that don't.
+        # As a side effect, this resolves each token's contract into self._contracts, and where it's history is
+        # loaded from into self._sources, so that list_txs only needs a dict lookup for each of them.
+        bad = set()
         for symbol, coin in self.coins.items():
-            safe = False   # Assume a token is not valid by default.
-            symbol = symbol.upper()
             try:
                 if empty(coin.our_account):
                     raise AccountNotFound(
                         f'{chain} token "{coin}" has blank `our_account`. Refusing to load TXs.'
                     )
                 self.get_contract(symbol)
+                self._sources[symbol] = self._load_source(coin)
             except Exception as e:
                 log.warning(f'Refusing to load TXs for {chain} token "{coin}". Reason: {type(e)} - {str(e)}')
+                bad.add(symbol)
             else:
                 log.debug(f'{chain} token with symbol "{coin}" passed tests. Has non-empty our_account and contract.')
-                safe = True
-            # If a token didn't pass basic sanity checks (has our account + contract), remove it from coins and symbols.
-            if not safe:
-                log.debug(f'Removing symbol "{symbol}" from self.coins and self.symbols...')
-                del self.coins[symbol]
-                self.symbols = [s for s in self.symbols if s != symbol]
+        # If a token didn't pass basic sanity checks (has our account + contract), remove it from coins and symbols.
+        if len(bad) > 0:
+            log.debug(f'Removing symbols {bad} from self.coins and self.symbols...')
+            for symbol in bad:
+                self.coins.pop(symbol, None)
+            self.symbols = [s for s in self.symbols if s not in bad]
         log.debug('Remaining %s symbols that were not disabled: %s', __name__, self.symbols)
         self.loaded = True
 
@@ -74,56 +135,125 @@ class EOSLoader(BaseLoader, EOSMixin):
             self.load()
         chain = self.chain.upper()
 
+        # Each coin's upper case symbol and contract are resolved once here, then re-used by every step below.
+        sources, tokens = {}, {}
         for symbol, c in self.coins.items():
             try:
-                # If a specific EOS/TELOS token has a different RPC, then it may be on a different chain and we
-                # need to switch over our RPC.
-                coin_rpc = c.settings['host']
-                
-                # Use the database eos_settings host if it's set. Otherwise fall back to the default.
-                default_rpc = self.setting_defaults['host']
-                default_rpc = default_rpc if empty(self.eos_settings.get('host')) else self.eos_settings['host']
-                load_method = self.setting_defaults.get('load_method', 'actions')
-                history_url = self.setting_defaults.get('history_url')
-                if not empty(self.current_rpc):
-                    # If this coin doesn't have a specific RPC, then use the default (eos_settings or class default)
-                    # Otherwise, use the coin's own RPC settings.
-                    if empty(coin_rpc) and default_rpc not in self.current_rpc:
-                        self.replace_eos(**self.eos_settings)
-                    elif not empty(coin_rpc) and coin_rpc not in self.current_rpc:
-                        self.replace_eos(**{**c.settings, **c.settings['json']})
-
                 sym = c.symbol_id.upper()
-                
-                if not empty(c.settings['json'].get('load_method')):
-                    load_method = c.settings['json'].get('load_method')
-                elif not empty(self.eos_settings.get('load_method')):
-                    load_method = self.eos_settings.get('load_method')
-                
-                if not empty(c.settings['json'].get('history_url')):
-                    history_url = c.settings['json'].get('history_url')
-                elif not empty(self.eos_settings.get('history_url')):
-                    history_url = self.eos_settings.get('history_url')
-                
-                if load_method == 'pvx':
-                    actions = self.pvx_get_actions(
-                        c.our_account, self.tx_count, history_url=history_url, symbol=sym,
-                        contract=self.get_contract(sym)
-                    )
-                    yield from self.pvx_clean_txs(c.our_account, sym, self.get_contract(sym), actions)
-                elif load_method == 'v2_actions':
-                    log.debug(f'Loading {chain} actions for token "{sym}" using v2 account history, received to "{c.our_account}"')
-                    actions = self.v2_get_actions(c.our_account, 100)
-                    yield from self.v2_clean_txs(c.our_account, sym, self.get_contract(sym), actions)
+                tokens[symbol] = (sym, self.get_contract(sym))
+                sources[symbol] = self._sources[symbol] if symbol in self._sources else self._load_source(c)
+            except Exception:
+                log.exception('Something went wrong while loading transactions for coin %s. Skipping for now.', c)
+
+        # Actions for coins using v1 history are loaded up front, so that an account which receives multiple tokens
+        # is only loaded once per API node, and accounts which are already cached are fetched in one cache query.
+        v1_actions = self.get_actions_bulk(
+            [(url, self.coins[s].our_account) for s, (method, _, url) in sources.items()
+             if method not in ['pvx', 'v2_actions']],
+            count=100
+        )
+
+        # Coins using the Privex / v2 history APIs are filtered server-side by contract, so they need their own
+        # requests. These are all sent in parallel, making the wall time the slowest request, rather than the sum.
+        # Any of them which are already cached are retrieved with a single cache query, instead of one per coin.
+        # ``job_of`` maps each coin's symbol to the key of the job which loads it's actions.
+        jobs, cache_keys, job_of, v2_groups = {}, {}, {}, {}
+        for symbol, (load_method, history_url, url) in sources.items():
+            account = self.coins[symbol].our_account
+            sym, contract = tokens[symbol]
+            if load_method == 'pvx':
+                job_of[symbol] = key = ('pvx', symbol)
+                cache_keys[key] = self._pvx_cache_key(account, contract, sym)
+                jobs[key] = partial(
+                    self.pvx_get_actions, account, self.tx_count, history_url=history_url, symbol=sym, contract=contract
+                )
+            elif load_method == 'v2_actions':
+                log.debug(f'Loading {chain} actions for token "{sym}" using v2 account history, received to "{account}"')
+                job_of[symbol] = key = ('v2', url, account)
+                v2_groups.setdefault(key, set()).add(contract)
+
+        # v2 history nodes accept multiple filters, so tokens received by the same account on the same node are
+        # loaded with one request covering all of their contracts. Each cleaner only keeps it's own contract's TXs.
+        for key, contracts in v2_groups.items():
+            _, url, account = key
+            count, contracts = min(100 * len(contracts), 1000), ','.join(sorted(contracts))
+            cache_keys[key] = self._v2_cache_key(account, contracts)
+            jobs[key] = partial(self.v2_get_actions, account, count, url=url, contract=contracts)
+
+        cached = cache.get_many(list(cache_keys.values())) if len(cache_keys) > 0 else {}
+        fetched = {k: cached[ck] for k, ck in cache_keys.items() if not empty(cached.get(ck))}
+        missing = {k: job for k, job in jobs.items() if k not in fetched}
+        if len(missing) == 1 and next(iter(missing))[0] == 'pvx':
+            # With only one history request to make, there's nothing to run in parallel - instead, the actions are
+            # streamed page by page straight into pvx_clean_txs, so the first deposits are yielded while later
+            # pages are still loading.
+            key, job = next(iter(missing.items()))
+            fetched[key] = self.pvx_iter_actions(*job.args, **job.keywords)
+        else:
+            fetched.update(self._fetch_parallel(missing))
+
+        for symbol, (load_method, history_url, url) in sources.items():
+            c = self.coins[symbol]
+            account = c.our_account
+            sym, contract = tokens[symbol]
+            try:
+                if load_method in ['pvx', 'v2_actions']:
+                    if job_of[symbol] not in fetched:
+                        continue
+                    cleaner = self.pvx_clean_txs if load_method == 'pvx' else self.v2_clean_txs
+                    yield from cleaner(account, sym, contract, fetched[job_of[symbol]])
                 else:
-                    log.debug(f'Loading {chain} actions for token "{sym}", received to "{c.our_account}"')
-                    # actions = self.get_actions(c.our_account, self.tx_count)
-                    actions = self.get_actions(c.our_account, 100)
-                    yield from self.clean_txs(c.our_account, sym, self.get_contract(sym), actions)
+                    log.debug(f'Loading {chain} actions for token "{sym}", received to "{account}"')
+                    if (url, account) not in v1_actions:
+                        log.warning('No %s actions were loaded for coin %s. Skipping for now.', chain, c)
+                        continue
+                    yield from self.clean_txs(account, sym, contract, v1_actions[(url, account)])
             except:
                 log.exception('Something went wrong while loading transactions for coin %s. Skipping for now.', c)
                 continue
 
+    def get_contract(self, symbol: str) -> str:
+        """
+        Same as :py:meth:`.EOSMixin.get_contract`, but contracts which were found are kept in ``self._contracts``,
+        so that after :py:meth:`.load` has ran, each token's contract is a simple dict lookup.
+        """
+        contract = self._contracts.get(symbol)
+        if contract is not None:
+            return contract
+        symbol = symbol.upper()
+        if symbol not in self._contracts:
+            self._contracts[symbol] = super(EOSLoader, self).get_contract(symbol)
+        return self._contracts[symbol]
+
+    def _load_source(self, c: Coin) -> Tuple[str, str, str]:
+        """
+        Works out where, and how, transactions should be loaded from for the coin ``c``.
+
+        If a specific EOS/TELOS token has a different RPC, then it may be on a different chain, so we use the coin's
+        own RPC settings. Otherwise we use the base coin's settings (:py:attr:`.eos_settings`), or the class defaults.
+
+        :param Coin c: The coin to get the transaction source for
+        :return tuple source: ``(load_method, history_url, rpc_url)``
+        """
+        # Coin.settings re-decodes the coin's JSON every time it's accessed, so it's only read once here.
+        csettings = c.settings
+        cjson, eos_settings = csettings['json'], self.eos_settings
+
+        load_method = cjson.get('load_method')
+        if empty(load_method):
+            load_method = eos_settings.get('load_method')
+        if empty(load_method):
+            load_method = self.setting_defaults.get('load_method', 'actions')
+
+        history_url = cjson.get('history_url')
+        if empty(history_url):
+            history_url = eos_settings.get('history_url')
+        if empty(history_url):
+            history_url = self.setting_defaults.get('history_url')
+
+        rpc_url = self.url if empty(csettings['host']) else self._make_url(**{**csettings, **cjson})
+        return load_method, history_url, rpc_url
+
     def v2_clean_txs(self, account, symbol, contract, transactions: Iterable[dict]) -> Generator[dict, None, None]:
         """
         Filters a given Iterable of dict's containing raw EOS "actions":
@@ -138,22 +268,39 @@ class EOSLoader(BaseLoader, EOSMixin):
         :param Iterable[dict] transactions:   An iterable list/generator of EOS actions as dict's
         :return Generator cleaned_txs:  A generator yielding valid Deposit TXs as dict's
         """
+        # Bind values/functions used for every kept TX to locals once, rather than looking them up per TX
+        coin_symbol, _Decimal, _parse = self.coins[symbol].symbol, Decimal, parse_block_time
+        # A quantity is formatted as e.g. '1.2345 EOS', so a suffix check filters out other tokens without splitting
+        sym_suffix = ' ' + symbol
+        sym_len = len(sym_suffix)
         for tx in transactions:
             try:
                 # Decompose various information from the complex EOS transaction format
                 #  - The `act` contains metadata about the transaction such as the contract account, tx type, and body
                 #  - The `data` of `act` contains the actual sender username, and the memo
-                txid, act = tx['trx_id'], tx['act']
-                contract_acc, tx_type, tx_data = act['account'], act['name'], act['data']
-                if tx_type != 'transfer':
-                    continue  # if the transaction isn't a transfer, we don't care.
+                # The cheapest checks come first, so that most actions are skipped before any string parsing.
+                act = tx['act']
+                # In EOS, the act['account'] (contract_acc) account is the owner of the smart contract
+                # not the actual user who sent it. The "act.data.to" (to_acc) however, should be us.
+                if act['name'] != 'transfer' or act['account'] != contract:
+                    continue  # if the transaction isn't a transfer of our token's contract, we don't care.
 
+                tx_data = act['data']
                 # ignore transactions that are missing a 'from'
                 if 'from' not in tx_data:
                     continue
 
+                from_acc, to_acc = tx_data['from'], tx_data['to']
+                if to_acc != account or from_acc == account:
+                    continue  # skip transactions which aren't to us, or are our own transactions
+
+                quantity = tx_data['quantity']
+                if not quantity.endswith(sym_suffix):
+                    continue  # skip foreign currency
+                amount = quantity[:-sym_len]
+
                 # Some transfers might not contain a memo key at all, so fallback to '' if the key doesn't exist.
-                raw_memo, from_acc, to_acc = tx_data.get('memo', ''), tx_data['from'], tx_data['to']
+                raw_memo = tx_data.get('memo', '')
 
                 # Some Telos users deposit from a wallet that has a non-standard memo format, so we check for that here.
                 memo = ''
@@ -163,30 +310,20 @@ class EOSLoader(BaseLoader, EOSMixin):
                         memo = json_memo['memo']
                     else:
                         memo = raw_memo
-                except Exception:
+                except (ValueError, TypeError):
                     memo = raw_memo
 
-                # In EOS, the act['account'] (contract_acc) account is the owner of the smart contract
-                # not the actual user who sent it. The "act.data.to" (to_acc) however, should be us.
-                if contract_acc != contract or to_acc != account:
-                    continue
-
-                if from_acc == account:
-                    continue  # skip our own transactions
-
-                amount, txcurrency = tuple(tx_data['quantity'].split(' '))
-                if txcurrency != symbol:
-                    continue  # skip foreign currency
+                txid = tx['trx_id']
 
-                ts = parse(tx['timestamp'])
-                ts = timezone.make_aware(ts, pytz.UTC)
+                ts = _parse(tx['timestamp'])
 
                 yield dict(
-                    txid=txid, coin=self.coins[symbol].symbol, tx_timestamp=ts, from_account=from_acc,
-                    to_account=to_acc, memo=memo, amount=Decimal(amount)
+                    txid=txid, coin=coin_symbol, tx_timestamp=ts, from_account=from_acc,
+                    to_account=to_acc, memo=memo, amount=_Decimal(amount)
                 )
-            except Exception:
-                log.exception('Error parsing transaction data. Skipping this TX. tx = %s', tx)
+            except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+                # A malformed TX is expected now and then, so it's logged without the (slow to format) traceback.
+                log.warning('Error parsing transaction data. Skipping this TX. Reason: %s %s - tx = %s', type(e), e, tx)
                 continue
 
     def clean_txs(self, account, symbol, contract, transactions: Iterable[dict]) -> Generator[dict, None, None]:
@@ -203,6 +340,12 @@ class EOSLoader(BaseLoader, EOSMixin):
         :param Iterable[dict] transactions:   An iterable list/generator of EOS actions as dict's
         :return Generator cleaned_txs:  A generator yielding valid Deposit TXs as dict's
         """
+        # Bind values/functions used for every kept TX to locals once, rather than looking them up per TX
+        coin_symbol, _Decimal, _parse = self.coins[symbol].symbol, Decimal, parse_block_time
+        # A quantity is formatted as e.g. '1.2345 EOS', so a suffix check filters out other tokens without splitting
+        sym_suffix = ' ' + symbol
+        sym_len = len(sym_suffix)
+        _get_trace, _get_act = get_trace_fields, get_act_fields
         for tx in transactions:
             try:
                 # Decompose various information from the complex EOS transaction format
@@ -210,12 +353,17 @@ class EOSLoader(BaseLoader, EOSMixin):
                 #  - The `receipt` contains information about the receiver
                 #  - The `act` contains metadata about the transaction such as the contract account, tx type, and body
                 #  - The `data` of `act` contains the actual sender username, and the memo
-                tr = tx['action_trace']
-                txid, rec, act = tr['trx_id'], tr['receipt'], tr['act']
-                to_acc = rec['receiver']
-                contract_acc, tx_type, tx_data = act['account'], act['name'], act['data']
-                if tx_type != 'transfer':
-                    continue  # if the transaction isn't a transfer, we don't care.
+                txid, receipt, act = _get_trace(tx['action_trace'])
+                contract_acc, tx_type, tx_data = _get_act(act)
+                # The cheapest checks come first, so that most actions are skipped before any string parsing.
+                # In EOS, the act['account'] (contract_acc) account is the owner of the smart contract
+                # not the actual user who sent it. The "receiver" (to_acc) however, should be us.
+                if tx_type != 'transfer' or contract_acc != contract:
+                    continue  # if the transaction isn't a transfer of our token's contract, we don't care.
+
+                to_acc = receipt['receiver']
+                if to_acc != account:
+                    continue
 
                 # ignore transactions that are missing a 'from'
                 if 'from' not in tx_data:
@@ -224,27 +372,23 @@ class EOSLoader(BaseLoader, EOSMixin):
                 # Some transfers might not contain a memo key at all, so fallback to '' if the key doesn't exist.
                 memo, from_acc = tx_data.get('memo', ''), tx_data['from']
 
-                # In EOS, the act['account'] (contract_acc) account is the owner of the smart contract
-                # not the actual user who sent it. The "receiver" (to_acc) however, should be us.
-                if contract_acc != contract or to_acc != account:
-                    continue
-
                 if from_acc == account:
                     continue  # skip our own transactions
 
-                amount, txcurrency = tuple(tx_data['quantity'].split(' '))
-                if txcurrency != symbol:
+                quantity = tx_data['quantity']
+                if not quantity.endswith(sym_suffix):
                     continue  # skip foreign currency
+                amount = quantity[:-sym_len]
 
-                ts = parse(tx['block_time'])
-                ts = timezone.make_aware(ts, pytz.UTC)
+                ts = _parse(tx['block_time'])
 
                 yield dict(
-                    txid=txid, coin=self.coins[symbol].symbol, tx_timestamp=ts, from_account=tx_data['from'],
-                    to_account=to_acc, memo=memo, amount=Decimal(amount)
+                    txid=txid, coin=coin_symbol, tx_timestamp=ts, from_account=from_acc,
+                    to_account=to_acc, memo=memo, amount=_Decimal(amount)
                 )
-            except Exception:
-                log.exception('Error parsing transaction data. Skipping this TX. tx = %s', tx)
+            except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+                # A malformed TX is expected now and then, so it's logged without the (slow to format) traceback.
+                log.warning('Error parsing transaction data. Skipping this TX. Reason: %s %s - tx = %s', type(e), e, tx)
                 continue
 
     def pvx_clean_txs(self, account, symbol, contract, transactions: Iterable[dict]) -> Generator[dict, None, None]:
@@ -261,53 +405,42 @@ class EOSLoader(BaseLoader, EOSMixin):
         :param Iterable[dict] transactions:   An iterable list/generator of EOS actions as dict's
         :return Generator cleaned_txs:  A generator yielding valid Deposit TXs as dict's
         """
+        # Bind values/functions used for every kept TX to locals once, rather than looking them up per TX
+        coin_symbol, _Decimal, _parse = self.coins[symbol].symbol, Decimal, parse_block_time
+        # A quantity is formatted as e.g. '1.2345 EOS', so a suffix check filters out other tokens without splitting
+        sym_suffix = ' ' + symbol
+        sym_len = len(sym_suffix)
         for tx in transactions:
             try:
-                # Decompose various information from the complex EOS transaction format
-                #  - The `action_trace` contains most of the information about the transaction
-                #  - The `receipt` contains information about the receiver
-                #  - The `act` contains metadata about the transaction such as the contract account, tx type, and body
-                #  - The `data` of `act` contains the actual sender username, and the memo
-                # tr = tx['action_trace']
-                # txid, rec, act = tr['trx_id'], tr['receipt'], tr['act']
-                # to_acc = rec['receiver']
-                # contract_acc, tx_type, tx_data = act['account'], act['name'], act['data']
-                txid = tx['txid']
-                tx_type = tx['name']
-                tx_data = tx['data']
-                contract_acc = tx['account']
-                to_acc = tx['tx_to']
-                if tx_type != 'transfer':
-                    continue  # if the transaction isn't a transfer, we don't care.
-            
-                # ignore transactions that are missing a 'from'
-                if 'from' not in tx_data:
-                    continue
-            
-                # Some transfers might not contain a memo key at all, so fallback to '' if the key doesn't exist.
-                memo, from_acc = tx['tx_memo'], tx['tx_from']
-            
+                # The Privex history API flattens the action, so the cheapest and most selective checks come first,
+                # skipping the vast majority of actions (non-transfers) before anything else is looked up.
+                if tx['name'] != 'transfer' or tx['account'] != contract:
+                    continue  # if the transaction isn't a transfer of our token's contract, we don't care.
+
                 # In EOS, the act['account'] (contract_acc) account is the owner of the smart contract
                 # not the actual user who sent it. The "receiver" (to_acc) however, should be us.
-                if contract_acc != contract or to_acc != account:
+                to_acc = tx['tx_to']
+                if to_acc != account:
                     continue
-            
-                if from_acc == account:
-                    continue  # skip our own transactions
-            
-                amount, txcurrency = tuple(tx_data['quantity'].split(' '))
-                if txcurrency != symbol:
+
+                tx_data = tx['data']
+                # ignore transactions that are missing a 'from', and skip our own transactions
+                if 'from' not in tx_data or tx['tx_from'] == account:
+                    continue
+
+                quantity = tx_data['quantity']
+                if not quantity.endswith(sym_suffix):
                     continue  # skip foreign currency
-            
-                ts = parse(tx['timestamp'])
-                # ts = timezone.make_aware(ts, pytz.UTC)
-            
+                amount = quantity[:-sym_len]
+
                 yield dict(
-                    txid=txid, coin=self.coins[symbol].symbol, tx_timestamp=ts, from_account=tx_data['from'],
-                    to_account=to_acc, memo=memo, amount=Decimal(amount), vout=tx['action_index']
+                    txid=tx['txid'], coin=coin_symbol, tx_timestamp=_parse(tx['timestamp']),
+                    from_account=tx_data['from'], to_account=to_acc, memo=tx['tx_memo'], amount=_Decimal(amount),
+                    vout=tx['action_index']
                 )
-            except Exception:
-                log.exception('Error parsing transaction data. Skipping this TX. tx = %s', tx)
+            except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+                # A malformed TX is expected now and then, so it's logged without the (slow to format) traceback.
+                log.warning('Error parsing transaction data. Skipping this TX. Reason: %s %s - tx = %s', type(e), e, tx)
                 continue
 
     @retry_on_err(3, 3)  # Auto-retry on exception up to 3 times, with 3 seconds delay between attempts
@@ -315,68 +448,301 @@ class EOSLoader(BaseLoader, EOSMixin):
         """
         Loads EOS transactions for a given account, and caches them per account to avoid constant queries.
 
+        The history API filters the actions by ``symbol`` and ``contract`` server-side, so they're included in the
+        cache key, otherwise tokens sharing an account would be served each other's (filtered) actions.
+
         :param account:  The EOS account to load transactions for
         :param count:    Amount of transactions to load
+        :param symbol:   (optional) Only load transfers of this token symbol
+        :param contract: (optional) Only load actions of this contract account
         :return list transactions: A list of EOS transactions as dict's
         """
-        cache_key = f'{self.chain}_pvx_actions:{account}'
+        return list(self.pvx_iter_actions(account, count, symbol=symbol, contract=contract, history_url=history_url))
+
+    def pvx_iter_actions(self, account: str, count=100, symbol=None, contract=None, history_url=None) \
+            -> Generator[dict, None, None]:
+        """
+        Same as :py:meth:`.pvx_get_actions`, but returns a generator which yields the actions as each page of them
+        is loaded, instead of waiting for all of them. Once every page has been loaded, the actions are cached.
+
+        Unlike :py:meth:`.pvx_get_actions`, failed requests aren't retried, as they happen while it's iterated over.
+        """
+        cache_key = self._pvx_cache_key(account, contract, symbol)
         actions = cache.get(cache_key)
+        if not empty(actions):
+            yield from actions
+            return
         if empty(history_url):
             history_url = self.setting_defaults.get('history_url')
-        
-        if empty(actions):
-            log.info('Loading %s actions for %s from history API %s', self.chain.upper(), account, history_url)
-            # c = self.eos
-            # data = c.get_actions(account, pos=-1, offset=-count)
-            url = f"{history_url}/api/actions/?limit={count}&tx_to={account}"
-            if not empty(symbol): url += f"&symbol={symbol}"
-            if not empty(contract): url += f"&account={contract}"
-            req = requests.get(url)
-            actions = req.json()['results']
-            # log.info('%s %s', url, actions)
-            cache.set(cache_key, actions, timeout=60)
-    
-        return actions
+
+        log.info('Loading %s actions for %s from history API %s', self.chain.upper(), account, history_url)
+        url = f"{history_url}/api/actions/?tx_to={account}"
+        if not empty(symbol): url += f"&symbol={symbol}"
+        if not empty(contract): url += f"&account={contract}"
+        actions = []
+        for page in self._pvx_pages(url, count):
+            actions.extend(page)
+            yield from page
+        cache.set(cache_key, actions, timeout=60)
+
+    def _pvx_pages(self, url: str, count: int) -> Generator[List[dict], None, None]:
+        """
+        Loads up to ``count`` actions from the Privex history API ``url`` in pages of :py:attr:`.pvx_page_size`,
+        yielding a list of the transfer actions from each page.
+
+        As soon as the response headers for a page have arrived, the request for the next page is sent in the
+        background, so that it's being downloaded while the current page is being stream-parsed.
+
+        :param str url:   The history API URL (including any filters) without ``limit`` / ``offset``
+        :param int count: The maximum amount of actions to load
+        :return Generator pages: A generator yielding a ``List[dict]`` of transfer actions per page
+        """
+        session, executor = get_http_session(), self._get_page_executor()
+
+        def fetch(offset: int, limit: int):
+            r = session.get(f'{url}&limit={limit}&offset={offset}', headers=JSON_HEADERS, timeout=(3.05, 15),
+                            stream=True)
+            r.raise_for_status()
+            r.raw.decode_content = True
+            return r
+
+        offset, limit = 0, min(self.pvx_page_size, count)
+        pending = executor.submit(fetch, offset, limit)
+        while pending is not None:
+            req, page_limit = pending.result(), limit
+            offset += page_limit
+            limit = min(self.pvx_page_size, count - offset)
+            pending = executor.submit(fetch, offset, limit) if limit > 0 else None
+            # The (potentially large) page is stream-parsed one action at a time, rather than buffering the whole
+            # body. Only transfers are kept, as they're all that pvx_clean_txs looks at, which also keeps the
+            # cached list small.
+            loaded, page = 0, []
+            with req:
+                for a in ijson.items(req.raw, 'results.item'):
+                    loaded += 1
+                    if a.get('name') == 'transfer':
+                        page.append(a)
+            yield page
+            # A short page means there's nothing left, so the prefetched request (if any) is discarded.
+            if loaded < page_limit and pending is not None:
+                pending.add_done_callback(lambda f: f.exception() is None and f.result().close())
+                pending = None
+
+    @classmethod
+    def _get_page_executor(cls) -> ThreadPoolExecutor:
+        """
+        Returns the thread pool used to prefetch history API pages, creating it on first use. This is separate from
+        :py:meth:`._get_executor`, as page fetches are waited on from within that pool's threads.
+        """
+        with EOSLoader._executor_lock:
+            if EOSLoader._page_executor is None:
+                workers = int(getattr(settings, 'EOS_FETCH_CONCURRENCY', 8))
+                EOSLoader._page_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='eos-pages')
+            return EOSLoader._page_executor
+
+    def get_actions_bulk(self, sources: Iterable[Tuple[str, str]], count=100) -> Dict[Tuple[str, str], List[dict]]:
+        """
+        Loads EOS transactions for multiple accounts, only loading each ``(rpc_url, account)`` once. Any accounts
+        which are already cached are retrieved with a single cache query.
+
+        Accounts which fail to load (after :py:meth:`.get_actions`'s retries) are logged, and left out of the result.
+
+        :param sources:  An iterable of ``(rpc_url, account)`` tuples to load transactions for
+        :param count:    Amount of transactions to load per account
+        :return dict actions: A dict mapping each ``(rpc_url, account)`` to it's list of EOS transactions
+        """
+        sources = list(dict.fromkeys(sources))
+        results, missing = {}, []
+        keys = {(url, account): self._actions_cache_key(account, url) for url, account in sources}
+        cached = {}
+        for cache_key in keys.values():
+            actions = self._local_get(cache_key)
+            if actions is not None:
+                cached[cache_key] = actions
+        remote_keys = [k for k in keys.values() if k not in cached]
+        if len(remote_keys) > 0:
+            cached.update(cache.get_many(remote_keys))
+        for (url, account), cache_key in keys.items():
+            actions = cached.get(cache_key)
+            if empty(actions):
+                missing.append((url, account))
+                continue
+            results[(url, account)] = actions
+
+        # Accounts which weren't cached are requested in parallel, so the network latency of each request overlaps.
+        fetched = self._fetch_parallel(
+            {(url, account): partial(self.get_actions, account, count, url=url) for url, account in missing}
+        )
+        results.update(fetched)
+        return results
+
+    def _fetch_parallel(self, jobs: Dict[Any, Callable[[], List[dict]]]) -> Dict[Any, List[dict]]:
+        """
+        Runs each zero-argument function in ``jobs`` on the shared thread pool (up to
+        ``settings.EOS_FETCH_CONCURRENCY`` at once), and returns their results, mapped by the same keys.
+
+        If there's only one job, or concurrency is set to 1, the jobs are simply ran in the current thread.
+        Jobs which raise an exception are logged, and left out of the result.
+
+        :param dict jobs:     A dict mapping any hashable key to a function which loads a list of actions
+        :return dict results: A dict mapping each key of a successful job to the list it returned
+        """
+        results = {}
+        workers = int(getattr(settings, 'EOS_FETCH_CONCURRENCY', 8))
+        if len(jobs) > 1 and workers > 1:
+            executor = self._get_executor(workers)
+            futures = {executor.submit(fn): key for key, fn in jobs.items()}
+            for f in as_completed(futures):
+                try:
+                    results[futures[f]] = f.result()
+                except Exception:
+                    log.exception('Failed to load %s actions for %s', self.chain.upper(), futures[f])
+            return results
+
+        for key, fn in jobs.items():
+            try:
+                results[key] = fn()
+            except Exception:
+                log.exception('Failed to load %s actions for %s', self.chain.upper(), key)
+        return results
+
+    @classmethod
+    def _get_executor(cls, workers: int) -> ThreadPoolExecutor:
+        """Returns the thread pool shared by all EOS loaders, creating it on first use"""
+        with EOSLoader._executor_lock:
+            if EOSLoader._executor is None:
+                EOSLoader._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='eos-actions')
+            return EOSLoader._executor
 
     @retry_on_err(3, 3)     # Auto-retry on exception up to 3 times, with 3 seconds delay between attempts
-    def get_actions(self, account: str, count=100) -> List[dict]:
+    def get_actions(self, account: str, count=100, url: str = None) -> List[dict]:
         """
         Loads EOS transactions for a given account, and caches them per account to avoid constant queries.
 
         :param account:  The EOS account to load transactions for
         :param count:    Amount of transactions to load
+        :param url:      (optional) The API node to load from, if not the base coin's node :py:attr:`.url`
         :return list transactions: A list of EOS transactions as dict's
         """
-        cache_key = f'{self.chain}_actions:{account}'
+        cache_key = self._actions_cache_key(account, url)
+        actions = self._local_get(cache_key)
+        if actions is not None:
+            return actions
         actions = cache.get(cache_key)
 
         if empty(actions):
-            log.info('Loading %s actions for %s from node %s', self.chain.upper(), account, self.url)
-            c = self.eos
-            data = c.get_actions(account, pos=-1, offset=-count)
-            actions = data['actions']
-            cache.set(cache_key, actions, timeout=60)
+            actions = self._load_actions(account, count, url=url)
+            cache.set(cache_key, actions, timeout=self.actions_cache_time)
+        self._local_set(cache_key, actions)
 
         return actions
 
+    def _load_actions(self, account: str, count=100, url: str = None) -> List[dict]:
+        """
+        Loads the most recent ``count`` actions for ``account`` from the API node (v1 history).
+
+        The loaded actions are also kept in the cache for ``settings.EOS_HISTORY_CACHE_TIME`` seconds. While they're
+        still cached, only the actions after the last ``account_action_seq`` we've seen are requested from the node,
+        and merged on top of the cached ones - so a loader which runs every few minutes only downloads new actions.
+
+        The key includes :py:attr:`.history_cache_version`, so that it can be bumped if the cached format changes, and
+        the node's URL, as each node's ``account_action_seq`` numbering isn't guaranteed to match.
+
+        :param account:  The EOS account to load transactions for
+        :param count:    Amount of transactions to load
+        :param url:      (optional) The API node to load from, if not the base coin's node :py:attr:`.url`
+        :return list transactions: A list of EOS transactions as dict's, oldest first
+        """
+        node = url or self.url
+        hist_key = f'{self.chain}_actions_hist:v{self.history_cache_version}:{node}:{account}'
+        c = self.eos_for(url)
+        history = cache.get(hist_key)
+        last_seq = None if empty(history) else history[-1].get('account_action_seq')
+
+        new_actions = None
+        if last_seq is not None:
+            log.info('Loading %s actions for %s after seq %d from node %s', self.chain.upper(), account, last_seq, node)
+            new_actions = c.get_actions(account, pos=last_seq + 1, offset=count - 1)['actions']
+            if len(new_actions) >= count:
+                # A full page means there may be even more new actions after it. Since only the latest ``count``
+                # are returned anyway, it's simpler to just load those, same as when nothing is cached.
+                log.info('Found %d+ new %s actions for %s, re-loading the latest %d instead',
+                         count, self.chain.upper(), account, count)
+                new_actions = None
+
+        if new_actions is None:
+            log.info('Loading %s actions for %s from node %s', self.chain.upper(), account, node)
+            actions = c.get_actions(account, pos=-1, offset=-count)['actions']
+        else:
+            actions = history + [a for a in new_actions if a['account_action_seq'] > last_seq]
+            actions = actions[-count:]
+
+        cache.set(hist_key, actions, timeout=int(getattr(settings, 'EOS_HISTORY_CACHE_TIME', 3600)))
+        return actions
+
+    def _actions_cache_key(self, account: str, url: str = None) -> str:
+        """
+        The cache key which :py:meth:`.get_actions` stores the actions of ``account`` under. Includes the API node,
+        as coins with their own host may be on a different chain, where the same account name has other actions.
+        """
+        return f'{self.chain}_actions:{url or self.url}:{account}'
+
+    def _pvx_cache_key(self, account: str, contract: str = None, symbol: str = None) -> str:
+        """The cache key which :py:meth:`.pvx_get_actions` stores the actions for these arguments under"""
+        return f'{self.chain}_pvx_actions:{account}:{contract}:{symbol}'
+
+    def _v2_cache_key(self, account: str, contract: str = None) -> str:
+        """The cache key which :py:meth:`.v2_get_actions` stores the actions for these arguments under"""
+        if empty(contract):
+            return f'{self.chain}_v2_actions:{account}'
+        return f'{self.chain}_v2_actions:{account}:{contract}'
+
+    @classmethod
+    def _local_get(cls, cache_key: str) -> Optional[List[dict]]:
+        """Returns the actions stored in the in-process cache under ``cache_key``, or ``None`` if missing/expired"""
+        with EOSLoader._local_actions_lock:
+            entry = EOSLoader._local_actions.get(cache_key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    @classmethod
+    def _local_set(cls, cache_key: str, actions: List[dict]):
+        """Store ``actions`` in the in-process cache, and drop any expired entries while we hold the lock"""
+        now = time.monotonic()
+        with EOSLoader._local_actions_lock:
+            expired = [k for k, (expires, _) in EOSLoader._local_actions.items() if expires < now]
+            for k in expired:
+                del EOSLoader._local_actions[k]
+            EOSLoader._local_actions[cache_key] = (now + cls.actions_cache_time, actions)
+
     @retry_on_err(3, 3)     # Auto-retry on exception up to 3 times, with 3 seconds delay between attempts
-    def v2_get_actions(self, account: str, count=100) -> List[dict]:
+    def v2_get_actions(self, account: str, count=100, url: str = None, contract: str = None) -> List[dict]:
         """
         Loads EOS transactions for a given account, and caches them per account to avoid constant queries.
         Uses v2 account history API
 
+        If ``contract`` is specified, the API node only returns ``transfer`` actions of that contract, which is much
+        smaller than the account's full history if it sees a lot of non-transfer actions. Multiple contracts can be
+        specified separated by commas, e.g. ``eosio.token,everipediaiq``, to load transfers of any of them at once.
+
         :param account:  The EOS account to load transactions for
         :param count:    Amount of transactions to load
+        :param url:      (optional) The API node to load from, if not the base coin's node :py:attr:`.url`
+        :param contract: (optional) Only load ``transfer`` actions of this contract account (or comma separated
+                         contract accounts), e.g. ``eosio.token``
         :return list transactions: A list of EOS transactions as dict's
         """
-        cache_key = f'{self.chain}_v2_actions:{account}'
+        cache_key = self._v2_cache_key(account, contract)
         actions = cache.get(cache_key)
 
         if empty(actions):
-            log.info('Loading %s v2 actions for %s from node %s', self.chain.upper(), account, self.url)
-            url = f'{self.url}/v2/history/get_actions?limit={count}&account={account}'
-            req = requests.get(url)
-            actions = req.json()['actions']
+            node = self.url if empty(url) else url
+            log.info('Loading %s v2 actions for %s from node %s', self.chain.upper(), account, node)
+            url = f'{node}/v2/history/get_actions?limit={count}&account={account}'
+            if not empty(contract): url += '&filter=' + ','.join(f'{c}:transfer' for c in contract.split(','))
+            req = get_http_session().get(url, headers=JSON_HEADERS, timeout=(3.05, 15))
+            actions = json_loads(req.content)['actions']
             cache.set(cache_key, actions, timeout=60)
 
         return actions
@@ -1,13 +1,18 @@
 import logging
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta, datetime
 from decimal import Decimal, getcontext, ROUND_DOWN
-from typing import Union, Tuple
+from typing import Union, Tuple, Dict, Optional, Set, Iterable
 
-import pytz
+from django.core.cache import cache
+from django.utils.functional import cached_property
 from requests import HTTPError
 
 from payments.coin_handlers import BaseManager
-from payments.coin_handlers.EOS.EOSMixin import EOSMixin
+from payments.coin_handlers.EOS.EOSMixin import EOSMixin, quantity_amount
+from payments.coin_handlers.EOS.abi import AbiSerializer
 from payments.coin_handlers.base import TokenNotFound, CoinHandlerException, AccountNotFound, AuthorityMissing, \
     NotEnoughBalance
 from payments.models import CryptoKeyPair, Coin
@@ -17,15 +22,68 @@ getcontext().rounding = ROUND_DOWN
 
 log = logging.getLogger(__name__)
 
+MIN_AMOUNT = Decimal('0.0001')
+"""The smallest amount of EOS (or a 4 DP token) which can be sent"""
+ZERO = Decimal(0)
+"""Static ``fee`` returned by :py:meth:`.EOSManager.send` / :py:meth:`.EOSManager.issue`"""
+
 
 class EOSManager(BaseManager, EOSMixin):
 
     can_issue = True
 
+    _key_cache = {}  # type: Dict[Tuple[str, str, Tuple[str, ...]], Tuple[str, str]]
+    """Maps ``(chain_type, account, key_types)`` to a ``(key_type, priv_key)`` tuple. See :py:meth:`.get_privkey`"""
+
+    _key_lock = threading.Lock()
+
+    _executor = None  # type: Optional[ThreadPoolExecutor]
+    _executor_lock = threading.Lock()
+
+    account_cache_time = 300
+    """Amount of seconds to remember that an account exists for. See :py:meth:`.address_valid_many`"""
+
+    _code_hash_support = {}  # type: Dict[str, bool]
+    """Maps API node URLs to whether they support ``get_code_hash``. See :py:meth:`._account_exists`"""
+
+    abi_cache_time = 3600
+    """Amount of seconds to cache a contract's ABI for, see :py:meth:`.get_abi`"""
+
+    _verified_accounts = set()  # type: Set[Tuple[str, str]]
+    """
+    ``(chain_type, account)`` pairs of our own accounts (``Coin.our_account``) which are known to exist. As these
+    never change during the lifetime of the process, they're only ever checked once. See :py:meth:`.forget_account`
+    """
+
     def __init__(self, symbol: str):
         super().__init__(symbol)
         self.current_rpc = None
 
+    @cached_property
+    def _contract(self) -> str:
+        """
+        The contract account for :py:attr:`.symbol`, looked up via :py:meth:`.get_contract` the first time it's used,
+        and then cached on this manager instance. Use :py:meth:`.invalidate_contract` to force a fresh lookup.
+        """
+        return self.get_contract(self.symbol)
+
+    @cached_property
+    def _quantity_format(self) -> str:
+        """
+        A :py:meth:`str.format` template which formats an amount as an EOS asset string for :py:attr:`.symbol`, with
+        the token's precision, e.g. ``'{:.4f} EOS'.format(Decimal('1.5')) == '1.5000 EOS'``. Built once per instance.
+        """
+        precision = int(self.settings[self.symbol].get('precision', 4))
+        return '{:.%df} %s' % (precision, self.symbol)
+
+    def invalidate_contract(self):
+        """
+        Discard the cached :py:attr:`._contract` and :py:attr:`._quantity_format`, e.g. after the coin's ``contract``
+        or ``precision`` setting has been changed
+        """
+        self.__dict__.pop('_contract', None)
+        self.__dict__.pop('_quantity_format', None)
+
     def address_valid(self, *addresses: str) -> bool:
         """
         Check if one or more account usernames exist on the EOS network.
@@ -39,16 +97,93 @@ class EOSManager(BaseManager, EOSMixin):
         :return bool account_exists: True if all of the given accounts in `addresses` exist on the EOS network.
         :return bool account_exists: False if at least one account in `addresses` does not exist on EOS.
         """
-        for address in addresses:
+        return all(self.address_valid_many(*addresses).values())
+
+    def address_valid_many(self, *addresses: str) -> Dict[str, bool]:
+        """
+        Check whether each of one or more account usernames exist on the EOS network. When there's more than one
+        account, they're all looked up in parallel, so checking N accounts costs about as long as checking one.
+
+        Example:
+
+        >>> self.address_valid_many('someguy12333', 'steemenginex')
+        {'someguy12333': True, 'steemenginex': True}
+
+        :param str addresses: One or more EOS usernames to verify the existence of
+        :return dict exists:  A dict mapping each (unique) account in ``addresses`` to True if it exists, else False
+        """
+        addresses = list(dict.fromkeys(addresses))
+        chain, verified = self.chain, EOSManager._verified_accounts
+        results = {address: True for address in addresses if (chain, address) in verified}
+        # EOS accounts can't be deleted, so once an account has been seen, it's remembered for a while. Only accounts
+        # which exist are cached, so an account created just after a failed check is found on the next attempt.
+        cache_keys = {address: f'{chain}_account_exists:{address}' for address in addresses if address not in results}
+        if len(cache_keys) > 0:
+            cached = cache.get_many(list(cache_keys.values()))
+            results.update({address: True for address, key in cache_keys.items() if cached.get(key)})
+        missing = [address for address in addresses if address not in results]
+
+        if len(missing) == 1:
+            results[missing[0]] = self._account_exists(missing[0])
+        elif len(missing) > 1:
+            self.eos  # Make sure the Cleos instance exists before it's used by multiple threads
+            executor = self._get_executor()
+            futures = {address: executor.submit(self._account_exists, address) for address in missing}
+            results.update({address: f.result() for address, f in futures.items()})
+
+        found = {cache_keys[address]: True for address in missing if results[address]}
+        if len(found) > 0:
+            cache.set_many(found, timeout=self.account_cache_time)
+        our_account = self.coin.our_account
+        if results.get(our_account):
+            verified.add((chain, our_account))
+        return {address: results[address] for address in addresses}
+
+    @classmethod
+    def forget_account(cls, account: str, chain: str = None):
+        """
+        Remove ``account`` from :py:attr:`._verified_accounts` (for every chain, unless ``chain`` is specified), so
+        that it's existence is checked again the next time it's used.
+
+        :param str account: The account username to forget
+        :param str chain:   (optional) Only forget the account on this chain type, e.g. ``eos`` or ``telos``
+        """
+        EOSManager._verified_accounts = {
+            (c, a) for c, a in EOSManager._verified_accounts if a != account or (chain is not None and c != chain)
+        }
+
+    def _account_exists(self, address: str) -> bool:
+        """
+        Returns True if the account ``address`` exists on the network, otherwise False.
+
+        ``get_account`` returns several KB of permissions, resource limits and voter info per account, so the tiny
+        ``get_code_hash`` response is used instead. Nodes which don't have that API (404) are remembered in
+        :py:attr:`._code_hash_support`, and fall back to ``get_account``.
+        """
+        node = self.url
+        if EOSManager._code_hash_support.get(node, True):
             try:
-                acc = self.eos.get_account(address)
-                if 'account_name' not in acc:
-                    log.warning(f'"account_name" not in data returned by eos.get_account("{address}")...')
-                    return False
+                res = self.eos.post('chain.get_code_hash', json=dict(account_name=address))
+                EOSManager._code_hash_support[node] = True
+                return res.get('account_name') == address
             except HTTPError as e:
-                log.info(f'HTTPError while verifying {self.chain.upper()} account "{address}" '
-                         f'- this is probably normal: {str(e)}')
+                if e.response is None or e.response.status_code != 404:
+                    log.info(f'HTTPError while verifying {self.chain.upper()} account "{address}" '
+                             f'- this is probably normal: {str(e)}')
+                    return False
+                log.info('%s API node %s does not support get_code_hash, falling back to get_account',
+                         self.chain.upper(), node)
+                EOSManager._code_hash_support[node] = False
+
+        try:
+            acc = self.eos.get_account(address)
+            if 'account_name' not in acc:
+                log.warning(f'"account_name" not in data returned by eos.get_account("{address}")...')
                 return False
+        except HTTPError as e:
+            log.info(f'HTTPError while verifying {self.chain.upper()} account "{address}" '
+                     f'- this is probably normal: {str(e)}')
+            return False
         return True
 
     def address_valid_ex(self, *addresses: str):
@@ -56,13 +191,14 @@ class EOSManager(BaseManager, EOSMixin):
         Check if one or more account usernames exist on the EOS network. Throws an exception if any do not exist.
 
         A slightly different version of :py:meth:`.address_valid` which raises AccountNotFound with the
-        username that failed the test, instead of simply returning True / False.
+        username that failed the test, instead of simply returning True / False. All of the accounts are looked
+        up at once (see :py:meth:`.address_valid_many`), and an account passed more than once is only looked up once.
 
         :param str addresses: One or more EOS usernames to verify the existence of
         :raises AccountNotFound: When one of the accounts in `addresses` does not exist.
         """
-        for address in addresses:
-            if not self.address_valid(address):
+        for address, exists in self.address_valid_many(*addresses).items():
+            if not exists:
                 raise AccountNotFound(f'The {self.chain.upper()} account "{address}" does not exist...')
         return True
 
@@ -75,23 +211,20 @@ class EOSManager(BaseManager, EOSMixin):
 
         if not empty(memo):
             raise NotImplemented(f'Filtering by memos not implemented yet for {__name__}!')
-        sym = self.symbol
-
-        contract = self.get_contract(sym)
+        sym = self.symbol  # BaseManager already upper cases the symbol
+        contract = self._contract
 
-        bal = self.eos.get_currency_balance(address, code=contract, symbol=sym)
-        if len(bal) < 1:
+        # All balances held on the token's contract are loaded (and cached) at once, so other tokens on the same
+        # contract don't need their own API call.
+        balances = self.get_all_balances(address, contract)
+        if sym not in balances:
             raise TokenNotFound(f'Balance list for {self.chain.upper()} symbol {sym} with '
                                 f'contract {contract} was empty...')
 
-        amt, curr = bal[0].split()
-        amt = Decimal(amt)
-        if curr.upper() != sym:
-            raise CoinHandlerException(f'Expected balance currency of {sym} but got {curr} - aborting')
+        return balances[sym]
 
-        return amt
-
-    def send(self, amount, address, from_address=None, memo=None, trigger_data=None) -> dict:
+    def send(self, amount, address, from_address=None, memo=None, trigger_data=None,
+             skip_balance_check: bool = False) -> dict:
         """
         Send a given ``amount`` of EOS (or a token on EOS) from ``from_address`` to ``address`` with the memo ``memo``.
 
@@ -101,6 +234,8 @@ class EOSManager(BaseManager, EOSMixin):
         :param str address:         Destination EOS account to send the coins/tokens to
         :param str memo:            Memo to send coins/tokens with (default: "")
         :param str from_address:    EOS Account to send from (default: uses Coin.our_account)
+        :param bool skip_balance_check: (default: False) Don't check the sender's balance before sending, e.g. as
+                                    the coins were just issued to it. The chain still rejects an overdrawn transfer.
         :raises AuthorityMissing:   Cannot send because we don't have authority to (missing key etc.)
         :raises AccountNotFound:    The requested account doesn't exist
         :raises NotEnoughBalance:   Sending account/address does not have enough balance to send
@@ -121,29 +256,40 @@ class EOSManager(BaseManager, EOSMixin):
         # Fallback to the coin's `our_account` if `from_address` is not specified
         from_address = self.coin.our_account if not from_address else from_address
 
-        # Some basic sanity checks, e.g. do the from/to account exist? validate/cast the sending amount
-        self.address_valid_ex(from_address, address)
+        # Grab the coin's symbol and find it's contract account
+        sym = self.symbol
+        contract = self._contract
+
+        # Checks which don't need the network are ran first, so a bad amount, or a missing private key for the
+        # sender, fails before making any API calls. The key is cached, so build_tx doesn't look it up again.
         memo = "" if empty(memo) else memo
-        amount = self.validate_amount(amount=amount, from_account=from_address)
+        amount = self.validate_amount(amount=amount)
+        self.get_privkey(from_address, key_types=['active'])
 
-        # Grab the coin's symbol and find it's contract account
-        sym, contract = self.symbol, self.get_contract(self.symbol)
+        # Some basic sanity checks, e.g. do the from/to account exist, and does the sender have enough balance?
+        # The account lookups and the balance lookup don't depend on each other, so they're all sent in parallel.
+        self.eos  # Make sure the Cleos instance exists before it's used by multiple threads
+        f_balance = None if skip_balance_check else self._get_executor().submit(self.balance, from_address)
+        self.address_valid_ex(from_address, address)
+        if f_balance is not None:
+            our_bal = f_balance.result()
+            if amount > our_bal:
+                raise NotEnoughBalance(f'Account {from_address} has {our_bal} {sym} but needs {amount} to send...')
 
         # Craft the transaction arguments for the transfer operation, then broadcast it and get the result
-        precision = self.settings[self.symbol].get('precision', 4)
-        amt = f"{amount:.{precision}f} {sym}"
+        amt = self._quantity_format.format(amount)
         tx_args = {"from": from_address, "to": address, "quantity": amt, "memo": memo}
         tfr = self.build_tx("transfer", contract, from_address, tx_args)
 
         # Some of the important data, e.g. how much was actually sent, is buried in the processed>action_traces
         tx_output = tfr['processed']['action_traces'][0]['act']['data']
-        tx_amt_final = Decimal(tx_output['quantity'].split()[0])
+        tx_amt_final = quantity_amount(tx_output['quantity'])
 
         return {
             'txid': tfr['transaction_id'],
             'coin': self.orig_symbol,
             'amount': tx_amt_final,
-            'fee': Decimal(0),
+            'fee': ZERO,
             'from': from_address,
             'send_type': 'send'
         }
@@ -180,15 +326,58 @@ class EOSManager(BaseManager, EOSMixin):
                 "permission": key_type
             }]
         }
-        tx_bin = self.eos.abi_json_to_bin(payload['account'], payload['name'], tx_args)
-        payload['data'] = tx_bin['binargs']
+        payload['data'] = self.serialize_action(contract, tx_type, tx_args)
         trx = dict(actions=[payload])
-        log.debug(f'Full {self.chain.upper()} payload: {trx} Tx Bin: {tx_bin}')
-        trx['expiration'] = str((datetime.utcnow() + timedelta(seconds=60)).replace(tzinfo=pytz.UTC))
+        log.debug(f'Full {self.chain.upper()} payload: {trx}')
+        # Formatted directly as an ISO8601 UTC timestamp, rather than building a tz-aware datetime just to str() it
+        trx['expiration'] = (datetime.utcnow() + timedelta(seconds=60)).strftime('%Y-%m-%dT%H:%M:%S+00:00')
         # Sign and broadcast the transaction we've just built
         tfr = self.eos.push_transaction(trx, priv_key, broadcast=broadcast)
+        if broadcast:
+            # The sender's and receiver's balances have changed, so they mustn't be served from the cache any more
+            self.clear_balance_cache(contract, sender, tx_args.get('to'))
         return tfr
 
+    def get_abi(self, contract: str) -> Optional[dict]:
+        """
+        Get the ABI of the contract account ``contract``, cached for :py:attr:`.abi_cache_time` seconds.
+
+        :param str contract: The contract account, e.g. ``eosio.token``
+        :return dict abi:    The ``abi`` from ``chain.get_abi``, or ``None`` if the ABI couldn't be loaded
+        """
+        cache_key = f'{self.chain}_abi:{contract}'
+        abi = cache.get(cache_key)
+        if abi is None:
+            try:
+                abi = self.eos.post('chain.get_abi', json=dict(account_name=contract)).get('abi') or {}
+            except HTTPError as e:
+                log.warning('Failed to load the ABI of %s contract %s: %s', self.chain.upper(), contract, str(e))
+                return None
+            cache.set(cache_key, abi, timeout=self.abi_cache_time)
+        return abi if len(abi) > 0 else None
+
+    def serialize_action(self, contract: str, action: str, args: dict) -> str:
+        """
+        Serialize the arguments ``args`` for the action ``action`` on ``contract``, returning the hex ``binargs``.
+
+        The arguments are packed locally by :class:`.AbiSerializer`, using the contract's cached ABI (see
+        :py:meth:`.get_abi`), so sending a TX doesn't need an extra API call. If the ABI can't be loaded, or uses a
+        type the serializer doesn't support, this falls back to the node's ``abi_json_to_bin``.
+
+        :param str contract: The contract account, e.g. ``eosio.token``
+        :param str action:   The contract action, e.g. ``transfer``
+        :param dict args:    The action arguments
+        :return str binargs: The serialized action arguments, as a hex string
+        """
+        abi = self.get_abi(contract)
+        if abi is not None:
+            try:
+                return AbiSerializer(abi).action_to_bin(action, args)
+            except (KeyError, TypeError, ValueError, struct.error) as e:
+                log.warning('Could not serialize %s::%s locally, falling back to abi_json_to_bin. Reason: %s %s',
+                            contract, action, type(e), str(e))
+        return self.eos.abi_json_to_bin(contract, action, args)['binargs']
+
     @classmethod
     def get_privkey(cls, from_account: str, key_types: list = None) -> Tuple[str, str]:
         """
@@ -217,16 +406,95 @@ class EOSManager(BaseManager, EOSMixin):
         """
 
         key_types = ['active', 'owner'] if key_types is None else key_types
-
-        kp = CryptoKeyPair.objects.filter(network=cls.chain_type, account=from_account, key_type__in=key_types)
-        if len(kp) < 1:
+        cache_key = (cls.chain_type, from_account, tuple(sorted(key_types)))
+        # Decrypted keys are kept in memory, so the DB query and decryption only happen on the first call
+        with EOSManager._key_lock:
+            if cache_key in EOSManager._key_cache:
+                return EOSManager._key_cache[cache_key]
+
+        kp = CryptoKeyPair.objects.filter(network=cls.chain_type, account=from_account, key_type__in=key_types)\
+            .values_list('key_type', 'private_key').first()
+        if kp is None:
             raise AuthorityMissing(f'No private key found for {cls.chain.upper()} '
                                    f'account {from_account} matching types: {key_types}')
 
         # Grab the first key pair we've found, and decrypt the private key into plain text
-        priv_key = decrypt_str(kp[0].private_key)
+        key_type, priv_key = kp[0], decrypt_str(kp[1])
+
+        with EOSManager._key_lock:
+            EOSManager._key_cache[cache_key] = key_type, priv_key
+        return key_type, priv_key
+
+    @classmethod
+    def prefetch_keys(cls, accounts: Iterable[str], key_types: list = None) -> int:
+        """
+        Load and decrypt the private keys of every account in ``accounts`` with a single DB query, caching them for
+        :py:meth:`.get_privkey`. Intended to be called before sending from several different accounts at once, e.g.
+
+            >>> EOSManager.prefetch_keys(['someguy12333', 'steemenginex'], key_types=['active'])
+            2
+
+        Accounts which are already cached (for the same ``key_types``) are skipped. Accounts without a matching key
+        pair are also skipped, so :py:meth:`.get_privkey` will still raise AuthorityMissing for them.
 
-        return kp[0].key_type, priv_key
+        :param accounts:         The EOS accounts to load the private keys for
+        :param list key_types:   (optional) A list() of key types to search for. Default: ['active', 'owner']
+        :return int loaded:      The amount of accounts whose keys were loaded into the cache
+        """
+        key_types = ['active', 'owner'] if key_types is None else key_types
+        sorted_types = tuple(sorted(key_types))
+        with EOSManager._key_lock:
+            missing = {a for a in accounts if (cls.chain_type, a, sorted_types) not in EOSManager._key_cache}
+        if len(missing) == 0:
+            return 0
+
+        # Same as get_privkey, the first matching key pair (by ID) is used for each account
+        rows = CryptoKeyPair.objects.filter(network=cls.chain_type, account__in=missing, key_type__in=key_types)\
+            .order_by('pk').values_list('account', 'key_type', 'private_key')
+        found = {}
+        for account, key_type, priv_key in rows:
+            if account not in found:
+                found[account] = key_type, priv_key
+
+        keys = {(cls.chain_type, a, sorted_types): (kt, decrypt_str(pk)) for a, (kt, pk) in found.items()}
+        with EOSManager._key_lock:
+            EOSManager._key_cache.update(keys)
+        return len(keys)
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Returns the small thread pool shared by all EOS managers for independent RPC calls, creating it if needed"""
+        with EOSManager._executor_lock:
+            if EOSManager._executor is None:
+                EOSManager._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='eos-manager')
+            return EOSManager._executor
+
+    @classmethod
+    def clear_key_cache(cls):
+        """
+        Drop every ``(chain_type, account, key_types)`` entry from :py:attr:`._key_cache`, for all EOS based chains
+        (e.g. both ``eos`` and ``telos``, as Telos shares this cache), so the next :py:meth:`.get_privkey` call for
+        any account decrypts it's key from the database again.
+
+        Used when an existing ``CryptoKeyPair`` is edited, as it's account may have changed, so we can't tell which
+        entries are stale. To only drop one account's keys, use :py:meth:`.invalidate_privkey` instead.
+        """
+        with EOSManager._key_lock:
+            EOSManager._key_cache.clear()
+
+    @classmethod
+    def invalidate_privkey(cls, account: str, network: str = None):
+        """
+        Drop only the cached private keys of ``account`` (optionally only for the network ``network``, e.g. ``eos``)
+        from :py:attr:`._key_cache`, e.g. after one of it's keys was rotated. Other accounts' keys stay cached.
+
+        :param str account: The account whose cached keys should be removed
+        :param str network: (optional) Only remove keys for this chain type, e.g. ``eos`` or ``telos``
+        """
+        with EOSManager._key_lock:
+            stale = [k for k in EOSManager._key_cache if k[1] == account and (network is None or k[0] == network)]
+            for k in stale:
+                del EOSManager._key_cache[k]
 
     def validate_amount(self, amount: Union[Decimal, float, str], from_account: str = None) -> Decimal:
         """
@@ -256,12 +524,15 @@ class EOSManager(BaseManager, EOSMixin):
 
         # If we get passed a float for some reason, make sure we trim it to the token's precision before
         # converting it to a Decimal.
-        if type(amount) == float:
-            amount = ('{0:.' + self.settings[self.symbol].get('precision', 4) + 'f}').format(amount)
+        # Amounts which are already a Decimal are used as-is, rather than being re-parsed by Decimal()
+        if not isinstance(amount, Decimal):
+            if isinstance(amount, float):
+                precision = int(self.settings[symbol].get('precision', 4))
+                amount = f'{amount:.{precision}f}'
+            amount = Decimal(amount)
 
-        amount = Decimal(amount)
-        if amount < Decimal('0.0001'):
-            raise ArithmeticError(f'Amount {amount} is lower than minimum of 0.0001 {self.symbol}, cannot send.')
+        if amount < MIN_AMOUNT:
+            raise ArithmeticError(f'Amount {amount} is lower than minimum of {MIN_AMOUNT} {symbol}, cannot send.')
 
         if from_account is not None:
             our_bal = self.balance(from_account)
@@ -273,54 +544,75 @@ class EOSManager(BaseManager, EOSMixin):
     def issue(self, amount: Decimal, address: str, memo: str = None, trigger_data=None):
         acc = self.coin.our_account
 
-        # Some basic sanity checks, e.g. do the from/to account exist? validate/cast the sending amount
-        self.address_valid_ex(acc, address)
+        # Some basic sanity checks, e.g. validate/cast the sending amount, then do the from/to account exist?
         memo = "" if empty(memo) else memo
         # Note: since we're issuing, no from_account kwarg to avoid NotEnoughBalance exceptions
         amount = self.validate_amount(amount=amount)
+        # Both accounts are checked with one (parallel) lookup. When issuing to ourselves (e.g. send_or_issue),
+        # they're the same account, so it's only looked up once - and it's usually still cached from send().
+        self.address_valid_ex(acc, address)
 
         # Grab the coin's symbol and find it's contract account
-        sym, contract = self.symbol, self.get_contract(self.symbol)
+        sym = self.symbol
+        contract = self._contract
 
         # Craft the transaction arguments for the issue operation, then broadcast it and get the result
-        precision = self.settings[self.symbol].get('precision', 4)
-        amt = f"{amount:.{precision}f} {sym}"
+        amt = self._quantity_format.format(amount)
         tx_args = {"to": address, "quantity": amt, "memo": memo}
         tfr = self.build_tx("issue", contract, acc, tx_args)
 
         # Some of the important data, e.g. how much was actually sent, is buried in the processed>action_traces
         tx_output = tfr['processed']['action_traces'][0]['act']['data']
-        tx_amt_final = Decimal(tx_output['quantity'].split()[0])
+        tx_amt_final = quantity_amount(tx_output['quantity'])
 
         return {
             'txid': tfr['transaction_id'],
             'coin': sym,
             'amount': tx_amt_final,
-            'fee': Decimal(0),
+            'fee': ZERO,
             'from': acc,
             'send_type': 'issue'
         }
 
     def send_or_issue(self, amount, address, memo=None, trigger_data=None) -> dict:
+        acc = self.coin.our_account
+        amount = self.validate_amount(amount=amount)
+        # Check our (cached) balance first, so that when we need to issue, we go straight to issuing - rather than
+        # running through send()'s checks just to have it raise NotEnoughBalance.
+        try:
+            our_bal = self.balance(acc)
+        except TokenNotFound:
+            our_bal = ZERO
+        if amount > our_bal:
+            return self._issue_and_send(amount, address, memo=memo, trigger_data=trigger_data)
         try:
             log.debug(f'Attempting to send {amount} {self.symbol} to {address} ...')
             return self.send(amount=amount, address=address, memo=memo, trigger_data=trigger_data)
         except NotEnoughBalance:
-            acc = self.coin.our_account
-            log.debug(f'Not enough balance. Issuing {amount} {self.symbol} to our account {acc} ...')
-
-            # Issue the coins to our own account, and then send them. This prevents problems caused when issuing
-            # directly to third parties.
-            self.issue(
-                amount=amount, address=acc, memo=f"Issuing to self before transfer to {address}",
-                trigger_data=trigger_data
-            )
-
-            log.debug(f'Sending newly issued coins: {amount} {self.symbol} to {address} ...')
-            tx = self.send(amount=amount, address=address, memo=memo, from_address=acc, trigger_data=trigger_data)
-            # So the calling function knows we had to issue these coins, we change the send_type back to 'issue'
-            tx['send_type'] = 'issue'
-            return tx
+            # The cached balance may have been out of date, e.g. if another TX was sent in the meantime.
+            return self._issue_and_send(amount, address, memo=memo, trigger_data=trigger_data)
+
+    def _issue_and_send(self, amount: Decimal, address: str, memo=None, trigger_data=None) -> dict:
+        """Issue ``amount`` to our own account, then send it to ``address``. Used by :py:meth:`.send_or_issue`"""
+        acc = self.coin.our_account
+        log.debug(f'Not enough balance. Issuing {amount} {self.symbol} to our account {acc} ...')
+
+        # Issue the coins to our own account, and then send them. This prevents problems caused when issuing
+        # directly to third parties.
+        self.issue(
+            amount=amount, address=acc, memo=f"Issuing to self before transfer to {address}",
+            trigger_data=trigger_data
+        )
+
+        log.debug(f'Sending newly issued coins: {amount} {self.symbol} to {address} ...')
+        # We've just issued the amount to ourselves, so there's no need to look up our balance again.
+        tx = self.send(
+            amount=amount, address=address, memo=memo, from_address=acc, trigger_data=trigger_data,
+            skip_balance_check=True
+        )
+        # So the calling function knows we had to issue these coins, we change the send_type back to 'issue'
+        tx['send_type'] = 'issue'
+        return tx
 
 
 
@@ -16,8 +16,15 @@
 
 """
 import logging
+from decimal import Decimal
+from threading import Lock
 from typing import Dict, Any, List, Optional
 
+from django.core.cache import cache
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from payments.coin_handlers.base import SettingsMixin
 from eospy.cleos import Cleos
 
@@ -27,6 +34,80 @@ from steemengine.helpers import empty
 
 log = logging.getLogger(__name__)
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    log.debug('orjson is not installed, falling back to the standard library json module for EOS API responses')
+    from json import loads as json_loads
+
+_http_session = None  # type: Optional[Session]
+_http_session_lock = Lock()
+
+
+def quantity_amount(quantity: str) -> Decimal:
+    """
+    Returns the amount of an EOS asset string as a Decimal, e.g. ``quantity_amount('1.2345 EOS') == Decimal('1.2345')``
+
+    Uses :py:meth:`str.partition` rather than ``split()[0]``, so no intermediary list is built.
+    """
+    return Decimal(quantity.partition(' ')[0])
+
+
+def get_http_session() -> Session:
+    """
+    Returns the keep-alive :class:`requests.Session` shared by every EOS/Telos API client, creating it on first use.
+
+    Connections (and their TLS sessions) are pooled per API node, so repeated calls don't pay for a new TCP/TLS
+    handshake each time. Connection failures are retried up to 3 times with a short backoff - as urllib3 doesn't
+    retry POST requests which were already sent, this can't cause a transaction to be pushed twice.
+    """
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            s = Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=Retry(total=3, backoff_factor=0.2))
+            s.mount('http://', adapter)
+            s.mount('https://', adapter)
+            _http_session = s
+        return _http_session
+
+
+class SessionCleos(Cleos):
+    """
+    A small extension of :class:`eospy.cleos.Cleos` which sends it's API requests through the shared, pooled
+    :class:`requests.Session` from :func:`.get_http_session`, rather than the module-level ``requests.get/post``
+    (which open a new connection for every single call).
+
+        >>> eos = SessionCleos(url='https://eos.greymass.com')
+        >>> eos.get_info()['head_block_num']
+        123456789
+    """
+
+    def __init__(self, url='http://localhost:8888', version='v1', session: Session = None):
+        super().__init__(url=url, version=version)
+        self.api_url, self.api_version = url, version
+        self.session = get_http_session() if session is None else session
+
+    def get(self, func='', **kwargs):
+        return self._request('GET', func, **kwargs)
+
+    def post(self, func='', **kwargs):
+        return self._request('POST', func, **kwargs)
+
+    def _request(self, method: str, func: str, params=None, json=None, data=None, timeout=30):
+        """
+        Send a request for the API function ``func`` (e.g. ``chain.get_info``) and return the decoded JSON response.
+
+        Responses such as ``history.get_actions`` can be very large, so the raw body is decoded with ``orjson``
+        (when installed), which is several times faster than the standard library.
+
+        :raises requests.exceptions.HTTPError: Raised if the API node returned a non-2xx response
+        """
+        url = '{}/{}/{}'.format(self.api_url, self.api_version, func.replace('.', '/'))
+        r = self.session.request(method, url, params=params, json=json, data=data, timeout=timeout)
+        r.raise_for_status()
+        return json_loads(r.content)
+
 
 class EOSMixin(SettingsMixin):
     """
@@ -103,8 +184,14 @@ class EOSMixin(SettingsMixin):
     _eos = None   # type: Cleos
     """Shared instance of :py:class:`eospy.cleos.Cleos` used across both the loader/manager."""
     
+    _url_clients = {}   # type: Dict[str, Cleos]
+    """Maps API node URLs to shared :py:class:`eospy.cleos.Cleos` instances, see :py:meth:`.eos_for`"""
+
     current_rpc: Optional[str]
     """Contains the current EOS API node as a string"""
+
+    balance_cache_time = 10
+    """Amount of seconds to cache an account's token balances for, see :py:meth:`.get_all_balances`"""
     
     def __init__(self):
         self.current_rpc = None
@@ -163,7 +250,7 @@ class EOSMixin(SettingsMixin):
         if not self._eos:
             log.debug(f'Creating Cleos instance using {self.chain.upper()} API node: {self.url}')
             self.current_rpc = self.url
-            self._eos = Cleos(url=self.url)
+            self._eos = self.shared_client(self.url)
         return self._eos
     
     def replace_eos(self, **conn) -> Cleos:
@@ -188,10 +275,40 @@ class EOSMixin(SettingsMixin):
         url = self._make_url(**conn)
         log.debug('Replacing Cleos instance with new %s API node: %s', self.chain.upper(), url)
         self.current_rpc = url
-        self._eos = Cleos(url=url)
+        self._eos = SessionCleos(url=url)
         
         return self._eos
     
+    def eos_for(self, url: str = None) -> Cleos:
+        """
+        Returns a shared :class:`.Cleos` instance for the API node ``url`` (or :py:attr:`.eos` if ``url`` is empty).
+
+        Unlike :py:meth:`.replace_eos`, this doesn't swap out the instance used by the rest of the class, so it's safe
+        to use when loading data from several API nodes, e.g. for tokens which have their own ``host`` setting.
+
+        :param str url: An API node URL, e.g. as generated by :py:meth:`._make_url`
+        :return Cleos eos: A :class:`.Cleos` instance for the given URL
+        """
+        if empty(url):
+            return self.eos
+        return self.shared_client(url)
+
+    @classmethod
+    def shared_client(cls, url: str) -> Cleos:
+        """
+        Returns the :class:`.SessionCleos` instance for the API node ``url`` which is shared by every EOS/Telos
+        loader and manager, creating it if needed. As they all use the keep-alive session from
+        :func:`.get_http_session`, a new manager re-uses the connections already open to the node.
+
+        :param str url: An API node URL, e.g. as generated by :py:meth:`._make_url`
+        :return Cleos eos: A :class:`.Cleos` instance for the given URL
+        """
+        client = EOSMixin._url_clients.get(url)
+        if client is None:
+            log.debug('Creating Cleos instance for API node: %s', url)
+            client = EOSMixin._url_clients[url] = SessionCleos(url=url)
+        return client
+
     @property
     def url(self) -> str:
         """Creates a URL from the host settings on the EOS coin"""
@@ -245,7 +362,7 @@ class EOSMixin(SettingsMixin):
         """
 
         symbol = symbol.upper()
-        log.debug(f'Attempting to find {self.chain.upper()} contract for "{symbol}" in DB Coin settings')
+        log.debug('Attempting to find %s contract for "%s" in DB Coin settings', self.chain.upper(), symbol)
 
         try:
             contract = self.settings[symbol].get('contract')
@@ -266,3 +383,37 @@ class EOSMixin(SettingsMixin):
         except (AttributeError, MissingTokenMetadata):
             log.error(f'Failed to find a contract for "{symbol}" in Coin objects nor default_contracts...')
             raise MissingTokenMetadata(f"Couldn't find '{symbol}' contract in DB coin settings or default_contracts.")
+
+    def get_all_balances(self, account: str, contract: str) -> Dict[str, Decimal]:
+        """
+        Get every balance that ``account`` holds of tokens issued by the contract ``contract``, with a single
+        ``get_table_rows`` call on the contract's ``accounts`` table, rather than one ``get_currency_balance``
+        call per token.
+
+        Balances are cached for :py:attr:`.balance_cache_time` seconds, so tokens sharing a contract (e.g. when
+        checking the health of every coin) only cost one API call. Use :py:meth:`.clear_balance_cache` after
+        anything which changes the balances.
+
+            >>> self.get_all_balances('someguy12333', 'eosio.token')
+            {'EOS': Decimal('1.2345')}
+
+        :param str account:  The account to get the balances of
+        :param str contract: The token contract account, e.g. ``eosio.token``
+        :return dict balances: A dict mapping upper case token symbols to their balance as a Decimal
+        """
+        cache_key = f'{self.chain}_balances:{account}:{contract}'
+        balances = cache.get(cache_key)
+        if balances is None:
+            res = self.eos.post('chain.get_table_rows', params=None, json=dict(
+                code=contract, scope=account, table='accounts', json=True, limit=500
+            ), timeout=30)
+            balances = {}
+            for row in res.get('rows', []):
+                amt, _, curr = row['balance'].partition(' ')
+                balances[curr.upper()] = Decimal(amt)
+            cache.set(cache_key, balances, timeout=self.balance_cache_time)
+        return balances
+
+    def clear_balance_cache(self, contract: str, *accounts: str):
+        """Remove the cached :py:meth:`.get_all_balances` result for each of ``accounts`` on ``contract``"""
+        cache.delete_many([f'{self.chain}_balances:{a}:{contract}' for a in accounts if not empty(a)])
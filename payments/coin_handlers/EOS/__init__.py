@@ -64,9 +64,11 @@ To change the RPC node from the admin panel, simply set the host/port/username/p
 import logging
 from payments.coin_handlers.EOS.EOSLoader import EOSLoader
 from payments.coin_handlers.EOS.EOSManager import EOSManager
-from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
-from payments.models import Coin
+from payments.coin_handlers.base import LazyProvides, register_coin_type
+from payments.models import CryptoKeyPair
 
 log = logging.getLogger(__name__)
 
@@ -85,15 +87,30 @@ def reload():
     global loaded
     loaded = True
 
-    log.debug('Checking if eos is in COIN_TYPES')
-    if 'eos' not in dict(settings.COIN_TYPES):
-        log.debug('eos not in COIN_TYPES, adding it.')
-        settings.COIN_TYPES += (('eos', 'EOS Token',),)
+    # Add the EOS coin type to the admin drop down (if it isn't already)
+    register_coin_type('eos', 'EOS Token')
 
-    # Grab a simple list of coin symbols with the type 'bitcoind' to populate the provides lists.
-    provides = Coin.objects.filter(enabled=True, coin_type='eos').values_list('symbol', flat=True)
+    provides = LazyProvides('eos')
     EOSLoader.provides = provides
     EOSManager.provides = provides
+    # The decrypted private key cache is deliberately kept, as every Coin.save() (e.g. toggling ``funds_low``) reloads
+    # the handlers. Changed or deleted keys are instead dropped from the cache by :func:`._keypair_changed`.
+
+
+@receiver(post_save, sender=CryptoKeyPair)
+@receiver(post_delete, sender=CryptoKeyPair)
+def _keypair_changed(sender, instance: CryptoKeyPair, **kwargs):
+    """
+    Ensure a changed or deleted key isn't still served from the decrypted key cache. As the cache is shared with
+    the EOS-based handlers (e.g. Telos), this applies to a change to any network's keys.
+
+    An edited key may have had it's account changed, so the whole cache is cleared. For an added or deleted key,
+    only that account's cached keys are dropped.
+    """
+    if kwargs.get('created', True):
+        EOSManager.invalidate_privkey(instance.account, network=instance.network)
+    else:
+        EOSManager.clear_key_cache()
 
 
 # Only run the initialisation code once.
@@ -0,0 +1,184 @@
+"""
+A small, pure python serializer for EOS action data, driven by a contract's ABI (as returned by ``chain.get_abi``).
+
+This allows :py:meth:`.EOSManager.build_tx` to pack action arguments (e.g. a token ``transfer``) locally, instead of
+making an ``abi_json_to_bin`` API call for every single transaction.
+
+Only the commonly used built-in types are supported (integers, ``bool``, ``varuint32``, ``string``, ``bytes``,
+``name``, ``symbol``, ``symbol_code``, ``asset``, ``extended_asset``, ``checksum256``), along with arrays (``T[]``),
+optionals (``T?``), type aliases and struct inheritance. Anything else raises :class:`.UnsupportedAbiType`, which
+callers should treat as a signal to fall back to ``abi_json_to_bin``.
+
+    >>> s = AbiSerializer(abi)
+    >>> s.action_to_bin('transfer', {"from": "someguy12333", "to": "steemenginex", "quantity": "1.0000 EOS", "memo": ""})
+    '3021cd2a1eb3e9ad...'
+
+**Copyright**::
+
+    +===================================================+
+    |                 © 2019 Privex Inc.                |
+    |               https://www.privex.io               |
+    +===================================================+
+    |                                                   |
+    |        CryptoToken Converter                      |
+    |                                                   |
+    |        Core Developer(s):                         |
+    |                                                   |
+    |          (+)  Chris (@someguy123) [Privex]        |
+    |                                                   |
+    +===================================================+
+
+"""
+import struct
+from typing import Dict, Any
+
+NAME_CHARS = '.12345abcdefghijklmnopqrstuvwxyz'
+"""The characters allowed in an EOS ``name``, ordered by their 5-bit value"""
+
+_name_values = {c: i for i, c in enumerate(NAME_CHARS)}
+
+_fixed_types = {
+    'bool': '<?', 'uint8': '<B', 'int8': '<b', 'uint16': '<H', 'int16': '<h', 'uint32': '<I', 'int32': '<i',
+    'uint64': '<Q', 'int64': '<q', 'float32': '<f', 'float64': '<d',
+}
+"""Maps fixed size ABI types to their :py:mod:`struct` format"""
+
+
+class UnsupportedAbiType(ValueError):
+    """Raised when an ABI uses a type which :class:`.AbiSerializer` can't serialize"""
+    pass
+
+
+def varuint32(value: int) -> bytes:
+    """Encode ``value`` as a LEB128 ``varuint32``"""
+    value, out = int(value), bytearray()
+    while True:
+        b = value & 0x7f
+        value >>= 7
+        if value:
+            out.append(b | 0x80)
+            continue
+        out.append(b)
+        return bytes(out)
+
+
+def name_to_bin(name: str) -> bytes:
+    """Encode the EOS account/action name ``name`` as it's 8 byte (little endian uint64) binary form"""
+    if len(name) > 13:
+        raise ValueError(f'EOS name "{name}" is longer than 13 characters')
+    value = 0
+    for i, c in enumerate(name):
+        if c not in _name_values:
+            raise ValueError(f'EOS name "{name}" contains the invalid character "{c}"')
+        v = _name_values[c]
+        if i < 12:
+            value |= v << (64 - 5 * (i + 1))
+        elif v > 0x0f:
+            raise ValueError(f'The 13th character of EOS name "{name}" must be one of ".1-5a-j"')
+        else:
+            value |= v
+    return struct.pack('<Q', value)
+
+
+def symbol_code_to_bin(code: str, precision: int = None) -> bytes:
+    """
+    Encode a symbol code (e.g. ``EOS``) as 8 bytes. If ``precision`` is passed, it's used as the first byte (i.e. a
+    ``symbol``), and the code is limited to 7 characters.
+    """
+    if not code or not code.isupper() or not code.isalpha():
+        raise ValueError(f'Invalid EOS symbol code "{code}"')
+    raw = code.encode('ascii')
+    if precision is not None:
+        raw = bytes([int(precision)]) + raw
+    if len(raw) > 8:
+        raise ValueError(f'EOS symbol code "{code}" is too long')
+    return raw.ljust(8, b'\x00')
+
+
+def asset_to_bin(quantity: str) -> bytes:
+    """Encode an asset string such as ``1.2345 EOS`` as an int64 amount followed by it's symbol"""
+    amount, _, code = quantity.strip().partition(' ')
+    whole, _, frac = amount.partition('.')
+    return struct.pack('<q', int(whole + frac)) + symbol_code_to_bin(code.strip(), precision=len(frac))
+
+
+class AbiSerializer:
+    """
+    Serializes action arguments to their binary form, using the structs/types/actions of a contract's ABI dict.
+
+    :param dict abi: The ``abi`` key of a ``chain.get_abi`` response
+    """
+
+    def __init__(self, abi: Dict[str, Any]):
+        self.types = {t['new_type_name']: t['type'] for t in abi.get('types', [])}
+        self.structs = {s['name']: s for s in abi.get('structs', [])}
+        self.actions = {a['name']: a['type'] for a in abi.get('actions', [])}
+
+    def action_to_bin(self, action: str, args: dict) -> str:
+        """
+        Serialize ``args`` for the contract action ``action``
+
+        :param str action: The action name, e.g. ``transfer``
+        :param dict args:  The action arguments, e.g. ``{"from": "a", "to": "b", "quantity": "1.0000 EOS", "memo": ""}``
+        :raises UnsupportedAbiType: The action uses a type which isn't supported
+        :raises KeyError:           The action doesn't exist in the ABI, or a field is missing from ``args``
+        :raises ValueError:         A value couldn't be serialized as it's type (e.g. an invalid name)
+        :return str binargs:        The serialized arguments as a hex string, as ``abi_json_to_bin`` would return
+        """
+        return self.pack(self.actions[action], args).hex()
+
+    def pack(self, type_name: str, value) -> bytes:
+        """Serialize ``value`` as the ABI type ``type_name``"""
+        if type_name.endswith('[]'):
+            inner = type_name[:-2]
+            return varuint32(len(value)) + b''.join(self.pack(inner, v) for v in value)
+        if type_name.endswith('?'):
+            return b'\x00' if value is None else b'\x01' + self.pack(type_name[:-1], value)
+        type_name = self.resolve(type_name)
+        if type_name in self.structs:
+            return self.pack_struct(type_name, value)
+        if type_name in _fixed_types:
+            return struct.pack(_fixed_types[type_name], value if type_name == 'bool' else int(value))
+        if type_name == 'varuint32':
+            return varuint32(value)
+        if type_name == 'string':
+            raw = value.encode('utf-8')
+            return varuint32(len(raw)) + raw
+        if type_name == 'bytes':
+            raw = bytes.fromhex(value)
+            return varuint32(len(raw)) + raw
+        if type_name == 'name':
+            return name_to_bin(value)
+        if type_name == 'asset':
+            return asset_to_bin(value)
+        if type_name == 'extended_asset':
+            return asset_to_bin(value['quantity']) + name_to_bin(value['contract'])
+        if type_name == 'symbol':
+            precision, _, code = value.partition(',')
+            return symbol_code_to_bin(code, precision=int(precision))
+        if type_name == 'symbol_code':
+            return symbol_code_to_bin(value)
+        if type_name == 'checksum256':
+            raw = bytes.fromhex(value)
+            if len(raw) != 32:
+                raise ValueError(f'checksum256 "{value}" is not 32 bytes')
+            return raw
+        raise UnsupportedAbiType(f'Cannot serialize the ABI type "{type_name}"')
+
+    def pack_struct(self, struct_name: str, value: dict) -> bytes:
+        """Serialize the dict ``value`` as the struct ``struct_name`` (including the fields of it's base struct)"""
+        s = self.structs[struct_name]
+        out = self.pack_struct(self.resolve(s['base']), value) if s.get('base') else b''
+        for field in s['fields']:
+            if field['type'].endswith('$'):
+                raise UnsupportedAbiType(f'Binary extension field "{field["name"]}" is not supported')
+            out += self.pack(field['type'], value[field['name']])
+        return out
+
+    def resolve(self, type_name: str) -> str:
+        """Follow the ABI's type aliases (e.g. ``account_name`` -> ``name``) to the underlying type"""
+        seen = set()
+        while type_name in self.types and type_name not in seen:
+            seen.add(type_name)
+            type_name = self.types[type_name]
+        return type_name
@@ -4,7 +4,6 @@ from decimal import Decimal, getcontext, ROUND_DOWN
 from typing import Dict, List, Iterable, Generator, Union
 
 import pytz
-from beem.asset import Asset
 from dateutil.parser import parse
 from django.utils import timezone
 
@@ -31,6 +30,7 @@ class HiveLoader(BaseLoader, HiveMixin):
         self.loaded = False
         self._rpc = None
         self._rpcs = {}
+        self._blockchain = None
 
     def list_txs(self, batch=0) -> Generator[dict, None, None]:
         if not self.loaded:
@@ -108,9 +108,9 @@ class HiveLoader(BaseLoader, HiveMixin):
     
         if type(_am) is str:  # Extract and validate asset 'ABC' from '12.345 ABC'
             amt, _symbol = _am.split()
-            _asset = Asset(symbol, steem_instance=self.get_rpc(symbol))
+            _asset = self.get_asset(symbol, symbol)
         else:  # Conv asset ID (e.g. @@000000021) to symbol, i.e. "STEEM"
-            _asset = Asset(_am['nai'], steem_instance=self.get_rpc(symbol))
+            _asset = self.get_asset(_am['nai'], symbol)
             # Convert integer amount/precision to Decimal's, preventing floating point issues
             amt_int = Decimal(_am['amount'])
             amt_prec = Decimal(_am['precision'])
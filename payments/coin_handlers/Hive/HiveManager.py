@@ -25,8 +25,9 @@ class HiveManager(BaseManager, HiveMixin):
 
     def __init__(self, symbol: str):
         super(HiveManager, self).__init__(symbol)
-        self._rpc = self._asset = self._precision = None
+        self._rpc = None
         self._rpcs = {}
+        self._blockchain = None
 
     def health(self) -> Tuple[str, tuple, tuple]:
         """
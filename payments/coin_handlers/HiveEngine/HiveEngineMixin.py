@@ -1,12 +1,154 @@
-from typing import Dict, Any, List, Optional
+import itertools
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Iterator, Union, NamedTuple
+from urllib.parse import urlsplit
+from privex.jsonrpc import SteemEngineRPC
 from privex.steemengine import SteemEngineToken
+from requests.exceptions import RequestException
 
 import logging
 
 from payments.coin_handlers.SteemEngine.SteemEngineMixin import SteemEngineMixin
+from payments.models import Coin
 
 log = logging.getLogger(__name__)
 
+_rpc_cache = {}  # type: Dict[Tuple[str, ...], SteemEngineToken]
+"""
+Maps a tuple of the connection settings to a :class:`.SteemEngineToken` shared by every caller of :func:`.mk_heng_rpc`
+using those settings, so it's HTTP connections are kept alive and re-used.
+"""
+_rpc_cache_lock = threading.Lock()
+
+NODE_COOLDOWN = 10
+"""Seconds a failed ``rpc_node`` is skipped for by :func:`.pick_node`. Doubles per consecutive failure, up to 5 mins"""
+
+_node_lock = threading.Lock()
+_node_cycles = {}  # type: Dict[Tuple[str, ...], Iterator[str]]
+"""Maps a tuple of ``rpc_node`` hostnames to an endless round-robin iterator over them, see :func:`.pick_node`"""
+_node_health = {}  # type: Dict[str, Tuple[float, int]]
+"""Maps ``rpc_node`` hostnames to ``(cooldown_until, consecutive_failures)``, see :func:`.mark_node_failed`"""
+
+
+class NodeSpec(NamedTuple):
+    """The connection details of an ``rpc_node``, see :func:`.parse_node`"""
+    hostname: str
+    port: Optional[int]
+    """The port from the node URL, or ``None`` to use the library's default"""
+    ssl: Optional[bool]
+    """Whether the node URL's scheme was ``https``, or ``None`` if no scheme was given"""
+
+    @property
+    def conn_args(self) -> Dict[str, Any]:
+        """Keyword arguments for :class:`.SteemEngineToken`, only including the port / ssl if they were specified"""
+        args = dict(hostname=self.hostname)
+        if self.port is not None:
+            args['port'] = self.port
+        if self.ssl is not None:
+            args['ssl'] = self.ssl
+        return args
+
+
+@lru_cache(maxsize=128)
+def parse_node(node: str) -> NodeSpec:
+    """
+    Parse an ``rpc_node`` - either a plain hostname, or a URL such as ``https://api.hive-engine.com:443`` - into a
+    :class:`.NodeSpec`. Results are cached, as the same few nodes are parsed each time an RPC instance is needed.
+
+        >>> parse_node('http://localhost:5000')
+        NodeSpec(hostname='localhost', port=5000, ssl=False)
+    """
+    u = urlsplit(node if '://' in node else '//' + node)
+    return NodeSpec(hostname=u.hostname, port=u.port, ssl=None if not u.scheme else u.scheme == 'https')
+
+
+@lru_cache(maxsize=128)
+def _split_node_str(rpc_node: str) -> Tuple[str, ...]:
+    return tuple(n.strip() for n in rpc_node.split(',') if n.strip())
+
+
+def split_nodes(rpc_node: Union[str, List[str]]) -> Tuple[str, ...]:
+    """Convert an ``rpc_node`` setting - a hostname, comma separated hostnames, or a list - into a tuple of nodes"""
+    if isinstance(rpc_node, str):
+        return _split_node_str(rpc_node)
+    return tuple(n.strip() for n in rpc_node if n.strip())
+
+
+def pick_node(nodes: Tuple[str, ...]) -> str:
+    """
+    Returns the next node from ``nodes`` in round-robin order, skipping nodes which have recently failed (see
+    :func:`.mark_node_failed`). If every node is cooling down, the one which recovers first is returned.
+
+    Safe to call from multiple threads at once.
+
+    :param tuple nodes: A tuple of API hostnames, e.g. from :func:`.split_nodes`
+    :return str node:   The hostname to use
+    """
+    if len(nodes) == 1:
+        return nodes[0]
+    now = time.monotonic()
+    with _node_lock:
+        cycle = _node_cycles.get(nodes)
+        if cycle is None:
+            cycle = _node_cycles[nodes] = itertools.cycle(nodes)
+        for _ in range(len(nodes)):
+            node = next(cycle)
+            if _node_health.get(node, (0, 0))[0] <= now:
+                return node
+        return min(nodes, key=lambda n: _node_health.get(n, (0, 0))[0])
+
+
+def mark_node_failed(node: str):
+    """Record a failure for the API node ``node``, so :func:`.pick_node` skips it for a while (exponential backoff)"""
+    with _node_lock:
+        failures = _node_health.get(node, (0, 0))[1] + 1
+        cooldown = min(NODE_COOLDOWN * 2 ** (failures - 1), 300)
+        _node_health[node] = (time.monotonic() + cooldown, failures)
+    log.warning('HiveEngine node %s has failed %d time(s) in a row, skipping it for %d seconds',
+                node, failures, cooldown)
+
+
+def mark_node_ok(node: str):
+    """Clear any failures recorded against the API node ``node`` by :func:`.mark_node_failed`"""
+    if node not in _node_health:   # the common case - avoid taking the lock after every successful request
+        return
+    with _node_lock:
+        _node_health.pop(node, None)
+
+
+class HiveEngineRPC(SteemEngineRPC):
+    """
+    A :class:`privex.jsonrpc.SteemEngineRPC` which reports the outcome of each request to the health tracking for
+    it's node (:func:`.mark_node_ok` / :func:`.mark_node_failed`).
+
+    When a request fails, the :class:`.SteemEngineToken` using this RPC is dropped from :py:attr:`._rpc_cache` and
+    :py:attr:`.failed` is set, so that the next :func:`.mk_heng_rpc` call picks a node again.
+    """
+    
+    def __init__(self, node: str, cache_key: Tuple[str, ...], **kwargs):
+        super().__init__(**kwargs)
+        self.node = node
+        self.cache_key = cache_key
+        self.failed = False
+        """Set to ``True`` once a request has failed, after which this instance shouldn't be re-used"""
+    
+    def _call(self, *args, **kwargs):
+        try:
+            res = super()._call(*args, **kwargs)
+        except (RequestException, ValueError):
+            # Connection errors, timeouts, non-200 responses and invalid JSON. Errors returned inside a valid JSON-RPC
+            # response are raised later by call(), and aren't the node's fault.
+            self.failed = True
+            mark_node_failed(self.node)
+            with _rpc_cache_lock:
+                if getattr(_rpc_cache.get(self.cache_key), 'rpc', None) is self:
+                    del _rpc_cache[self.cache_key]
+            raise
+        mark_node_ok(self.node)
+        return res
+
 
 def mk_heng_rpc(rpc_settings: dict = None, **kwargs) -> SteemEngineToken:
     """
@@ -25,31 +167,51 @@ def mk_heng_rpc(rpc_settings: dict = None, **kwargs) -> SteemEngineToken:
     :param dict rpc_settings:      Specify the settings as a dictionary (same keys as kwargs below)
     :param kwargs:                 Alternatively, specify the settings as keyword args
 
-    :keyword str rpc_node:         The hostname for the contract API server, e.g. ``api.steem-engine.com``
+    :keyword str rpc_node:         The hostname (or URL) for the contract API server, e.g. ``api.steem-engine.com``
     :keyword str rpc_url:          The URL for the contract API e.g. ``/rpc/contracts``
     :keyword str history_node:     The hostname for the history API server, e.g. ``api.steem-engine.com``
     :keyword str history_url:      The URL for the history API e.g. ``accounts/history``
     :keyword str network_account:  The "network account" for SteemEngine, e.g. ``ssc-mainnet1``
     :keyword str network:          Chain to run on (``steem`` or ``hive``)
 
+    Instances are shared between callers using the same settings (see :py:attr:`._rpc_cache`), so that connections
+    to the API servers are re-used rather than re-opened for every loader/manager.
+
+    ``rpc_node`` may also be a list (or comma separated string) of hostnames, in which case each call returns the
+    shared instance for the next node which hasn't recently failed (see :func:`.pick_node`). Every request made by
+    an instance updates it's node's health (see :class:`.HiveEngineRPC`), and a failed request evicts the instance.
+
     :return SteemEngineToken rpc:  An instance of :class:`.SteemEngineToken`
     """
     rpc_settings = {**kwargs} if not rpc_settings else rpc_settings
     
-    rpc_node = rpc_settings.get('rpc_node', 'api.hive-engine.com')
+    nodes = split_nodes(rpc_settings.get('rpc_node', '')) or ('api.hive-engine.com',)
     rpc_url = rpc_settings.get('rpc_url', '/rpc/contracts')
     history_node = rpc_settings.get('history_node', 'accounts.hive-engine.com')
     history_url = rpc_settings.get('history_url', 'accountHistory')
     network_account = rpc_settings.get('network_account', 'ssc-mainnet-hive')
     network = rpc_settings.get('network', 'hive')
     
-    return SteemEngineToken(
-        network_account=network_account,
-        network=network,
-        history_conf=dict(hostname=history_node, url=history_url),
-        hostname=rpc_node,
-        url=rpc_url
-    )
+    rpc_node = pick_node(nodes)
+    key = (rpc_node, rpc_url, history_node, history_url, network_account, network)
+    with _rpc_cache_lock:
+        if key not in _rpc_cache:
+            conn_args = parse_node(rpc_node).conn_args
+            token = SteemEngineToken(
+                network_account=network_account,
+                network=network,
+                history_conf=dict(hostname=history_node, url=history_url),
+                url=rpc_url,
+                **conn_args
+            )
+            token.rpc = HiveEngineRPC(node=rpc_node, cache_key=key, url=rpc_url, **conn_args)
+            _rpc_cache[key] = token
+        return _rpc_cache[key]
+
+
+def rpc_failed(rpc: SteemEngineToken) -> bool:
+    """Returns ``True`` if a request made by ``rpc`` (from :func:`.mk_heng_rpc`) failed, see :class:`.HiveEngineRPC`"""
+    return getattr(rpc.rpc, 'failed', False)
 
 
 class HiveEngineMixin(SteemEngineMixin):
@@ -63,33 +225,32 @@ class HiveEngineMixin(SteemEngineMixin):
     
     @property
     def eng_rpc(self) -> SteemEngineToken:
-        if not self._eng_rpc:
+        if not self._eng_rpc or rpc_failed(self._eng_rpc):
             # Use the symbol of the first coin for our settings.
-            symbol = list(self.all_coins.keys())[0]
-            _settings = self.all_coins[symbol].settings['json']
-            
-            # If you've specified custom RPC nodes in the custom JSON, make a new instance with those
-            # Otherwise, use the global shared_steem_instance.
-            log.info('Getting HiveEngine instance for coin %s - settings: %s', symbol, _settings)
-            
-            self._eng_rpc = mk_heng_rpc(rpc_settings=_settings)
-            self._eng_rpcs[symbol] = self._eng_rpc
+            coin = self._get_coin()
+            self._eng_rpc = self.get_rpc(coin.symbol_id, coin=coin)
         return self._eng_rpc
     
-    def get_rpc(self, symbol: str) -> SteemEngineToken:
+    def get_rpc(self, symbol: str, coin: Coin = None) -> SteemEngineToken:
         """
         Returns a SteemEngineToken instance for querying data and sending TXs.
 
         If a custom RPC config is specified in the Coin "custom json" settings, a new instance will be returned with the
         RPC config specified in the json.
 
+        Instances are remembered per symbol, so the coin's settings are only decoded on the first call. If a request
+        made by the remembered instance fails, a new one is fetched, which may use a different ``rpc_node``.
+
         :param symbol: Coin symbol to get Beem RPC instance for
+        :param coin:   (optional) The :class:`.Coin` for ``symbol``, if the caller already has it
         :return beem.steem.Steem: An instance of :class:`beem.steem.Steem` for querying
         """
-        if symbol not in self._eng_rpcs:
-            _settings = self.all_coins[symbol].settings['json']
-            log.info('Getting HiveEngine instance for coin %s - settings: %s', symbol, _settings)
+        if symbol not in self._eng_rpcs or rpc_failed(self._eng_rpcs[symbol]):
+            coin = self._get_coin(symbol) if coin is None else coin
+            _settings = coin.settings['json']
+            log.info('Getting HiveEngine instance for coin %s - rpc_node: %s', symbol,
+                     _settings.get('rpc_node', 'default'))
+            log.debug('HiveEngine settings for coin %s: %s', symbol, _settings)
             
             self._eng_rpcs[symbol] = mk_heng_rpc(rpc_settings=_settings)
         return self._eng_rpcs[symbol]
-
@@ -29,7 +29,8 @@ can be specified with the same key inside of your ``.env`` file to override the
     =================  ==================================================================================================
     Coin Key           Description
     =================  ==================================================================================================
-    rpc_node           The hostname for the contract API server, e.g. ``api.steem-engine.com``
+    rpc_node           The hostname for the contract API server, e.g. ``api.steem-engine.com``. May be a list (or
+                       comma separated) of hostnames, which are used in turn - skipping any which recently failed.
     rpc_url            The URL for the contract API e.g. ``/rpc/contracts``
     history_node       The hostname for the history API server, e.g. ``api.steem-engine.com``
     history_url        The URL for the history API e.g. ``accounts/history``
@@ -71,9 +72,9 @@ can be specified with the same key inside of your ``.env`` file to override the
 import logging
 from payments.coin_handlers.HiveEngine.HiveEngineLoader import HiveEngineLoader
 from payments.coin_handlers.HiveEngine.HiveEngineManager import HiveEngineManager
-from django.conf import settings
 
-from payments.models import Coin
+
+from payments.coin_handlers.base import LazyProvides, register_coin_type
 
 log = logging.getLogger(__name__)
 
@@ -92,13 +93,11 @@ def reload():
     global loaded
     loaded = True
     
-    log.debug('Checking if hiveengine is in COIN_TYPES')
-    if 'hiveengine' not in dict(settings.COIN_TYPES):
-        log.debug('steemengine not in COIN_TYPES, adding it.')
-        settings.COIN_TYPES += (('hiveengine', 'HiveEngine Token',),)
+    # Add the HiveEngine coin type to the admin drop down (if it isn't already)
+    register_coin_type('hiveengine', 'HiveEngine Token')
     
-    # Grab a simple list of coin symbols with the type 'bitcoind' to populate the provides lists.
-    provides = Coin.objects.filter(enabled=True, coin_type='hiveengine').values_list('symbol', flat=True)
+    # Symbols are only loaded when first read, see :class:`.LazyProvides`
+    provides = LazyProvides('hiveengine')
     HiveEngineLoader.provides = provides
     HiveEngineManager.provides = provides
 
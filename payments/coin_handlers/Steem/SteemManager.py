@@ -70,8 +70,9 @@ class SteemManager(BaseManager, SteemMixin):
 
     def __init__(self, symbol: str):
         super(SteemManager, self).__init__(symbol)
-        self._rpc = self._asset = self._precision = None
+        self._rpc = None
         self._rpcs = {}
+        self._blockchain = None
 
     def health(self) -> Tuple[str, tuple, tuple]:
         """
@@ -1,4 +1,5 @@
-from typing import Optional, Dict
+import threading
+from typing import Optional, Dict, Tuple
 
 from beem.asset import Asset
 from beem.blockchain import Blockchain
@@ -47,6 +48,17 @@ class SteemMixin(SettingsMixin):
     For **additional settings**, please see the module docstring in :py:mod:`coin_handlers.Steem`
 
     """
+    _shared_rpcs = {}  # type: Dict[Tuple[Tuple[str, ...], str], Steem]
+    """
+    Maps ``(rpc_nodes, pass_store)`` to a Steem instance shared across instances, see :py:meth:`.shared_rpc`.
+    Sub-classes for other chains should define their own dict, so their instances aren't mixed up with Steem's.
+    """
+
+    _shared_lock = threading.Lock()
+
+    _shared_assets = {}  # type: Dict[Tuple[Steem, str], Asset]
+    """Maps ``(steem_instance, asset_id)`` to an Asset shared across instances, see :py:meth:`.get_asset`"""
+
     def __init__(self, *args, **kwargs):
 
         self._rpc = None
@@ -54,25 +66,17 @@ class SteemMixin(SettingsMixin):
         # List of Steem instances mapped by symbol
         self._rpcs = {}   # type: Dict[str, Steem]
 
-        # Internal storage variables for the properties ``asset`` and ``precisions``
-        self._asset = self._precision = None
+        # The Blockchain for ``self.rpc``, see :py:attr:`.blockchain`
+        self._blockchain = None  # type: Optional[Tuple[Steem, Blockchain]]
         super(SteemMixin, self).__init__(*args, **kwargs)
 
     @property
     def rpc(self) -> Steem:
         if not self._rpc:
             # Use the symbol of the first coin for our settings.
-            symbol = list(self.all_coins.keys())[0]
-            settings = self.all_coins[symbol].settings['json']
-            rpcs = settings.get('rpcs')
-
-            # If you've specified custom RPC nodes in the custom JSON, make a new instance with those
-            # Otherwise, use the global shared_steem_instance.
-            rpc_conf = dict(num_retries=5, num_retries_call=3, timeout=20, node=rpcs, custom_chains=custom_chains)
-            log.info('Getting Beem instance for coin %s - settings: %s', symbol, rpc_conf)
-
-            self._rpc = shared_steem_instance() if empty(rpcs, itr=True) else Steem(**rpc_conf)  # type: Steem
-            self._rpc.set_password_storage(settings.get('pass_store', 'environment'))
+            coin = self._get_coin()
+            symbol = coin.symbol_id
+            self._rpc = self._make_rpc(symbol, coin.settings['json'])
             self._rpcs[symbol] = self._rpc
         return self._rpc
 
@@ -80,40 +84,105 @@ class SteemMixin(SettingsMixin):
         """
         Returns a Steem instance for querying data and sending TXs. By default, uses the Beem shared_steem_instance.
 
-        If a custom RPC list is specified in the Coin "custom json" settings, a new instance will be returned with the
-        RPCs specified in the json.
+        If a custom RPC list is specified in the Coin "custom json" settings, a shared instance using the RPCs
+        specified in the json will be returned (see :py:meth:`.shared_rpc`).
 
         :param symbol: Coin symbol to get Beem RPC instance for
         :return beem.steem.Steem: An instance of :class:`beem.steem.Steem` for querying
         """
         if symbol not in self._rpcs:
-            settings = self.settings[symbol]['json']
-            rpcs = settings.get('rpcs')
-            rpc_conf = dict(num_retries=5, num_retries_call=3, timeout=20, node=rpcs, custom_chains=custom_chains)
-            log.info('Getting Beem instance for coin %s - settings: %s', symbol, rpc_conf)
-            self._rpcs[symbol] = self.rpc if empty(rpcs, itr=True) else Steem(**rpc_conf)
-            self._rpcs[symbol].set_password_storage(settings.get('pass_store', 'environment'))
+            self._rpcs[symbol] = self._make_rpc(symbol, self.settings[symbol]['json'])
         return self._rpcs[symbol]
 
+    def _rpc_conf(self, coin_json: dict) -> Tuple[dict, str]:
+        """
+        Returns a tuple of the Steem kwargs and password storage to use for a coin, from it's custom json settings.
+        Sub-classes for other Graphene chains (e.g. :class:`.HiveMixin`) override this to change the defaults.
+
+        :param dict coin_json: The ``json`` key from a coin's settings
+        :return tuple conf:    ``(rpc_conf: dict, pass_store: str)`` - ``rpc_conf['node']`` may be empty
+        """
+        rpc_conf = dict(
+            num_retries=5, num_retries_call=3, timeout=20, node=coin_json.get('rpcs'), custom_chains=custom_chains
+        )
+        return rpc_conf, coin_json.get('pass_store', 'environment')
+
+    def _make_rpc(self, symbol: str, coin_json: dict) -> Steem:
+        """Returns the Steem instance to use for the coin ``symbol``, with the custom json settings ``coin_json``"""
+        rpc_conf, pass_store = self._rpc_conf(coin_json)
+        log.info('Getting Beem instance for coin %s - settings: %s', symbol, rpc_conf)
+        # If you've specified custom RPC nodes in the custom JSON, use a (shared) instance with those
+        # Otherwise, use the global shared_steem_instance.
+        if empty(rpc_conf['node'], itr=True):
+            rpc = shared_steem_instance()  # type: Steem
+            rpc.set_password_storage(pass_store)
+            return rpc
+        return self.shared_rpc(pass_store, **rpc_conf)
+
+    @classmethod
+    def shared_rpc(cls, pass_store: str, **rpc_conf) -> Steem:
+        """
+        Returns a Steem instance for the given ``rpc_conf`` (which must include ``node``), shared by every
+        Loader/Manager instance using the same RPC nodes and password storage, so that each node list is only
+        connected to (and has it's chain properties loaded) once per process.
+
+        :param str pass_store: The beem password storage to use, e.g. ``environment``
+        :param rpc_conf:       Keyword arguments to pass to :class:`beem.steem.Steem`
+        :return beem.steem.Steem: A shared instance of :class:`beem.steem.Steem`
+        """
+        nodes = rpc_conf['node']
+        key = (tuple([nodes] if isinstance(nodes, str) else nodes), pass_store)
+        with SteemMixin._shared_lock:
+            if key not in cls._shared_rpcs:
+                rpc = Steem(**rpc_conf)
+                rpc.set_password_storage(pass_store)
+                cls._shared_rpcs[key] = rpc
+            return cls._shared_rpcs[key]
+
     @property
-    def asset(self, symbol=None) -> Optional[Asset]:
-        """Easy reference to the Beem Asset object for our current symbol"""
-        if not self._asset:
-            if empty(symbol):
-                if not hasattr(self, 'symbol'):
-                    return None
-                symbol = self.symbol
-            self._asset = Asset(symbol, steem_instance=self.rpc)
-        return self._asset
+    def blockchain(self) -> Blockchain:
+        """
+        Returns a :class:`beem.blockchain.Blockchain` for :py:attr:`.rpc`, which is re-used until :py:attr:`.rpc`
+        is replaced by a different Steem instance.
+        """
+        rpc = self.rpc
+        if self._blockchain is None or self._blockchain[0] is not rpc:
+            self._blockchain = (rpc, Blockchain(steem_instance=rpc, mode='head'))
+        return self._blockchain[1]
+
+    def get_asset(self, asset_id: str, symbol: str = None) -> Asset:
+        """
+        Returns a :class:`beem.asset.Asset` for ``asset_id`` - either a symbol such as ``HBD``, or an asset ID such
+        as ``@@000000021`` - using the RPC instance for the coin ``symbol`` (or :py:attr:`.rpc` if not specified).
+
+        As creating an Asset queries the RPC node for it's metadata (e.g. precision), they're cached per RPC instance
+        and asset ID, and shared by every Loader/Manager instance.
+
+        :param str asset_id: The asset symbol or NAI to look up
+        :param str symbol:   The coin symbol whose RPC instance should be used (see :py:meth:`.get_rpc`)
+        :return Asset asset: The (possibly cached) Asset object
+        """
+        rpc = self.rpc if empty(symbol) else self.get_rpc(symbol)
+        key = (rpc, asset_id)
+        asset = SteemMixin._shared_assets.get(key)
+        if asset is None:
+            asset = Asset(asset_id, steem_instance=rpc)
+            with SteemMixin._shared_lock:
+                asset = SteemMixin._shared_assets.setdefault(key, asset)
+        return asset
 
     @property
-    def precision(self) -> Optional[int]:
+    def asset(self) -> Optional[Asset]:
+        """Easy reference to the Beem Asset object for our current symbol"""
         if not hasattr(self, 'symbol'):
             return None
+        return self.get_asset(self.symbol)
+
+    @property
+    def precision(self) -> Optional[int]:
         """Easy reference to the precision for our current symbol"""
-        if not self._precision:
-            self._precision = int(self.asset.precision)
-        return self._precision
+        asset = self.asset
+        return None if asset is None else int(asset.precision)
 
     def find_steem_tx(self, tx_data, last_blocks=15) -> Optional[dict]:
         """
@@ -127,10 +196,24 @@ class SteemMixin(SettingsMixin):
         :return None:             If the transaction wasn't found, None will be returned.
         """
         # Code taken/based from @holgern/beem blockchain.py
-        chain = Blockchain(steem_instance=self.rpc, mode='head')
+        chain = self.blockchain
         current_num = chain.get_current_block_num()
-        for block in chain.blocks(start=current_num - last_blocks, stop=current_num + 5):
+        # Compare signatures as sets, first rejecting TXs with a different amount of signatures, or which don't
+        # contain one of our signatures, rather than sorting both signature lists for every TX in every block.
+        target_sigs = frozenset(tx_data["signatures"])
+        target_len, first_sig = len(tx_data["signatures"]), next(iter(target_sigs), None)
+        # Rather than one round trip per block, on appbase nodes the blocks are requested in a JSONRPC batch, while
+        # older nodes (which don't support batches) have them fetched concurrently by beem's threaded block loader.
+        start, stop = current_num - last_blocks, current_num + 5
+        if self.rpc.rpc.get_use_appbase():
+            blocks = chain.blocks(start=start, stop=stop, max_batch_size=stop - start)
+        else:
+            blocks = chain.blocks(start=start, stop=stop, threading=True, thread_num=min(8, stop - start))
+        for block in blocks:
             for tx in block.transactions:
-                if sorted(tx["signatures"]) == sorted(tx_data["signatures"]):
+                sigs = tx["signatures"]
+                if len(sigs) != target_len or first_sig not in sigs:
+                    continue
+                if frozenset(sigs) == target_sigs:
                     return tx
         return None
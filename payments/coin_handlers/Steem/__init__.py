@@ -56,9 +56,9 @@ It will automatically handle any :class:`payments.models.Coin` which has it's ty
 """
 from payments.coin_handlers.Steem.SteemLoader import SteemLoader
 from payments.coin_handlers.Steem.SteemManager import SteemManager
-from django.conf import settings
 import logging
-from payments.models import Coin
+
+from payments.coin_handlers.base import LazyProvides, register_coin_type
 
 log = logging.getLogger(__name__)
 
@@ -77,13 +77,11 @@ def reload():
     global loaded
     loaded = True
 
-    log.debug('Checking if steembase is in COIN_TYPES')
-    if 'steembase' not in dict(settings.COIN_TYPES):
-        log.debug('steembase not in COIN_TYPES, adding it.')
-        settings.COIN_TYPES += (('steembase', 'Steem Network (or compatible fork)',),)
+    # Add the Steem coin type to the admin drop down (if it isn't already)
+    register_coin_type('steembase', 'Steem Network (or compatible fork)')
 
-    # Grab a simple list of coin symbols with the type 'bitcoind' to populate the provides lists.
-    provides = Coin.objects.filter(enabled=True, coin_type='steembase').values_list('symbol', flat=True)
+    # Symbols are only loaded when first read, see :class:`.LazyProvides`
+    provides = LazyProvides('steembase')
     SteemLoader.provides = provides
     SteemManager.provides = provides
 
@@ -84,12 +84,15 @@ class SteemEngineMixin(SettingsMixin):
     def eng_rpc(self) -> SteemEngineToken:
         if not self._eng_rpc:
             # Use the symbol of the first coin for our settings.
-            symbol = list(self.all_coins.keys())[0]
-            _settings = self.all_coins[symbol].settings['json']
+            all_coins = self.all_coins
+            symbol = next(iter(all_coins))
+            _settings = all_coins[symbol].settings['json']
         
             # If you've specified custom RPC nodes in the custom JSON, make a new instance with those
             # Otherwise, use the global shared_steem_instance.
-            log.info('Getting SteemEngine instance for coin %s - settings: %s', symbol, _settings)
+            log.info('Getting SteemEngine instance for coin %s - rpc_node: %s', symbol,
+                     _settings.get('rpc_node', 'default'))
+            log.debug('SteemEngine settings for coin %s: %s', symbol, _settings)
             
             self._eng_rpc = mk_seng_rpc(rpc_settings=_settings)
             self._eng_rpcs[symbol] = self._eng_rpc
@@ -107,7 +110,9 @@ class SteemEngineMixin(SettingsMixin):
         """
         if symbol not in self._eng_rpcs:
             _settings = self.all_coins[symbol].settings['json']
-            log.info('Getting SteemEngine instance for coin %s - settings: %s', symbol, _settings)
+            log.info('Getting SteemEngine instance for coin %s - rpc_node: %s', symbol,
+                     _settings.get('rpc_node', 'default'))
+            log.debug('SteemEngine settings for coin %s: %s', symbol, _settings)
 
             self._eng_rpcs[symbol] = mk_seng_rpc(rpc_settings=_settings)
         return self._eng_rpcs[symbol]
@@ -71,9 +71,9 @@ can be specified with the same key inside of your ``.env`` file to override the
 import logging
 from payments.coin_handlers.SteemEngine.SteemEngineLoader import SteemEngineLoader
 from payments.coin_handlers.SteemEngine.SteemEngineManager import SteemEngineManager
-from django.conf import settings
 
-from payments.models import Coin
+
+from payments.coin_handlers.base import LazyProvides, register_coin_type
 
 log = logging.getLogger(__name__)
 
@@ -92,13 +92,11 @@ def reload():
     global loaded
     loaded = True
 
-    log.debug('Checking if steemengine is in COIN_TYPES')
-    if 'steemengine' not in dict(settings.COIN_TYPES):
-        log.debug('steemengine not in COIN_TYPES, adding it.')
-        settings.COIN_TYPES += (('steemengine', 'SteemEngine Token',),)
+    # Add the SteemEngine coin type to the admin drop down (if it isn't already)
+    register_coin_type('steemengine', 'SteemEngine Token')
 
-    # Grab a simple list of coin symbols with the type 'bitcoind' to populate the provides lists.
-    provides = Coin.objects.filter(enabled=True, coin_type='steemengine').values_list('symbol', flat=True)
+    # Symbols are only loaded when first read, see :class:`.LazyProvides`
+    provides = LazyProvides('steemengine')
     SteemEngineLoader.provides = provides
     SteemEngineManager.provides = provides
 
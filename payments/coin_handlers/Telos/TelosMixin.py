@@ -1,6 +1,6 @@
 from typing import Dict, Any, List
 from eospy.cleos import Cleos
-from payments.coin_handlers.EOS.EOSMixin import EOSMixin
+from payments.coin_handlers.EOS.EOSMixin import EOSMixin, SessionCleos
 import logging
 
 from payments.models import Coin
@@ -37,7 +37,7 @@ class TelosMixin(EOSMixin):
         if not self._telos:
             log.debug(f'Creating Cleos instance using Telos API node: {self.url}')
             self.current_rpc = self.url
-            self._telos = Cleos(url=self.url)
+            self._telos = self.shared_client(self.url)
         return self._telos
 
     def replace_eos(self, **conn) -> Cleos:
@@ -62,6 +62,6 @@ class TelosMixin(EOSMixin):
         url = self._make_url(**conn)
         log.debug('Replacing Cleos instance with new Telos API node: %s', url)
         self.current_rpc = url
-        self._telos = Cleos(url=url)
+        self._telos = SessionCleos(url=url)
     
         return self._telos
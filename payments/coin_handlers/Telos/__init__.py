@@ -67,10 +67,9 @@ To change the RPC node from the admin panel, simply set the host/port/username/p
 import logging
 from payments.coin_handlers.Telos.TelosLoader import TelosLoader
 from payments.coin_handlers.Telos.TelosManager import TelosManager
-from django.conf import settings
 
 from payments.coin_handlers.Telos.TelosMixin import TelosMixin
-from payments.models import Coin
+from payments.coin_handlers.base import LazyProvides, register_coin_type
 
 log = logging.getLogger(__name__)
 
@@ -89,13 +88,10 @@ def reload():
     global loaded
     loaded = True
     
-    log.debug(f'Checking if {TelosMixin.chain_type} is in COIN_TYPES')
-    if TelosMixin.chain_type not in dict(settings.COIN_TYPES):
-        log.debug(f'{TelosMixin.chain_type} not in COIN_TYPES, adding it.')
-        settings.COIN_TYPES += ((TelosMixin.chain_type, 'Telos Token',),)
+    # Add the Telos coin type to the admin drop down (if it isn't already)
+    register_coin_type(TelosMixin.chain_type, 'Telos Token')
     
-    # Grab a simple list of coin symbols with the type 'bitcoind' to populate the provides lists.
-    provides = Coin.objects.filter(enabled=True, coin_type=TelosMixin.chain_type).values_list('symbol', flat=True)
+    provides = LazyProvides(TelosMixin.chain_type)
     TelosLoader.provides = provides
     TelosManager.provides = provides
 
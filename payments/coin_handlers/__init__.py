@@ -41,7 +41,7 @@ For handling automatic retry when something goes wrong, you can use the decorato
 
 Example `__init__.py`:
 
->>> from django.conf import settings
+>>> from payments.coin_handlers.base import register_coin_type
 >>> from payments.coin_handlers.SteemEngine.SteemEngineLoader import SteemEngineLoader
 >>> from payments.coin_handlers.SteemEngine.SteemEngineManager import SteemEngineManager
 >>>
@@ -49,8 +49,7 @@ Example `__init__.py`:
 >>>
 >>> def reload():
 >>>     global loaded
->>>     if 'steemengine' not in dict(settings.COIN_TYPES):
->>>         settings.COIN_TYPES += (('steemengine', 'SteemEngine Token',),)
+>>>     register_coin_type('steemengine', 'SteemEngine Token')
 >>>     loaded = True
 >>>
 >>> if not loaded:
@@ -74,7 +73,9 @@ from importlib import import_module
 from django.conf import settings
 from django.db.migrations.executor import MigrationExecutor
 from django.db import connections, DEFAULT_DB_ALIAS
-from payments.coin_handlers.base import BaseLoader, BaseManager
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from payments.coin_handlers.base import BaseLoader, BaseManager, register_coin_type
 from privex import coin_handlers as ch
 
 from payments.coin_handlers.extras import EncryptedKeyStore
@@ -224,9 +225,7 @@ def init_privex_handler(name: str):
     
     # Inject the handler type + description into settings.COIN_TYPE if it's not already there, so it can be used
     # in the admin panel and other areas.
-    if ctype not in dict(settings.COIN_TYPES):
-        log.debug('(Privex) %s not in COIN_TYPES, adding it.', ctype)
-        settings.COIN_TYPES += ((ctype, cdesc,),)
+    register_coin_type(ctype, cdesc)
     
     # Find any coins which are already configured to use this handler, then register the Privex coin handler with
     # the global handler storage
@@ -308,3 +307,13 @@ def reload_handlers():
         for l in hdic.get('managers', []):
             log.debug('Symbol %s - Manager: %s', sym, type(l).__name__)
     log.debug('--- End of reload_handlers() ---')
+
+
+@receiver(post_delete, sender='payments.Coin')
+def _coin_deleted(sender, instance, **kwargs):
+    """
+    :meth:`payments.models.Coin.save` reloads the handlers, but deleting a coin doesn't call ``save()``, so we reload
+    them here too - otherwise the deleted coin would stay in it's handler's ``provides``.
+    """
+    if handlers_loaded:
+        reload_handlers()
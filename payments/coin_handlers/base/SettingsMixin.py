@@ -20,6 +20,7 @@ from typing import Dict, Any
 
 from django.conf import settings
 
+from payments.coin_handlers.base.exceptions import TokenNotFound
 from payments.models import Coin
 from steemengine.helpers import empty
 
@@ -74,6 +75,29 @@ class SettingsMixin:
             return {self.coin.symbol_id: self.coin}
         raise Exception('Cannot load settings as neither self.coin nor self.coins exists...')
 
+    def _get_coin(self, symbol: str = None) -> Coin:
+        """
+        Returns our :class:`.Coin` for the symbol_id ``symbol``, or if it's not specified, our primary coin - the
+        first coin of a loader, or the manager's coin. Used to pick the coin whose settings an RPC connection uses.
+
+        Unlike :py:attr:`.all_coins`, this doesn't copy a loader's coins into a new dict just to look up one of them.
+
+        :param str symbol:     (optional) The symbol_id of the coin to return. Ignored by managers, as they only
+                               have one coin.
+        :raises TokenNotFound: We don't have a coin for ``symbol``, or don't have any coins at all
+        :return Coin coin:     The matching :class:`.Coin`
+        """
+        coins = getattr(self, 'coins', None)
+        if not empty(coins, itr=True):
+            if symbol is None:
+                return next(iter(coins.values()))
+            if symbol in coins:
+                return coins[symbol]
+            raise TokenNotFound(f'{type(self).__name__} does not handle the coin {symbol}')
+        if hasattr(self, 'coin'):
+            return self.coin
+        raise TokenNotFound(f'{type(self).__name__} has no coins, cannot pick the settings to connect with')
+
     @property
     def settings(self) -> Dict[str, dict]:
         """
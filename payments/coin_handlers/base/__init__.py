@@ -2,6 +2,8 @@ from payments.coin_handlers.base.BaseLoader import BaseLoader
 from payments.coin_handlers.base.BaseManager import BaseManager
 from payments.coin_handlers.base.SettingsMixin import SettingsMixin
 from payments.coin_handlers.base.decorators import retry_on_err
+from payments.coin_handlers.base.descriptors import LazyProvides
+from payments.coin_handlers.base.coin_types import register_coin_type, known_coin_types
 import payments.coin_handlers.base.exceptions
 from payments.coin_handlers.base.exceptions import *
 
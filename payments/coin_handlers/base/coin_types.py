@@ -0,0 +1,69 @@
+"""
+Helpers for registering coin handler types into ``settings.COIN_TYPES``
+
+**Copyright**::
+
+    +===================================================+
+    |                 © 2019 Privex Inc.                |
+    |               https://www.privex.io               |
+    +===================================================+
+    |                                                   |
+    |        CryptoToken Converter                      |
+    |                                                   |
+    |        Core Developer(s):                         |
+    |                                                   |
+    |          (+)  Chris (@someguy123) [Privex]        |
+    |                                                   |
+    +===================================================+
+
+"""
+import logging
+from typing import Set
+
+from django.conf import settings
+
+log = logging.getLogger(__name__)
+
+_known_types = set()  # type: Set[str]
+_known_source = None
+"""The ``settings.COIN_TYPES`` tuple which ``_known_types`` was built from"""
+
+
+def known_coin_types() -> Set[str]:
+    """
+    Returns the set of coin type IDs (e.g. ``{'bitcoind', 'eos'}``) currently in ``settings.COIN_TYPES``.
+
+    The set is only rebuilt when ``settings.COIN_TYPES`` has been replaced (as ``+=`` on a tuple creates a new
+    tuple), so checking whether a type is registered doesn't scan the whole tuple every time.
+
+        >>> if 'eos' in known_coin_types():
+        ...     print('EOS is a valid coin type')
+
+    :return set coin_types: A set of coin type ID strings
+    """
+    global _known_types, _known_source
+    if _known_source is not settings.COIN_TYPES:
+        _known_types = {ctype for ctype, _ in settings.COIN_TYPES}
+        _known_source = settings.COIN_TYPES
+    return _known_types
+
+
+def register_coin_type(coin_type: str, description: str) -> bool:
+    """
+    Add the coin type ``coin_type`` to ``settings.COIN_TYPES`` (used for the admin drop down), if it isn't
+    already there. Intended to be called from a coin handler's ``reload()`` function:
+
+        >>> register_coin_type('bitcoind', 'Bitcoind RPC compatible crypto')
+
+    :param str coin_type:   The coin type ID, as stored in :py:attr:`payments.models.Coin.coin_type`
+    :param str description: A human readable description of the coin type
+    :return bool added:     ``True`` if the type was added, ``False`` if it was already registered
+    """
+    global _known_source
+    if coin_type in known_coin_types():
+        return False
+    log.debug('%s not in COIN_TYPES, adding it.', coin_type)
+    settings.COIN_TYPES += ((coin_type, description,),)
+    _known_types.add(coin_type)
+    _known_source = settings.COIN_TYPES
+    return True
@@ -0,0 +1,46 @@
+import logging
+from typing import Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+
+class LazyProvides:
+    """
+    A descriptor for the ``provides`` attribute of a coin handler's Loader / Manager classes, which lists the symbols
+    of every enabled :class:`payments.models.Coin` with the given ``coin_type``.
+
+    Unlike querying the database inside of a handler's ``reload()`` function, the query is only ran the first time
+    ``provides`` is actually read, and the result is then kept as a tuple. This means merely importing a handler
+    module (e.g. during migrations, or in a process which never uses that handler) doesn't touch the database.
+
+    The symbols are never refreshed in place. Instead, saving or deleting a :class:`payments.models.Coin` calls
+    :func:`payments.coin_handlers.reload_handlers`, which runs each handler's ``reload()`` and thus replaces the
+    descriptor with a fresh one.
+
+    Usage (in a handler's ``__init__.py``):
+
+        >>> def reload():
+        ...     provides = LazyProvides('bitcoind')   # A fresh descriptor discards any previously loaded symbols
+        ...     BitcoinLoader.provides = provides
+        ...     BitcoinManager.provides = provides
+        >>> BitcoinLoader.provides
+        ('BTC', 'LTC')
+
+    :param str coin_type:     The ``coin_type`` of the coins to provide, e.g. ``bitcoind``
+    :param bool enabled_only: (Default: ``True``) If ``False``, also provide for coins which are disabled
+    """
+
+    def __init__(self, coin_type: str, enabled_only: bool = True):
+        self.coin_type = coin_type
+        self.enabled_only = enabled_only
+        self.symbols = None  # type: Optional[Tuple[str, ...]]
+
+    def __get__(self, obj, owner) -> Tuple[str, ...]:
+        if self.symbols is None:
+            from payments.models import Coin
+            log.debug('Loading symbols provided for coin type %s', self.coin_type)
+            coins = Coin.objects.filter(coin_type=self.coin_type)
+            if self.enabled_only:
+                coins = coins.filter(enabled=True)
+            self.symbols = tuple(coins.values_list('symbol', flat=True))
+        return self.symbols
@@ -79,7 +79,7 @@ class ConvertCore:
         d = deposit
         # There's a OneToOne relation between a deposit and a conversion
         # If we try to insert a conversion when a deposit already has one, it'll throw an error...
-        if Conversion.objects.filter(deposit=d).count() > 0:
+        if Conversion.objects.filter(deposit=d).exists():
             log.warning('Error: A conversion already exists for deposit "%s". Aborting conversion.', d)
             raise ConvertError(
                 'A Conversion object already exists for this deposit. An admin should investigate the logs, '
@@ -87,7 +87,7 @@ class ConvertCore:
                 'conversion from the DB.'
             )
         # If you're not supposed to be able to convert from this coin, then we can't process it.
-        if d.coin.pairs_from.count() < 1:
+        if not d.coin.pairs_from.exists():
             raise ConvertInvalid('No coin pairs with from_coin = {}'.format(d.coin.symbol))
 
         memo = d.memo.strip() if d.memo is not None else None
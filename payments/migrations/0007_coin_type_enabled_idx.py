@@ -0,0 +1,17 @@
+# Generated by Django 2.1.7 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0006_coin_symbol_id_20190706_1521'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='coin',
+            index=models.Index(fields=['coin_type', 'enabled'], name='coin_type_enabled_idx'),
+        ),
+    ]
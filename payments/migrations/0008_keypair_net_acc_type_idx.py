@@ -0,0 +1,17 @@
+# Generated by Django 2.1.7 on 2026-10-16 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0007_coin_type_enabled_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cryptokeypair',
+            index=models.Index(fields=['network', 'account', 'key_type'], name='keypair_net_acc_type_idx'),
+        ),
+    ]
@@ -160,6 +160,14 @@ class Coin(models.Model):
     def __str__(self):
         return '{} ({})'.format(self.display_name, self.symbol)
 
+    class Meta:
+        """
+        Coin handlers look up their coins by ``coin_type`` (and ``enabled``) every time they're reloaded.
+        """
+        indexes = [
+            models.Index(fields=['coin_type', 'enabled'], name='coin_type_enabled_idx'),
+        ]
+
 
 class CryptoKeyPair(models.Model):
     """
@@ -199,6 +207,15 @@ class CryptoKeyPair(models.Model):
 
         return super(CryptoKeyPair, self).save(*args, **kwargs)
 
+    class Meta:
+        """
+        Coin handlers look up private keys by network + account + key type, e.g. the ``active`` key for a Bitshares
+        account, so we index those fields together.
+        """
+        indexes = [
+            models.Index(fields=['network', 'account', 'key_type'], name='keypair_net_acc_type_idx'),
+        ]
+
 
 class CoinPair(models.Model):
     """
@@ -1,3 +1,171 @@
-from django.test import TestCase
+import struct
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from payments.coin_handlers.EOS.EOSManager import EOSManager
+from payments.coin_handlers.EOS.abi import AbiSerializer, UnsupportedAbiType, name_to_bin, varuint32
+
+TOKEN_ABI = {
+    'version': 'eosio::abi/1.0',
+    'types': [{'new_type_name': 'account_name', 'type': 'name'}],
+    'structs': [
+        {
+            'name': 'transfer', 'base': '',
+            'fields': [
+                {'name': 'from', 'type': 'account_name'},
+                {'name': 'to', 'type': 'account_name'},
+                {'name': 'quantity', 'type': 'asset'},
+                {'name': 'memo', 'type': 'string'},
+            ]
+        },
+    ],
+    'actions': [{'name': 'transfer', 'type': 'transfer', 'ricardian_contract': ''}],
+}
+"""An excerpt of the ``eosio.token`` ABI, using the ``account_name`` alias like older versions of the contract"""
+
+# Encoded forms of the values used below, as returned by ``abi_json_to_bin``
+EOSIO = '0000000000ea3055'
+EOSIO_TOKEN = '00a6823403ea3055'
+EOS_4 = '04454f5300000000'     # symbol 4,EOS
+
+
+def transfer(quantity, memo='hi', frm='eosio', to='eosio.token'):
+    return {'from': frm, 'to': to, 'quantity': quantity, 'memo': memo}
+
+
+class EOSAbiSerializerTest(SimpleTestCase):
+    """Compares :class:`.AbiSerializer` against hex produced by an EOS node's ``abi_json_to_bin``"""
+
+    def setUp(self):
+        self.s = AbiSerializer(TOKEN_ABI)
+
+    def test_name(self):
+        self.assertEqual(struct.unpack('<Q', name_to_bin('eosio.token'))[0], 6138663591592764928)
+        self.assertEqual(name_to_bin('eosio').hex(), EOSIO)
+        self.assertRaises(ValueError, name_to_bin, 'Invalid_Name')
+        self.assertRaises(ValueError, name_to_bin, 'waytoolongname')
+
+    def test_varuint32(self):
+        self.assertEqual(varuint32(0).hex(), '00')
+        self.assertEqual(varuint32(127).hex(), '7f')
+        self.assertEqual(varuint32(128).hex(), '8001')
+        self.assertEqual(varuint32(300).hex(), 'ac02')
+
+    def test_transfer(self):
+        self.assertEqual(
+            self.s.action_to_bin('transfer', transfer('1.0000 EOS')),
+            EOSIO + EOSIO_TOKEN + '1027000000000000' + EOS_4 + '026869'
+        )
+
+    def test_transfer_negative_asset(self):
+        self.assertEqual(
+            self.s.action_to_bin('transfer', transfer('-1.0000 EOS')),
+            EOSIO + EOSIO_TOKEN + 'f0d8ffffffffffff' + EOS_4 + '026869'
+        )
+        self.assertEqual(
+            self.s.action_to_bin('transfer', transfer('-0.5000 EOS')),
+            EOSIO + EOSIO_TOKEN + '78ecffffffffffff' + EOS_4 + '026869'
+        )
+
+    def test_transfer_zero_decimal_asset(self):
+        self.assertEqual(
+            self.s.action_to_bin('transfer', transfer('25 ABC')),
+            EOSIO + EOSIO_TOKEN + '1900000000000000' + '0041424300000000' + '026869'
+        )
+
+    def test_transfer_utf8_memo(self):
+        # the length prefix counts bytes, not characters - 'héllo ✓' is 7 characters, but 10 bytes
+        self.assertEqual(
+            self.s.action_to_bin('transfer', transfer('1.0000 EOS', memo='héllo ✓')),
+            EOSIO + EOSIO_TOKEN + '1027000000000000' + EOS_4 + '0a68c3a96c6c6f20e29c93'
+        )
+
+    def test_transfer_empty_memo(self):
+        self.assertEqual(
+            self.s.action_to_bin('transfer', transfer('1.0000 EOS', memo='')),
+            EOSIO + EOSIO_TOKEN + '1027000000000000' + EOS_4 + '00'
+        )
+
+    def test_alias_chain(self):
+        abi = {
+            'types': [
+                {'new_type_name': 'payer', 'type': 'account_name'},
+                {'new_type_name': 'account_name', 'type': 'name'},
+            ],
+            'structs': [{'name': 'pay', 'base': '', 'fields': [{'name': 'who', 'type': 'payer'}]}],
+            'actions': [{'name': 'pay', 'type': 'pay'}],
+        }
+        self.assertEqual(AbiSerializer(abi).action_to_bin('pay', {'who': 'eosio'}), EOSIO)
+
+    def test_optional_and_array(self):
+        abi = {
+            'structs': [
+                {'name': 'base', 'base': '', 'fields': [{'name': 'id', 'type': 'uint64'}]},
+                {
+                    'name': 'multi', 'base': 'base',
+                    'fields': [
+                        {'name': 'accounts', 'type': 'name[]'},
+                        {'name': 'note', 'type': 'string?'},
+                        {'name': 'amounts', 'type': 'asset[]'},
+                    ]
+                },
+            ],
+            'actions': [{'name': 'multi', 'type': 'multi'}],
+        }
+        s = AbiSerializer(abi)
+        args = {'id': 1, 'accounts': ['eosio', 'eosio.token'], 'note': None, 'amounts': []}
+        self.assertEqual(s.action_to_bin('multi', args), '0100000000000000' + '02' + EOSIO + EOSIO_TOKEN + '00' + '00')
+        args = {'id': 1, 'accounts': [], 'note': 'hi', 'amounts': ['1.0000 EOS']}
+        self.assertEqual(
+            s.action_to_bin('multi', args), '0100000000000000' + '00' + '01026869' + '01' + '1027000000000000' + EOS_4
+        )
+
+    def test_unsupported_type(self):
+        abi = {
+            'structs': [{'name': 'vote', 'base': '', 'fields': [{'name': 'key', 'type': 'public_key'}]}],
+            'actions': [{'name': 'vote', 'type': 'vote'}],
+        }
+        self.assertRaises(UnsupportedAbiType, AbiSerializer(abi).action_to_bin, 'vote', {'key': 'EOS1111'})
+
+    def test_binary_extension(self):
+        abi = {
+            'structs': [{'name': 'ext', 'base': '', 'fields': [{'name': 'memo', 'type': 'string$'}]}],
+            'actions': [{'name': 'ext', 'type': 'ext'}],
+        }
+        self.assertRaises(UnsupportedAbiType, AbiSerializer(abi).action_to_bin, 'ext', {'memo': ''})
+
+
+class EOSSerializeActionTest(SimpleTestCase):
+    """Tests :py:meth:`.EOSManager.serialize_action` falling back to ``abi_json_to_bin`` when it needs to"""
+
+    def setUp(self):
+        self.mgr = mock.Mock()
+        self.mgr.eos.abi_json_to_bin.return_value = {'binargs': 'deadbeef'}
+
+    def serialize(self, action, args):
+        return EOSManager.serialize_action(self.mgr, 'eosio.token', action, args)
+
+    def test_local(self):
+        self.mgr.get_abi.return_value = TOKEN_ABI
+        self.assertEqual(
+            self.serialize('transfer', transfer('1.0000 EOS')),
+            EOSIO + EOSIO_TOKEN + '1027000000000000' + EOS_4 + '026869'
+        )
+        self.mgr.eos.abi_json_to_bin.assert_not_called()
+
+    def test_fallback_unsupported_type(self):
+        self.mgr.get_abi.return_value = {
+            'structs': [{'name': 'vote', 'base': '', 'fields': [{'name': 'key', 'type': 'public_key'}]}],
+            'actions': [{'name': 'vote', 'type': 'vote'}],
+        }
+        self.assertEqual(self.serialize('vote', {'key': 'EOS1111'}), 'deadbeef')
+        self.mgr.eos.abi_json_to_bin.assert_called_once_with('eosio.token', 'vote', {'key': 'EOS1111'})
+
+    def test_fallback_unknown_action(self):
+        self.mgr.get_abi.return_value = TOKEN_ABI
+        self.assertEqual(self.serialize('issue', {}), 'deadbeef')
+
+    def test_fallback_no_abi(self):
+        self.mgr.get_abi.return_value = None
+        self.assertEqual(self.serialize('transfer', transfer('1.0000 EOS')), 'deadbeef')
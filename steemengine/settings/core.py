@@ -31,6 +31,17 @@ the Django framework, or a third-party extension / application for Django.
 - ``DB_USER`` - What username to connect with? **Default:** ``steemengine``
 - ``DB_PASS`` - What password to connect with? **Default:** no password
 
+**Cache Settings**
+
+- ``CACHE_BACKEND`` - The Django cache backend class to use. **Default:** ``django.core.cache.backends.locmem.LocMemCache``
+
+  The default in-memory cache is per-process. For production with multiple gunicorn workers, we recommend using
+  Redis (``django_redis.cache.RedisCache``), so that cached RPC data such as balances and coin health is shared
+  between all workers.
+
+- ``CACHE_LOCATION`` - Comma separated location(s) for the cache backend, e.g. ``redis://127.0.0.1:6379/1``
+  **Default:** Blank
+
 For more information on this file, see
 https://docs.djangoproject.com/en/2.1/topics/settings/
 
@@ -7,7 +7,8 @@ User specifiable environment variables:
 - ``STEEM_RPC_NODES`` - Comma-separated list of one/more Steem RPC nodes. If not set, will use the default beem nodes.
 
 - ``BITSHARES_RPC_NODE`` - Node to use to connect to Bitshares network if Bitshares coin handler is enabled. If not
-  set, will default to wss://eu.nodes.bitshares.ws
+  set, will default to wss://eu.nodes.bitshares.ws . A websocket node (``wss://`` or ``ws://``) is recommended, as the
+  handler keeps one persistent connection open per process, while ``https://`` nodes need an HTTP request per API call.
 
 - ``EX_FEE`` - Conversion fee taken by us, in percentage (i.e. "1" = 1%) **Default:** 0 (no fee)
 
@@ -81,6 +82,23 @@ SENG_NETWORK = env('SENG_NETWORK', 'steem')
 
 BITSHARES_RPC_NODE = env('BITSHARES_RPC_NODE', 'wss://eu.nodes.bitshares.ws')
 
+#########
+# EOS / Telos Network related settings
+####
+
+EOS_FETCH_CONCURRENCY = int(env('EOS_FETCH_CONCURRENCY', 8))
+"""
+Maximum amount of account history requests the EOS/Telos loaders will send to API nodes in parallel. If you only use
+a single (e.g. rate limited) API provider, you may want to set this to 1 to load each account one after the other.
+"""
+
+EOS_HISTORY_CACHE_TIME = int(env('EOS_HISTORY_CACHE_TIME', 3600))
+"""
+Amount of seconds the EOS/Telos loaders keep each account's v1 action history cached. While it's cached, only actions
+newer than the last one seen are requested from the API node. Use a persistent Django cache backend (e.g. Redis) to
+keep the history between restarts.
+"""
+
 #########
 # General CryptoToken Converter settings
 ####